@@ -0,0 +1,292 @@
+"""
+Figure Builder Benchmark Suite
+Wall time, peak RSS and output size for every figure builder
+
+Usage:
+    python benchmark.py                          # run all cases, print table
+    python benchmark.py -o baseline.json         # save results
+    python benchmark.py --compare baseline.json  # flag regressions (exit 1)
+    python benchmark.py --filter cyberpunk --sizes 0 1
+    python benchmark.py --imports                # enforce import-time budget
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+import numpy as np
+
+# Case name -> (size parameter, sizes). Each case is built by _build_case.
+BENCHMARK_CASES = {
+    'visualization.dimension_probability_surface': ('grid', [50, 100, 200]),
+    'visualization.particle_physics_visualization': ('n_particles', [1000, 10000, 100000]),
+    'visualization.probability_trend_analysis': ('n_time', [1000, 10000, 100000]),
+    'visualization.interactive_3d_plotly': ('n_points', [2000, 20000, 200000]),
+    'visualization.advanced_correlation_matrix': ('n_columns', [8]),
+    'futuristic.neural_network_probability_map': ('layer_width', [20, 60, 200]),
+    'futuristic.quantum_superposition_visualization': ('resolution', [100, 200, 400]),
+    'futuristic.dimensional_matrix_dashboard': ('n_temporal', [1000, 100000, 1000000]),
+    'futuristic.advanced_probability_landscape': ('resolution', [100, 200, 400]),
+    'cyberpunk.neural_probability_matrix': ('layer_width', [50, 150, 500]),
+    'cyberpunk.holographic_dimensions': ('resolution', [100, 200, 400]),
+    'cyberpunk.quantum_field': ('resolution', [30, 50, 80]),
+    'cyberpunk.reality_tracker': ('n_points', [1000, 100000, 1000000]),
+}
+
+# Relative increase over baseline that counts as a regression
+DEFAULT_THRESHOLD = 0.25
+
+# Maximum cold-start import time (seconds, median of runs) per entry module
+IMPORT_BUDGET_S = {
+    'visualization': 0.5,
+    'futuristic_dashboard': 0.5,
+    'cyberpunk_dashboard': 0.5,
+}
+
+
+def _build_case(name, size, seed=0):
+    """Build the figure for one benchmark case"""
+    import simulation_data as sd
+    rng = np.random.default_rng(seed)
+    module, builder = name.split('.', 1)
+
+    if module == 'visualization':
+        from visualization import SimulationVisualizer
+        viz = SimulationVisualizer()
+        if builder == 'dimension_probability_surface':
+            return viz.create_dimension_probability_surface(sd.dimension_probability_surface_data(size, size))
+        if builder == 'particle_physics_visualization':
+            return viz.create_particle_physics_visualization(sd.particle_physics_data(rng, n_particles=size))
+        if builder == 'probability_trend_analysis':
+            return viz.create_probability_trend_analysis(sd.probability_trend_data(rng, n_time=size))
+        if builder == 'interactive_3d_plotly':
+            return viz.create_interactive_3d_plotly(sd.interactive_3d_data(rng, n_points=size))
+        if builder == 'advanced_correlation_matrix':
+            return viz.create_advanced_correlation_matrix(sd.correlation_matrix_data(rng, n_columns=size))
+
+    if module == 'futuristic':
+        from futuristic_dashboard import FuturisticDashboard
+        dash = FuturisticDashboard()
+        if builder == 'neural_network_probability_map':
+            return dash.create_neural_network_probability_map(rng=rng, layers=[size] * 10)
+        if builder == 'quantum_superposition_visualization':
+            return dash.create_quantum_superposition_visualization(sd.quantum_superposition_data(size))
+        if builder == 'dimensional_matrix_dashboard':
+            return dash.create_dimensional_matrix_dashboard(sd.dimensional_matrix_data(rng, n_temporal=size))
+        if builder == 'advanced_probability_landscape':
+            return dash.create_advanced_probability_landscape(sd.probability_landscape_data(rng, size))
+
+    if module == 'cyberpunk':
+        import cyberpunk_dashboard as cd
+        if builder == 'neural_probability_matrix':
+            return cd.create_neural_probability_matrix(rng=rng, layers=[size] * 5)
+        if builder == 'holographic_dimensions':
+            return cd.create_holographic_dimensions(sd.holographic_data(rng, resolution=size))
+        if builder == 'quantum_field':
+            return cd.create_quantum_field(sd.quantum_field_input(size))
+        if builder == 'reality_tracker':
+            return cd.create_reality_tracker(sd.reality_tracker_data(rng, n_points=size))
+
+    raise ValueError(f"Unknown benchmark case '{name}'")
+
+
+def _peak_rss_mb():
+    """Peak resident set size of this process in MB"""
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    return peak / 1e6 if sys.platform == 'darwin' else peak / 1e3
+
+
+def _run_case(name, size, out_dir, dpi):
+    """Run one case in the current (fresh) process and return its metrics"""
+    import matplotlib
+    matplotlib.use('Agg')
+
+    # Import everything up front so import cost is not billed to the builder
+    import visualization, futuristic_dashboard, cyberpunk_dashboard  # noqa: F401
+    baseline_rss = _peak_rss_mb()
+
+    start = time.perf_counter()
+    fig = _build_case(name, size)
+    build_s = time.perf_counter() - start
+
+    is_plotly = hasattr(fig, 'write_html')
+    path = os.path.join(out_dir, f"{name}-{size}.{'html' if is_plotly else 'png'}")
+    start = time.perf_counter()
+    if is_plotly:
+        fig.write_html(path)
+    else:
+        fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    write_s = time.perf_counter() - start
+
+    peak_rss = _peak_rss_mb()
+    return {
+        'case': name,
+        'size': size,
+        'build_s': build_s,
+        'write_s': write_s,
+        'wall_s': build_s + write_s,
+        'peak_rss_mb': peak_rss,
+        'rss_delta_mb': peak_rss - baseline_rss,
+        'file_bytes': os.path.getsize(path),
+    }
+
+
+def run_benchmarks(cases=None, size_indices=None, repeat=1, dpi=300):
+    """Run every selected case in its own process and return result dicts
+
+    Each repetition uses a fresh spawned process so peak RSS is per case.
+    The fastest repetition is reported.
+    """
+    cases = cases or list(BENCHMARK_CASES)
+    results = []
+    ctx = multiprocessing.get_context('spawn')
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        for name in cases:
+            param, sizes = BENCHMARK_CASES[name]
+            if size_indices is not None:
+                sizes = [sizes[i] for i in size_indices if i < len(sizes)]
+            for size in sizes:
+                runs = []
+                for _ in range(repeat):
+                    with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                        runs.append(pool.submit(_run_case, name, size, out_dir, dpi).result())
+                best = min(runs, key=lambda r: r['wall_s'])
+                best['param'] = param
+                best['peak_rss_mb'] = max(r['peak_rss_mb'] for r in runs)
+                results.append(best)
+                print(f"{name:50s} {f'{param}={size}':22s} {best['wall_s']:8.3f}s "
+                      f"{best['peak_rss_mb']:8.1f} MB {best['file_bytes'] / 1e6:8.2f} MB out",
+                      flush=True)
+    return results
+
+
+def environment_info():
+    """Interpreter and library versions recorded alongside results"""
+    import matplotlib
+    import plotly
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np.__version__,
+        'matplotlib': matplotlib.__version__,
+        'plotly': plotly.__version__,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def measure_import_time(module, repeat=5):
+    """Median cold-start import time of module, each run in a fresh interpreter"""
+    code = ("import time; start = time.perf_counter(); "
+            f"import {module}; print(time.perf_counter() - start)")
+    here = os.path.dirname(os.path.abspath(__file__))
+    timings = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', code], cwd=here, check=True,
+                             capture_output=True, text=True).stdout
+        timings.append(float(out.strip().splitlines()[-1]))
+    return statistics.median(timings)
+
+
+def check_import_budget(budget=None, repeat=5):
+    """Measure import times and return {module: (seconds, budget, ok)}"""
+    budget = budget or IMPORT_BUDGET_S
+    report = {}
+    for module, limit in budget.items():
+        elapsed = measure_import_time(module, repeat)
+        report[module] = (elapsed, limit, elapsed <= limit)
+        status = 'ok' if elapsed <= limit else 'OVER BUDGET'
+        print(f"import {module:30s} {elapsed:6.3f}s  (budget {limit:.2f}s)  {status}")
+    return report
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD,
+            metrics=('wall_s', 'peak_rss_mb', 'file_bytes')):
+    """Return regressions of results against a baseline result list
+
+    A regression is any metric that grew by more than threshold (relative)
+    for a (case, size) present in both runs.
+    """
+    base = {(r['case'], r['size']): r for r in baseline}
+    regressions = []
+    for result in results:
+        ref = base.get((result['case'], result['size']))
+        if ref is None:
+            continue
+        for metric in metrics:
+            old, new = ref[metric], result[metric]
+            if old > 0 and (new - old) / old > threshold:
+                regressions.append({
+                    'case': result['case'],
+                    'size': result['size'],
+                    'metric': metric,
+                    'baseline': old,
+                    'current': new,
+                    'change': (new - old) / old,
+                })
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the figure builders')
+    parser.add_argument('--filter', nargs='*', default=None,
+                        help='only run cases containing any of these substrings')
+    parser.add_argument('--sizes', nargs='*', type=int, default=None,
+                        help='size indices to run (default: all)')
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--dpi', type=int, default=300)
+    parser.add_argument('-o', '--output', help='write results as JSON to this file')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='compare against a saved JSON run; exit 1 on regression')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument('--list', action='store_true', help='list cases and exit')
+    parser.add_argument('--imports', action='store_true',
+                        help='check entry-module import times against IMPORT_BUDGET_S; exit 1 if over')
+    args = parser.parse_args(argv)
+
+    if args.imports:
+        report = check_import_budget(repeat=max(args.repeat, 5))
+        return 0 if all(ok for _, _, ok in report.values()) else 1
+
+    if args.list:
+        for name, (param, sizes) in BENCHMARK_CASES.items():
+            print(f"{name:50s} {param}: {sizes}")
+        return 0
+
+    cases = [name for name in BENCHMARK_CASES
+             if not args.filter or any(f in name for f in args.filter)]
+    results = run_benchmarks(cases, args.sizes, args.repeat, args.dpi)
+    report = {'environment': environment_info(), 'results': results}
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for r in regressions:
+                print(f"- {r['case']} [{r['size']}] {r['metric']}: "
+                      f"{r['baseline']:.4g} -> {r['current']:.4g} ({r['change']:+.0%})")
+            return 1
+        print(f"\nNo regressions over {args.threshold:.0%} against {args.compare}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
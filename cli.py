@@ -0,0 +1,291 @@
+"""
+Simulation Visualization Command-Line Driver
+Render any subset of the thirteen figures from all three modules
+
+Usage:
+    python cli.py --list
+    python cli.py                                   # every figure into ./
+    python cli.py quantum_field reality_tracker -o out/ --resolution 80
+    python cli.py --module visualization --format svg --dpi 150 --jobs 4
+    python cli.py --module visualization --quality preview --format png,webp
+    python cli.py probability_landscape --resolution 4096 --tiles .tile_cache
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import simulation_data as sd
+from raster_export import QUALITY_PROFILES, RASTER_FORMATS, VECTOR_FORMATS
+from surface_tiles import SURFACES
+
+MATPLOTLIB_FORMATS = RASTER_FORMATS + VECTOR_FORMATS
+PLOTLY_FORMATS = ('html', 'json')
+
+# Figure name -> (module, builder, default output stem, kind)
+FIGURES = {
+    'dimension_surface': ('visualization', 'create_dimension_probability_surface',
+                          'dimension_probability_surface', 'matplotlib'),
+    'particle_physics': ('visualization', 'create_particle_physics_visualization',
+                         'particle_physics_visualization', 'matplotlib'),
+    'probability_trend': ('visualization', 'create_probability_trend_analysis',
+                          'probability_trend_analysis', 'matplotlib'),
+    'correlation_matrix': ('visualization', 'create_advanced_correlation_matrix',
+                           'advanced_correlation_matrix', 'matplotlib'),
+    'interactive_3d': ('visualization', 'create_interactive_3d_plotly',
+                       'interactive_3d_visualization', 'plotly'),
+    'neural_network': ('futuristic_dashboard', 'create_neural_network_probability_map',
+                       'neural_network_dashboard', 'plotly'),
+    'quantum_superposition': ('futuristic_dashboard', 'create_quantum_superposition_visualization',
+                              'quantum_superposition_visualization', 'plotly'),
+    'dimensional_matrix': ('futuristic_dashboard', 'create_dimensional_matrix_dashboard',
+                           'dimensional_matrix_dashboard', 'plotly'),
+    'probability_landscape': ('futuristic_dashboard', 'create_advanced_probability_landscape',
+                              'advanced_probability_landscape', 'plotly'),
+    'cyberpunk_neural_matrix': ('cyberpunk_dashboard', 'create_neural_probability_matrix',
+                                'cyberpunk_neural_matrix', 'plotly'),
+    'holographic_dimensions': ('cyberpunk_dashboard', 'create_holographic_dimensions',
+                               'holographic_dimensions', 'plotly'),
+    'quantum_field': ('cyberpunk_dashboard', 'create_quantum_field',
+                      'quantum_simulation_field', 'plotly'),
+    'reality_tracker': ('cyberpunk_dashboard', 'create_reality_tracker',
+                        'reality_signature_tracker', 'plotly'),
+}
+
+# Modules whose builders are methods of a dashboard class
+BUILDER_CLASSES = {
+    'visualization': 'SimulationVisualizer',
+    'futuristic_dashboard': 'FuturisticDashboard',
+}
+
+# Figures whose grid resolution can be overridden with --resolution
+RESOLUTION_DATA = {
+    'dimension_surface': lambda rng, n: sd.dimension_probability_surface_data(n, n),
+    'probability_trend': lambda rng, n: sd.probability_trend_data(rng, sensitivity_size=n),
+    'quantum_superposition': lambda rng, n: sd.quantum_superposition_data(n),
+    'probability_landscape': lambda rng, n: sd.probability_landscape_data(rng, n),
+    'holographic_dimensions': lambda rng, n: sd.holographic_data(rng, resolution=n),
+    'quantum_field': lambda rng, n: sd.quantum_field_input(n),
+}
+
+
+# Figures that can be sampled from a surface tile pyramid with --tiles
+TILED_FIGURES = tuple(SURFACES)
+
+
+def _builder_owner(name):
+    """Return (owner, attribute) where owner is the builder's class or module"""
+    module_name, attr, _, _ = FIGURES[name]
+    module = importlib.import_module(module_name)
+    cls = BUILDER_CLASSES.get(module_name)
+    return (getattr(module, cls) if cls else module), attr
+
+
+def _builder(name, quality=None):
+    """Resolve a figure name to its callable builder"""
+    owner, attr = _builder_owner(name)
+    if owner.__name__ == 'SimulationVisualizer':
+        owner = owner(quality)
+    elif isinstance(owner, type):
+        owner = owner()
+    return getattr(owner, attr)
+
+
+def figure_seed(name, seed):
+    """Seed of one figure for a base seed: seed plus the figure's index in FIGURES
+
+    A figure gets the same seed (and render cache key) whichever other
+    figures are rendered with it, and the render service uses it too.
+    """
+    return None if seed is None else seed + list(FIGURES).index(name)
+
+
+def output_paths(name, output_dir, formats):
+    """Output files for a figure in each applicable format
+
+    Formats the figure's library cannot write are skipped; if none apply
+    the native format (png / html) is used.
+    """
+    _, _, stem, kind = FIGURES[name]
+    native = MATPLOTLIB_FORMATS if kind == 'matplotlib' else PLOTLY_FORMATS
+    exts = [fmt for fmt in formats if fmt in native] or [native[0]]
+    return [os.path.join(output_dir, f'{stem}.{ext}') for ext in exts]
+
+
+def _init_worker():
+    """Render with the non-interactive Agg backend in pool workers"""
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def _tiled_data(name, rng, resolution, tiles, seed):
+    """Whole-domain data for a tiled surface, served from the pyramid in tiles
+
+    The grid is resolution x resolution (default 100), like the untiled
+    figure: the coarsest pyramid level with at least that many samples is
+    bilinearly resampled to it.
+    """
+    from surface_tiles import SurfacePyramid
+    resolution = resolution or 100
+    pyramid = SurfacePyramid(name, max_resolution=resolution, cache_dir=tiles, seed=seed or 0)
+    return pyramid.view_data(max_samples=resolution, samples=resolution, rng=rng)
+
+
+def render_figure(name, paths, quality=None, dpi=None, resolution=None, seed=None,
+                  compact_html=False, tiles=None):
+    """Build one figure, write it to paths and return (name, paths, seconds)
+
+    With a tiles directory, tiled surfaces (surface_tiles.SURFACES) are
+    sampled from a disk-cached tile pyramid instead of a fresh grid.
+    """
+    start = time.perf_counter()
+    rng = sd.make_rng(seed=seed)
+
+    builder = _builder(name, quality)
+    if tiles is not None and name in TILED_FIGURES:
+        fig = builder(data=_tiled_data(name, rng, resolution, tiles, seed))
+    elif resolution is not None and name in RESOLUTION_DATA:
+        fig = builder(data=RESOLUTION_DATA[name](rng, resolution))
+    else:
+        fig = builder(rng=rng)
+
+    if FIGURES[name][3] == 'matplotlib':
+        from raster_export import save_figure
+        stem = os.path.splitext(paths[0])[0]
+        formats = [os.path.splitext(path)[1].lstrip('.') for path in paths]
+        save_figure(fig, stem, formats, quality, dpi)
+    else:
+        from html_export import write_html
+        for path in paths:
+            if path.endswith('.json'):
+                fig.write_json(path)
+            else:
+                write_html(fig, path, compact=compact_html)
+
+    return name, paths, time.perf_counter() - start
+
+
+def render_figures(names, output_dir='.', formats=('png',), quality=None, dpi=None,
+                   resolution=None, seed=None, jobs=1, cache=None, compact_html=False,
+                   tiles=None):
+    """Render the named figures, optionally concurrently and through a RenderCache
+
+    quality is a raster_export.QUALITY_PROFILES name; dpi overrides its DPI.
+    Each figure is seeded with figure_seed(name, seed); unseeded runs are
+    random and never cached. tiles is a tile cache directory for the tiled
+    surfaces.
+    Returns a list of (name, paths, seconds) in the order of names; cached
+    figures report None seconds.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    paths = {name: output_paths(name, output_dir, formats) for name in names}
+
+    tasks, keys = [], {}
+    for name in names:
+        seed_for = figure_seed(name, seed)
+        if cache is not None and seed_for is not None:
+            owner, attr = _builder_owner(name)
+            keys[name] = cache.key(getattr(owner, attr), seed=seed_for, quality=quality,
+                                   dpi=dpi, resolution=resolution,
+                                   formats=[os.path.basename(p) for p in paths[name]],
+                                   compact=compact_html,
+                                   tiles=tiles is not None and name in TILED_FIGURES)
+            if cache.fetch(keys[name], *paths[name]):
+                if compact_html:
+                    from html_export import restore_assets
+                    restore_assets(*paths[name])
+                continue
+        tasks.append((name, paths[name], quality, dpi, resolution, seed_for, compact_html,
+                      tiles))
+
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(tasks) or 1))
+    if jobs == 1:
+        _init_worker()
+        rendered = [render_figure(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+            rendered = list(pool.map(render_figure, *zip(*tasks)))
+
+    for name, written, _ in rendered:
+        if name in keys:
+            cache.store(keys[name], *written)
+
+    elapsed = {name: seconds for name, _, seconds in rendered}
+    return [(name, paths[name], elapsed.get(name)) for name in names]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Render simulation hypothesis visualizations')
+    parser.add_argument('figures', nargs='*', metavar='FIGURE',
+                        help='figure names to render (default: all; see --list)')
+    parser.add_argument('--list', action='store_true', help='list figure names and exit')
+    parser.add_argument('--module', choices=['visualization', 'futuristic_dashboard',
+                                             'cyberpunk_dashboard'],
+                        help='render every figure from one module')
+    parser.add_argument('-o', '--output-dir', default='.', help='output directory')
+    parser.add_argument('-f', '--format', default='png',
+                        help='comma-separated output formats from '
+                             f"{', '.join(MATPLOTLIB_FORMATS + PLOTLY_FORMATS)}; each figure "
+                             'is written in those it supports, else its native format '
+                             '(png / html)')
+    parser.add_argument('--quality', choices=list(QUALITY_PROFILES), default='print',
+                        help='matplotlib quality profile (DPI, surface sampling, antialiasing)')
+    parser.add_argument('--dpi', type=int, default=None,
+                        help="override the quality profile's DPI")
+    parser.add_argument('--resolution', type=int, default=None,
+                        help='grid resolution for surface/field figures')
+    parser.add_argument('--seed', type=int, default=None, help='base random seed; each figure adds its index in --list')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='concurrent render processes (0 = one per CPU)')
+    parser.add_argument('--cache', metavar='DIR', default=None,
+                        help='serve unchanged figures from a render cache in DIR')
+    parser.add_argument('--tiles', metavar='DIR', default=None,
+                        help='sample the surface figures from a tile pyramid cached in DIR '
+                             '(fast repeated renders at high --resolution)')
+    parser.add_argument('--compact-html', action='store_true',
+                        help='write HTML against a shared plotly.min.js')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (module_name, attr, stem, kind) in FIGURES.items():
+            res = '  [--resolution]' if name in RESOLUTION_DATA else ''
+            res += '  [--tiles]' if name in TILED_FIGURES else ''
+            print(f"{name:25s} {kind:10s} {module_name}.{attr}{res}")
+        return 0
+
+    names = list(args.figures)
+    if args.module:
+        names += [n for n, spec in FIGURES.items() if spec[0] == args.module and n not in names]
+    if not names:
+        names = list(FIGURES)
+    unknown = [n for n in names if n not in FIGURES]
+    if unknown:
+        parser.error(f"unknown figure(s): {', '.join(unknown)} (see --list)")
+    formats = [fmt.strip() for fmt in args.format.split(',') if fmt.strip()]
+    bad = [fmt for fmt in formats if fmt not in MATPLOTLIB_FORMATS + PLOTLY_FORMATS]
+    if bad or not formats:
+        parser.error(f"unsupported format(s): {', '.join(bad) or args.format!r}")
+
+    cache = None
+    if args.cache:
+        from render_cache import RenderCache
+        cache = RenderCache(args.cache)
+
+    start = time.perf_counter()
+    results = render_figures(names, args.output_dir, formats, args.quality, args.dpi,
+                             args.resolution, args.seed, args.jobs or None,
+                             cache, args.compact_html, args.tiles)
+    print(f"Rendered {len(results)} figure(s) in {time.perf_counter() - start:.2f}s:")
+    for name, paths, seconds in results:
+        print(f"- {', '.join(paths)} ({'cached' if seconds is None else f'{seconds:.2f}s'})")
+    if cache is not None:
+        cache.report()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""
+Streaming Correlation
+One-pass, chunked correlation matrices for long and wide datasets
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# Upper bound on one float64 chunk (rows x columns) held in memory
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+def chunk_moments(block):
+    """(count, column means, co-moment matrix) of one (rows, columns) block
+
+    Rows containing NaN are skipped (complete-case analysis).
+    """
+    block = np.asarray(block, dtype=np.float64)
+    if block.ndim == 1:
+        block = block[:, None]
+    block = block[~np.isnan(block).any(axis=1)]
+    if len(block) == 0:
+        k = block.shape[1]
+        return 0, np.zeros(k), np.zeros((k, k))
+    mean = block.mean(axis=0)
+    centred = block - mean
+    return len(block), mean, centred.T @ centred
+
+
+class CorrelationAccumulator:
+    """Running means and cross-products from which covariance/correlation follow
+
+    Memory is O(columns^2) however many rows are seen. Each chunk is reduced
+    to its count, mean and centred co-moment matrix, and summaries are
+    combined with the pairwise update of Chan et al., which is exact and
+    numerically stable. Accumulators over disjoint rows can be merged in any
+    grouping, so chunks can be reduced in parallel.
+    """
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        k = len(self.columns)
+        self.count = 0
+        self.mean = np.zeros(k)
+        self.comoment = np.zeros((k, k))
+
+    def merge_moments(self, count, mean, comoment):
+        """Fold in another (count, mean, co-moment) summary"""
+        if count == 0:
+            return self
+        total = self.count + count
+        delta = mean - self.mean
+        self.comoment = self.comoment + comoment + np.outer(delta, delta) * (self.count * count / total)
+        self.mean = self.mean + delta * (count / total)
+        self.count = total
+        return self
+
+    def merge(self, other):
+        """Fold in an accumulator over other rows with the same columns"""
+        return self.merge_moments(other.count, other.mean, other.comoment)
+
+    def update(self, block):
+        """Fold in a (rows, columns) block of observations"""
+        return self.merge_moments(*chunk_moments(block))
+
+    def covariance(self, ddof=1):
+        return self.comoment / max(self.count - ddof, 1)
+
+    def correlation(self):
+        """Pearson correlation matrix (NaN for constant columns)"""
+        std = np.sqrt(np.diag(self.comoment))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            corr = self.comoment / np.outer(std, std)
+        np.fill_diagonal(corr, 1.0)
+        return np.clip(corr, -1.0, 1.0)
+
+
+def chunk_rows_for(n_columns, max_chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Rows per chunk so one float64 chunk stays within max_chunk_bytes"""
+    return max(1, max_chunk_bytes // (8 * max(n_columns, 1)))
+
+
+def streaming_correlation(blocks, columns, jobs=1, prepare=None, max_pending=None):
+    """Accumulate correlation statistics over an iterable of (rows, columns) blocks
+
+    prepare, if given, turns each item of blocks into such a block inside
+    the worker (e.g. stacking and filtering lazily read columns). With
+    jobs > 1 (None: one per CPU) items are reduced to partial moments in a
+    thread pool; the heavy work (copying, centring and the BLAS
+    cross-product) releases the GIL. At most max_pending items (default
+    2 x jobs) are in flight, so memory stays bounded for arbitrarily long
+    streams. Partial results are merged in stream order, so the result does
+    not depend on jobs.
+    """
+    acc = CorrelationAccumulator(columns)
+    reduce_block = chunk_moments if prepare is None else (lambda item: chunk_moments(prepare(item)))
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if jobs == 1:
+        for item in blocks:
+            acc.merge_moments(*reduce_block(item))
+        return acc
+
+    max_pending = max_pending or 2 * jobs
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for item in blocks:
+            pending.append(pool.submit(reduce_block, item))
+            if len(pending) >= max_pending:
+                acc.merge_moments(*pending.popleft().result())
+        while pending:
+            acc.merge_moments(*pending.popleft().result())
+    return acc
+
+
+def source_correlation(source, columns=None, jobs=1, where=None,
+                       max_chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Exact correlation of columns over every (filtered) row of a data source
+
+    source is a data_sources source; rows are streamed in chunks of at most
+    max_chunk_bytes, optionally filtered by where(chunk) -> boolean mask.
+    """
+    columns = list(columns or source.columns)
+    read_columns = source.columns if where is not None else columns
+    chunk_rows = chunk_rows_for(len(read_columns), max_chunk_bytes)
+
+    def prepare(chunk):
+        block = np.column_stack([chunk[name] for name in columns])
+        if where is not None:
+            block = block[np.asarray(where(chunk), dtype=bool)]
+        return block
+
+    chunks = (chunk for _, chunk in source.iter_chunks(read_columns, chunk_rows))
+    return streaming_correlation(chunks, columns, jobs, prepare)
@@ -3,94 +3,116 @@ Cyberpunk Simulation Hypothesis Dashboard
 Game-Changing Future-Ready Visualizations
 """
 
+import os
+import tempfile
 import numpy as np
-import pandas as pd
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
-import plotly.express as px
-from scipy.ndimage import gaussian_filter
-import colorsys
+import simulation_data as sd
+from html_export import restore_assets, write_html
+from decimation import DEFAULT_POINT_BUDGET, series_trace
+from themes import get_theme
 
-def generate_cyberpunk_visualizations():
-    """Create cutting-edge cyberpunk-style visualizations"""
+def generate_cyberpunk_visualizations(cache=None, seed=None, compact_html=False):
+    """Create cutting-edge cyberpunk-style visualizations
     
-    print("Creating Game-Changing Cyberpunk Visualizations...")
-    
-    # 1. Advanced Neural Network Probability Matrix
-    fig1 = create_neural_probability_matrix()
-    fig1.write_html('cyberpunk_neural_matrix.html')
+    If a RenderCache is given and seed is set, unchanged figures are served
+    from it; each entry also holds the figure JSON, which is loaded back so
+    the returned list is always complete. A seed makes every figure
+    reproducible; unseeded runs are random and never cached. compact_html
+    writes against a shared plotly.min.js with compactly encoded arrays.
+    """
     
-    # 2. Holographic Dimensional Visualization  
-    fig2 = create_holographic_dimensions()
-    fig2.write_html('holographic_dimensions.html')
-    
-    # 3. Quantum Simulation Probability Field
-    fig3 = create_quantum_field()
-    fig3.write_html('quantum_simulation_field.html')
+    print("Creating Game-Changing Cyberpunk Visualizations...")
     
-    # 4. Real-time Reality Signature Tracker
-    fig4 = create_reality_tracker()
-    fig4.write_html('reality_signature_tracker.html')
+    figures = [
+        # 1. Advanced Neural Network Probability Matrix
+        (create_neural_probability_matrix, 'cyberpunk_neural_matrix.html'),
+        # 2. Holographic Dimensional Visualization
+        (create_holographic_dimensions, 'holographic_dimensions.html'),
+        # 3. Quantum Simulation Probability Field
+        (create_quantum_field, 'quantum_simulation_field.html'),
+        # 4. Real-time Reality Signature Tracker
+        (create_reality_tracker, 'reality_signature_tracker.html'),
+    ]
+    
+    results = []
+    for i, (builder, filename) in enumerate(figures):
+        figure_seed = None if seed is None else seed + i
+        if cache is None or figure_seed is None:
+            fig = builder(rng=sd.make_rng(seed=figure_seed))
+            write_html(fig, filename, compact=compact_html)
+            results.append(fig)
+            continue
+        
+        json_name = os.path.splitext(os.path.basename(filename))[0] + '.json'
+        key = cache.key(builder, format='html', seed=figure_seed, compact=compact_html)
+        if cache.fetch(key, filename):
+            if compact_html:
+                restore_assets(filename)
+            results.append(pio.read_json(cache.path(key, json_name)))
+            continue
+        
+        fig = builder(rng=sd.make_rng(seed=figure_seed))
+        write_html(fig, filename, compact=compact_html)
+        # The figure JSON lives in the cache entry only, not next to the HTML
+        with tempfile.TemporaryDirectory() as tmp:
+            json_file = os.path.join(tmp, json_name)
+            fig.write_json(json_file)
+            cache.store(key, filename, json_file)
+        results.append(fig)
     
     print("All cyberpunk visualizations created successfully!")
-    return [fig1, fig2, fig3, fig4]
+    if cache is not None:
+        cache.report()
+    return results
 
-def create_neural_probability_matrix():
-    """Create advanced neural network probability matrix with cyberpunk aesthetic"""
-    # Generate complex multi-dimensional neural network structure
-    layers = [50, 60, 70, 60, 50]  # More complex architecture
+def create_neural_probability_matrix(data=None, rng=None, layers=None, theme='cyberpunk'):
+    """Create advanced neural network probability matrix with cyberpunk aesthetic
+    
+    layers overrides the neuron count per layer. Large layers are coloured
+    with a quantised palette from the theme.
+    """
+    theme = get_theme(theme)
+    # Complex multi-dimensional neural network structure
+    if data is None:
+        if layers is None:
+            data = sd.neural_matrix_data(sd.make_rng(rng))
+        else:
+            data = sd.neural_matrix_data(sd.make_rng(rng), layers=layers)
     
     fig = go.Figure()
     
+    # All inter-layer connections as one NaN-separated line trace
+    x0, x1, y0, y1, z0, z1 = np.hstack([layer['edges'] for layer in data])
+    fig.add_trace(go.Scatter3d(
+        x=sd.line_segments(x0, x1),
+        y=sd.line_segments(y0, y1),
+        z=sd.line_segments(z0, z1),
+        mode='lines',
+        line=dict(color=theme.colors['edges'], width=2),
+        showlegend=False,
+        hoverinfo='skip',
+        connectgaps=False
+    ))
+    
     # Create neural clusters with different probabilities
-    for layer_idx, n_neurons in enumerate(layers):
-        theta = np.linspace(0, 2*np.pi, n_neurons, endpoint=False)
-        radius = 2 + layer_idx * 1.5  # Spiral outward
-        
-        x = radius * np.cos(theta) + layer_idx * 3
-        y = radius * np.sin(theta)
-        z = np.random.random(n_neurons)  # Activation probability
-        
-        # Create connections between layers
-        if layer_idx > 0:
-            prev_theta = np.linspace(0, 2*np.pi, layers[layer_idx-1], endpoint=False)
-            prev_radius = 2 + (layer_idx-1) * 1.5
-            prev_x = prev_radius * np.cos(prev_theta) + (layer_idx-1) * 3
-            prev_y = prev_radius * np.sin(prev_theta)
-            
-            # Add random connections with probability
-            for i in range(len(x)):
-                for j in range(len(prev_x)):
-                    if np.random.random() > 0.85:  # Sparse connections
-                        fig.add_trace(go.Scatter3d(
-                            x=[prev_x[j], x[i]],
-                            y=[prev_y[j], y[i]],
-                            z=[np.random.random(), z[i]],
-                            mode='lines',
-                            line=dict(color='rgba(0, 255, 255, 0.2)', width=2),
-                            showlegend=False,
-                            hoverinfo='skip'
-                        ))
+    for layer_idx, layer in enumerate(data):
+        x, y, z = layer['x'], layer['y'], layer['z']
+        n_neurons = len(x)
         
         fig.add_trace(go.Scatter3d(
             x=x, y=y, z=z,
             mode='markers',
             marker=dict(
                 size=8,
-                color=z,
-                colorscale=[
-                    [0, 'rgba(0, 0, 0, 0.8)'],
-                    [0.2, 'rgba(0, 255, 255, 0.8)'],
-                    [0.5, 'rgba(128, 0, 128, 0.8)'],
-                    [0.8, 'rgba(255, 0, 255, 0.9)'],
-                    [1, 'rgba(255, 255, 0, 1)']
-                ],
-                showscale=True,
-                colorbar=dict(title="Activation Probability")
+                **theme.marker_colors('neural', z, colorbar=dict(title="Activation Probability")),
+                showscale=True
             ),
             name=f'Layer {layer_idx}',
             text=[f'Neuron {i}<br>Layer {layer_idx}' for i in range(n_neurons)],
-            hovertemplate='<b>%{text}</b><br>Probability: %{marker.color:.3f}<extra></extra>'
+            hovertemplate='<b>%{text}</b><br>Probability: %{z:.3f}<extra></extra>'
         ))
     
     fig.update_layout(
@@ -98,54 +120,37 @@ def create_neural_probability_matrix():
             'text': "CYBERPUNK NEURAL NETWORK SIMULATION MATRIX<br><sub>Advanced Multi-Dimensional Probability Architecture</sub>",
             'x': 0.5,
             'xanchor': 'center',
-            'font': {'size': 24, 'family': 'Courier New'}
+            'font': {'size': 24, 'family': theme.font_family}
         },
         scene=dict(
             xaxis_title='Network Layer',
             yaxis_title='Neuron Position',
             zaxis_title='Activation',
-            bgcolor='rgba(0,0,0,0.95)',
+            bgcolor=theme.scene_bgcolor,
             camera=dict(
                 eye=dict(x=1.5, y=1.5, z=1.5)
             )
         ),
         width=1200,
         height=800,
-        plot_bgcolor='rgba(0,0,0,0.95)',
-        paper_bgcolor='rgba(0,0,0,0.95)',
-        font=dict(color='rgba(0, 255, 255, 1)', family='Courier New')
+        **theme.layout('primary')
     )
     
     return fig
 
-def create_holographic_dimensions():
+def create_holographic_dimensions(data=None, rng=None, theme='cyberpunk'):
     """Create holographic multi-dimensional visualization"""
-    # Create complex multi-dimensional probability distributions
-    x = np.linspace(-4, 4, 100)
-    y = np.linspace(-4, 4, 100)
-    X, Y = np.meshgrid(x, y)
-    
-    # Complex holographic pattern with multiple waves
-    Z = (np.sin(X*2) * np.cos(Y*2) * np.exp(-(X**2 + Y**2)/8) + 
-         0.5 * np.sin(X*Y) * np.exp(-(X**2 + Y**2)/12) +
-         0.3 * np.cos(np.sqrt(X**2 + Y**2)*3) * np.exp(-(X**2 + Y**2)/10))
-    
-    # Add quantum fluctuations
-    quantum_noise = np.random.random(Z.shape) * 0.1
-    Z = Z + gaussian_filter(quantum_noise, sigma=1)
+    theme = get_theme(theme)
+    # Complex holographic pattern with multiple waves and quantum fluctuations
+    if data is None:
+        data = sd.holographic_data(sd.make_rng(rng))
+    Z = data['Z']
     
     fig = go.Figure(data=go.Contour(
         z=Z,
-        x=x,
-        y=y,
-        colorscale=[
-            [0, 'rgba(0, 0, 50, 0.8)'],
-            [0.2, 'rgba(0, 100, 200, 0.8)'],
-            [0.4, 'rgba(0, 200, 255, 0.9)'],
-            [0.6, 'rgba(100, 255, 200, 0.9)'],
-            [0.8, 'rgba(200, 255, 100, 0.9)'],
-            [1, 'rgba(255, 200, 0, 1)']
-        ],
+        x=data['x'],
+        y=data['y'],
+        colorscale=theme.colorscales['holographic'],
         contours=dict(
             start=Z.min(),
             end=Z.max(),
@@ -157,16 +162,14 @@ def create_holographic_dimensions():
     ))
     
     # Add particle traces
-    for i in range(10):
-        particle_x = np.random.uniform(-4, 4, 50)
-        particle_y = np.random.uniform(-4, 4, 50)
+    for i, stream in enumerate(data['streams']):
         fig.add_trace(go.Scatter(
-            x=particle_x,
-            y=particle_y,
+            x=stream['x'],
+            y=stream['y'],
             mode='markers',
             marker=dict(
-                size=np.random.uniform(2, 8, 50),
-                color='rgba(255, 255, 255, 0.7)',
+                size=stream['size'],
+                color=theme.colors['particles'],
                 symbol='diamond'
             ),
             name=f'Particle Stream {i+1}',
@@ -178,64 +181,75 @@ def create_holographic_dimensions():
             'text': "HOLOGRAPHIC DIMENSIONAL REALITY FIELD<br><sub>Advanced Multi-Dimensional Simulation Interface</sub>",
             'x': 0.5,
             'xanchor': 'center',
-            'font': {'size': 24, 'family': 'Courier New'}
+            'font': {'size': 24, 'family': theme.font_family}
         },
         xaxis_title='Dimension X',
         yaxis_title='Dimension Y',
         width=1200,
         height=800,
-        plot_bgcolor='rgba(0,0,0,0.95)',
-        paper_bgcolor='rgba(0,0,0,0.95)',
-        font=dict(color='rgba(0, 200, 255, 1)', family='Courier New')
+        **theme.layout('secondary')
     )
     
     return fig
 
-def create_quantum_field():
-    """Create advanced quantum simulation field"""
-    # Generate quantum field with complex interactions
-    x = np.linspace(-3, 3, 50)
-    y = np.linspace(-3, 3, 50)
-    z = np.linspace(-3, 3, 50)
-    X, Y, Z = np.meshgrid(x, y, z)
-    
-    # Complex quantum field function
-    R = np.sqrt(X**2 + Y**2 + Z**2)
-    field = (np.sin(R*3) * np.exp(-R/2) * 
-             np.cos(X*Y*Z) * (1 + 0.1*np.sin(X*5)*np.sin(Y*5)*np.sin(Z*5)))
-    
-    # Create isosurface visualization
-    fig = go.Figure(data=go.Isosurface(
-        x=X.flatten(),
-        y=Y.flatten(), 
-        z=Z.flatten(),
-        value=field.flatten(),
-        isomin=0.1,
-        isomax=0.5,
-        surface_count=5,
-        colorscale=[
-            [0, 'rgba(0, 0, 100, 0.1)'],
-            [0.5, 'rgba(100, 0, 200, 0.5)'],
-            [1, 'rgba(200, 0, 255, 0.9)']
-        ],
-        showscale=True,
-        caps=dict(x_show=False, y_show=False, z_show=False)
-    ))
+def create_quantum_field(data=None, rng=None, resolution=50, mode=None, theme='cyberpunk'):
+    """Create advanced quantum simulation field
+    
+    mode='isosurface' sends the float32 volume to a Plotly Isosurface, which
+    stays restylable in the browser but grows with resolution^3 (24 MB of
+    compact HTML at 100). mode='mesh' extracts the isosurfaces server-side
+    with chunked marching cubes and sends only the triangles as a Mesh3d
+    (8.6 MB at 100), at the cost of that extraction and of fixed levels.
+    The default picks mesh from sd.MESH_MIN_RESOLUTION up, where it is the
+    smaller of the two (see sd.quantum_field_input).
+    """
+    theme = get_theme(theme)
+    colorscale = theme.colorscales['quantum']
+    
+    # Quantum field with complex interactions
+    if data is None:
+        data = sd.quantum_field_input(resolution, mode)
+    
+    if 'faces' in data:
+        # Pre-extracted isosurface triangles
+        verts, faces = data['vertices'], data['faces']
+        fig = go.Figure(data=go.Mesh3d(
+            x=verts[:, 0], y=verts[:, 1], z=verts[:, 2],
+            i=faces[:, 0], j=faces[:, 1], k=faces[:, 2],
+            intensity=data['intensity'],
+            cmin=0.1,
+            cmax=0.5,
+            colorscale=colorscale,
+            opacity=0.5,
+            showscale=True,
+            hoverinfo='skip'
+        ))
+    else:
+        # Create isosurface visualization
+        axis, field = data['axis'], data['field']
+        n = len(axis)
+        fig = go.Figure(data=go.Isosurface(
+            x=np.broadcast_to(axis[:, None, None], (n, n, n)).ravel(),
+            y=np.broadcast_to(axis[None, :, None], (n, n, n)).ravel(),
+            z=np.broadcast_to(axis[None, None, :], (n, n, n)).ravel(),
+            value=field.ravel(),
+            isomin=0.1,
+            isomax=0.5,
+            surface_count=5,
+            colorscale=colorscale,
+            showscale=True,
+            caps=dict(x_show=False, y_show=False, z_show=False)
+        ))
     
     # Add quantum particle traces
-    for i in range(5):
-        t = np.linspace(0, 10, 100)
-        px = 1.5 * np.sin(t + i) * np.exp(-t/10)
-        py = 1.5 * np.cos(t + i) * np.exp(-t/10) 
-        pz = 1.5 * np.sin(2*t + i) * np.exp(-t/10)
-        
+    for i, path in enumerate(data['paths']):
         fig.add_trace(go.Scatter3d(
-            x=px, y=py, z=pz,
+            x=path['x'], y=path['y'], z=path['z'],
             mode='markers+lines',
             marker=dict(
                 size=4,
-                color=np.sin(t),
-                colorscale='Plasma'
+                color=path['color'],
+                colorscale=theme.colorscales['paths']
             ),
             line=dict(width=3),
             name=f'Quantum Path {i+1}'
@@ -246,28 +260,37 @@ def create_quantum_field():
             'text': "QUANTUM SIMULATION PROBABILITY FIELD<br><sub>Real-Time Quantum-Classical Interface Visualization</sub>",
             'x': 0.5,
             'xanchor': 'center',
-            'font': {'size': 24, 'family': 'Courier New'}
+            'font': {'size': 24, 'family': theme.font_family}
         },
         scene=dict(
             xaxis_title='X Position',
             yaxis_title='Y Position', 
             zaxis_title='Z Position',
-            bgcolor='rgba(0,0,0,0.95)',
+            bgcolor=theme.scene_bgcolor,
             camera=dict(
                 eye=dict(x=1.8, y=1.8, z=1.2)
             )
         ),
         width=1200,
         height=800,
-        plot_bgcolor='rgba(0,0,0,0.95)',
-        paper_bgcolor='rgba(0,0,0,0.95)',
-        font=dict(color='rgba(100, 200, 255, 1)', family='Courier New')
+        **theme.layout('tertiary')
     )
     
     return fig
 
-def create_reality_tracker():
-    """Create real-time reality signature tracker"""
+def create_reality_tracker(data=None, rng=None, point_budget=DEFAULT_POINT_BUDGET,
+                           downsample='minmax', theme='cyberpunk'):
+    """Create real-time reality signature tracker
+    
+    Series longer than point_budget are decimated with downsample ('minmax',
+    'lttb' or None) and drawn with WebGL. The number of dropped points per
+    series is recorded in fig.layout.meta['dropped_points'].
+    """
+    theme = get_theme(theme)
+    if data is None:
+        data = sd.reality_tracker_data(sd.make_rng(rng))
+    time_points = data['time']
+    
     fig = make_subplots(
         rows=2, cols=2,
         subplot_titles=('Real-Time Probability', 'Dimensional Stability', 'Quantum Coherence', 'Reality Signature'),
@@ -275,70 +298,40 @@ def create_reality_tracker():
                [{"secondary_y": False}, {"secondary_y": True}]]
     )
     
-    # Generate realistic simulation data
-    time_points = np.linspace(0, 100, 1000)
-    
-    # Complex probability signal
-    prob_signal = (0.5 + 
-                   0.2 * np.sin(0.1 * time_points) + 
-                   0.15 * np.cos(0.05 * time_points) + 
-                   0.1 * np.sin(0.3 * time_points) * np.exp(-time_points/100) +
-                   0.05 * np.random.random(1000))
-    
-    # Dimensional stability
-    dim_stability = 0.8 + 0.15 * np.sin(0.08 * time_points) + 0.05 * np.random.random(1000)
-    
-    # Quantum coherence
-    quantum_coh = 0.7 + 0.2 * np.cos(0.06 * time_points) + 0.1 * np.random.random(1000)
-    
-    # Reality signature
-    reality_sig = (0.6 + 
-                  0.25 * np.sin(0.07 * time_points + np.pi/4) + 
-                  0.15 * np.cos(0.12 * time_points) + 
-                  0.1 * np.random.random(1000))
+    # (data key, subplot, trace style)
+    series = [
+        ('prob_signal', dict(row=1, col=1, secondary_y=False),
+         dict(mode='lines', name='Simulation Probability', line=dict(color=theme.colors['probability'], width=3))),
+        ('dim_stability', dict(row=1, col=1, secondary_y=True),
+         dict(mode='lines', name='Dimensional Stability', line=dict(color=theme.colors['stability'], width=3))),
+        ('quantum_coh', dict(row=1, col=2),
+         dict(mode='lines+markers', name='Quantum Coherence',
+              line=dict(color=theme.colors['coherence'], width=2), marker=dict(size=3))),
+        ('reality_sig', dict(row=2, col=1),
+         dict(mode='lines', name='Reality Signature', line=dict(color=theme.colors['signature'], width=3))),
+        ('cumulative_deviation', dict(row=2, col=2, secondary_y=True),
+         dict(mode='lines', name='Cumulative Deviation',
+              line=dict(color=theme.colors['deviation'], width=2, dash='dash'))),
+    ]
     
     # Add traces
-    fig.add_trace(
-        go.Scatter(x=time_points, y=prob_signal, mode='lines', name='Simulation Probability',
-                  line=dict(color='cyan', width=3)),
-        row=1, col=1, secondary_y=False
-    )
-    fig.add_trace(
-        go.Scatter(x=time_points, y=dim_stability, mode='lines', name='Dimensional Stability',
-                  line=dict(color='magenta', width=3)),
-        row=1, col=1, secondary_y=True
-    )
-    
-    fig.add_trace(
-        go.Scatter(x=time_points, y=quantum_coh, mode='lines+markers', name='Quantum Coherence',
-                  line=dict(color='yellow', width=2), marker=dict(size=3)),
-        row=1, col=2
-    )
-    
-    fig.add_trace(
-        go.Scatter(x=time_points, y=reality_sig, mode='lines', name='Reality Signature',
-                  line=dict(color='lime', width=3)),
-        row=2, col=1
-    )
-    
-    fig.add_trace(
-        go.Scatter(x=time_points, y=np.cumsum(prob_signal-0.5), mode='lines', name='Cumulative Deviation',
-                  line=dict(color='red', width=2, dash='dash')),
-        row=2, col=2, secondary_y=True
-    )
+    dropped_points = {}
+    for key, position, style in series:
+        trace, dropped = series_trace(time_points, data[key], point_budget, downsample, **style)
+        fig.add_trace(trace, **position)
+        dropped_points[style['name']] = dropped
     
     fig.update_layout(
         title={
             'text': "REAL-TIME REALITY SIGNATURE TRACKER<br><sub>Advanced Simulation Detection System</sub>",
             'x': 0.5,
             'xanchor': 'center',
-            'font': {'size': 24, 'family': 'Courier New'}
+            'font': {'size': 24, 'family': theme.font_family}
         },
         height=800,
         width=1200,
-        plot_bgcolor='rgba(0,0,0,0.95)',
-        paper_bgcolor='rgba(0,0,0,0.95)',
-        font=dict(color='rgba(0, 255, 255, 1)', family='Courier New')
+        **theme.layout('primary'),
+        meta=dict(dropped_points=dropped_points)
     )
     
     # Update axes
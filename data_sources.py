@@ -0,0 +1,295 @@
+"""
+Out-of-Core Data Sources
+Plot real datasets from memory-mapped arrays and Parquet files
+
+Sources expose named columns that are read lazily: an .npy file or raw
+binary is memory-mapped, and a Parquet file is read row group by row group
+through pyarrow. The sampling helpers pick at most max_points rows by
+stride or reservoir sampling and copy only those rows into memory. The
+builder adapters at the bottom return the same dicts as their
+simulation_data counterparts, so any builder can plot a source:
+
+    source = open_source('particles.npy')
+    fig = viz.create_interactive_3d_plotly(data=interactive_3d_data(source))
+"""
+
+import os
+import numpy as np
+
+# Rows per chunk when streaming a source
+DEFAULT_CHUNK_ROWS = 1_000_000
+
+SAMPLING_METHODS = ('reservoir', 'stride')
+
+
+class ArraySource:
+    """Columns of an .npy file, raw binary file or in-memory array
+
+    Structured arrays use their field names as columns; 2-D arrays take
+    names from columns (default c0, c1, ...). Files are memory-mapped
+    read-only and columns are returned as views, never copied whole.
+    """
+
+    def __init__(self, path=None, columns=None, array=None, dtype=None, shape=None):
+        if array is None:
+            if path.endswith('.npy'):
+                array = np.load(path, mmap_mode='r')
+            else:
+                if dtype is None:
+                    raise ValueError("dtype (and shape) are required for raw binary files")
+                array = np.memmap(path, dtype=dtype, mode='r', shape=shape)
+        self.path = path
+        self.array = array
+
+        if array.dtype.names:
+            self.columns = list(array.dtype.names)
+        else:
+            if array.ndim == 1:
+                array = self.array = array.reshape(-1, 1)
+            self.columns = list(columns) if columns else [f'c{i}' for i in range(array.shape[1])]
+            if len(self.columns) != array.shape[1]:
+                raise ValueError(f"{len(self.columns)} column names for {array.shape[1]} columns")
+
+    def __len__(self):
+        return len(self.array)
+
+    def column(self, name):
+        """Lazy (memory-mapped) view of one column"""
+        if self.array.dtype.names:
+            return self.array[name]
+        return self.array[:, self.columns.index(name)]
+
+    def read(self, columns, rows=None):
+        """Copy the selected rows (slice or sorted indices) of columns into memory"""
+        rows = slice(None) if rows is None else rows
+        return {name: np.asarray(self.column(name)[rows]) for name in columns}
+
+    def iter_chunks(self, columns, chunk_rows=DEFAULT_CHUNK_ROWS):
+        """Yield (first_row, {column: array}) chunks"""
+        for start in range(0, len(self), chunk_rows):
+            yield start, self.read(columns, slice(start, start + chunk_rows))
+
+
+class ParquetSource:
+    """Columns of a Parquet file, read lazily with pyarrow
+
+    Only the requested columns are decoded, and at most one row group (or
+    one batch when streaming) is held in memory at a time.
+    """
+
+    def __init__(self, path):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError("Reading Parquet files requires pyarrow "
+                              "(pip install pyarrow)") from exc
+        self.path = path
+        self._file = pq.ParquetFile(path)
+        self.columns = list(self._file.schema_arrow.names)
+        metadata = self._file.metadata
+        self._group_starts = np.cumsum([0] + [metadata.row_group(i).num_rows
+                                              for i in range(metadata.num_row_groups)])
+
+    def __len__(self):
+        return int(self._group_starts[-1])
+
+    def read(self, columns, rows=None):
+        """Read the selected rows (slice or sorted indices) of columns"""
+        if rows is None:
+            table = self._file.read(columns=columns)
+            return {name: table.column(name).to_numpy() for name in columns}
+
+        rows = np.arange(*rows.indices(len(self))) if isinstance(rows, slice) else np.asarray(rows)
+        groups = np.searchsorted(self._group_starts, rows, side='right') - 1
+        parts = {name: [] for name in columns}
+        for group in np.unique(groups):
+            local = rows[groups == group] - self._group_starts[group]
+            table = self._file.read_row_group(int(group), columns=columns)
+            for name in columns:
+                parts[name].append(table.column(name).take(local).to_numpy())
+        return {name: np.concatenate(chunks) if chunks else np.empty(0)
+                for name, chunks in parts.items()}
+
+    def iter_chunks(self, columns, chunk_rows=DEFAULT_CHUNK_ROWS):
+        """Yield (first_row, {column: array}) record batches"""
+        start = 0
+        for batch in self._file.iter_batches(batch_size=chunk_rows, columns=columns):
+            yield start, {name: batch.column(name).to_numpy(zero_copy_only=False)
+                          for name in columns}
+            start += batch.num_rows
+
+
+def open_source(path, **kwargs):
+    """Open path as a data source according to its extension"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in ('.parquet', '.pq'):
+        return ParquetSource(path)
+    return ArraySource(path, **kwargs)
+
+
+def stride_rows(n_rows, max_points):
+    """Evenly strided row slice with at most max_points rows"""
+    step = max(1, -(-n_rows // max_points))
+    return slice(0, n_rows, step)
+
+
+def reservoir_sample(chunks, max_points, rng=None):
+    """Uniform sample of at most max_points rows from a stream of chunks
+
+    chunks yields {column: array} dicts of any length; the stream length
+    need not be known. Each row gets a random key and the max_points rows
+    with the smallest keys are kept, so memory is bounded by one chunk plus
+    the reservoir. Rows are returned in stream order.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    reservoir, keys, order = None, np.empty(0), np.empty(0, dtype=np.int64)
+    seen = 0
+    for chunk in chunks:
+        n = len(next(iter(chunk.values())))
+        chunk_keys = rng.random(n)
+        if reservoir is None:
+            reservoir = {name: values[:0] for name, values in chunk.items()}
+        keys = np.concatenate([keys, chunk_keys])
+        order = np.concatenate([order, seen + np.arange(n)])
+        reservoir = {name: np.concatenate([reservoir[name], chunk[name]]) for name in chunk}
+        seen += n
+        if len(keys) > max_points:
+            keep = np.argpartition(keys, max_points)[:max_points]
+            keys, order = keys[keep], order[keep]
+            reservoir = {name: values[keep] for name, values in reservoir.items()}
+
+    if reservoir is None:
+        return {}
+    ordered = np.argsort(order, kind='stable')
+    return {name: values[ordered] for name, values in reservoir.items()}
+
+
+def _filtered_chunks(source, where, chunk_rows):
+    """Stream every column of source, keeping the rows where where(chunk) holds"""
+    for _, chunk in source.iter_chunks(source.columns, chunk_rows):
+        mask = np.asarray(where(chunk), dtype=bool)
+        yield {name: values[mask] for name, values in chunk.items()}
+
+
+def sample(source, columns, max_points=10000, method='reservoir', rng=None, where=None,
+           chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Read at most max_points rows of columns from source
+
+    'stride' takes every k-th row; 'reservoir' takes a uniform random
+    sample. where is an optional filter f(chunk) -> boolean mask evaluated
+    chunk by chunk (it may use any source column). Without a filter only
+    the selected rows are ever read.
+    """
+    if method not in SAMPLING_METHODS:
+        raise ValueError(f"Unknown sampling method '{method}', expected one of {SAMPLING_METHODS}")
+    rng = np.random.default_rng() if rng is None else rng
+
+    if where is None:
+        n_rows = len(source)
+        if n_rows <= max_points:
+            return source.read(columns)
+        if method == 'stride':
+            return source.read(columns, stride_rows(n_rows, max_points))
+        return source.read(columns, np.sort(rng.choice(n_rows, max_points, replace=False)))
+
+    if method == 'reservoir':
+        rows = reservoir_sample(_filtered_chunks(source, where, chunk_rows), max_points, rng)
+    else:
+        # Stride over the filtered stream needs its length: count, then select
+        n_kept = sum(len(next(iter(chunk.values())))
+                     for chunk in _filtered_chunks(source, where, chunk_rows))
+        step = stride_rows(n_kept, max_points).step
+        rows, offset = {}, 0
+        for chunk in _filtered_chunks(source, where, chunk_rows):
+            n = len(next(iter(chunk.values())))
+            first = (-offset) % step
+            for name, values in chunk.items():
+                rows.setdefault(name, []).append(values[first::step])
+            offset += n
+        rows = {name: np.concatenate(parts) for name, parts in rows.items()}
+    return {name: rows[name] for name in columns} if rows else {name: np.empty(0) for name in columns}
+
+
+def _radius(*coords):
+    return np.sqrt(sum(np.asarray(c, dtype=float) ** 2 for c in coords))
+
+
+def interactive_3d_data(source, x='x', y='y', z='z', color=None, max_points=20000,
+                        method='reservoir', rng=None, where=None):
+    """Source counterpart of simulation_data.interactive_3d_data
+
+    Points are coloured by the color column, or by distance from the origin.
+    """
+    columns = [x, y, z] + ([color] if color else [])
+    rows = sample(source, columns, max_points, method, rng, where)
+    colors = rows[color] if color else _radius(rows[x], rows[y], rows[z])
+    return {'x': rows[x], 'y': rows[y], 'z': rows[z], 'colors': colors}
+
+
+def projected_3d_data(source, columns=None, projection='pca', color=None, max_points=20000,
+                      method='reservoir', rng=None, where=None, jobs=1):
+    """interactive_3d_data for N-dimensional rows, seen through a projection
+
+    columns (default: every column) are the point coordinates; see
+    projection.PROJECTION_METHODS. A 'pca' projection is fitted exactly over
+    every (filtered) row with jobs worker threads, then applied to the
+    max_points sampled rows. Points are coloured by the color column, or by
+    their distance from the origin in the full space.
+    """
+    from correlation import source_correlation
+    from projection import PCA, scatter_3d_data
+
+    columns = list(columns or source.columns)
+    pca = None
+    if projection == 'pca':
+        pca = PCA(3).fit_moments(source_correlation(source, columns, jobs, where))
+    rows = sample(source, list(dict.fromkeys(columns + ([color] if color else []))),
+                  max_points, method, rng, where)
+    points = np.column_stack([rows[name] for name in columns])
+    return scatter_3d_data(points, projection, rows[color] if color else None, pca)
+
+
+def particle_physics_data(source, x='x', y='y', z=None, energy='energy', params=None,
+                          max_points=10000, method='reservoir', rng=None, where=None,
+                          pdf_column=None, pdf_bins=60, jobs=1):
+    """Source counterpart of simulation_data.particle_physics_data
+
+    The scatter, energy and density panels use a sample of max_points rows.
+    The correlation panel is computed exactly over all (filtered) rows for
+    the params columns (default: every column), with jobs worker threads.
+    The density panel shows the distribution of pdf_column (default: x).
+    """
+    from correlation import source_correlation
+
+    coords = [c for c in (x, y, z) if c]
+    params = list(params or source.columns)
+    columns = list(dict.fromkeys(coords + [energy] + ([pdf_column] if pdf_column else [])))
+    rows = sample(source, columns, max_points, method, rng, where)
+
+    values = rows[pdf_column or x]
+    density, edges = np.histogram(values, bins=pdf_bins, density=True)
+    correlation = source_correlation(source, params, jobs, where).correlation()
+
+    return {
+        'x': rows[x],
+        'y': rows[y],
+        'z': rows[z] if z else None,
+        'colors': _radius(*(rows[c] for c in coords)),
+        'energies': rows[energy],
+        'correlation': correlation,
+        'params': list(params),
+        'x_pdf': (edges[:-1] + edges[1:]) / 2,
+        'y_pdf': density,
+    }
+
+
+def correlation_matrix_data(source, columns=None, jobs=1, where=None):
+    """Source counterpart of simulation_data.correlation_matrix_data
+
+    The correlation is exact over every (filtered) row, streamed in bounded
+    chunks with jobs worker threads.
+    """
+    from correlation import source_correlation
+
+    acc = source_correlation(source, columns, jobs, where)
+    return {'correlation': acc.correlation(), 'columns': acc.columns, 'n_rows': acc.count}
@@ -0,0 +1,119 @@
+"""
+Time Series Decimation
+Envelope-preserving downsampling for large line plots
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+# Default number of points per line trace before decimation kicks in
+DEFAULT_POINT_BUDGET = 5000
+
+
+def minmax_downsample(x, y, n_out):
+    """Keep the minimum and maximum of each bucket, preserving the envelope
+
+    Returns the selected indices in ascending order. The first and last
+    points are always kept. Budgets under 4 points cannot hold an envelope
+    and fall back to LTTB.
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    if n_out < 4:
+        return lttb_downsample(x, y, n_out)
+
+    bucket = int(np.ceil(n / max((n_out - 2) // 2, 1)))
+    n_buckets = int(np.ceil(n / bucket))
+    pad = n_buckets * bucket - n
+
+    # NaNs and padding never win the min/max comparison
+    y_low = np.where(np.isnan(y), np.inf, y)
+    y_high = np.where(np.isnan(y), -np.inf, y)
+    y_low = np.concatenate([y_low, np.full(pad, np.inf)]).reshape(n_buckets, bucket)
+    y_high = np.concatenate([y_high, np.full(pad, -np.inf)]).reshape(n_buckets, bucket)
+
+    starts = np.arange(n_buckets) * bucket
+    idx = np.concatenate([starts + y_low.argmin(axis=1),
+                          starts + y_high.argmax(axis=1),
+                          [0, n - 1]])
+    return np.unique(np.minimum(idx, n - 1))
+
+
+def lttb_downsample(x, y, n_out):
+    """Largest-Triangle-Three-Buckets downsampling
+
+    Returns the selected indices in ascending order; exactly n_out points
+    (including both end points from 2 points up) when the input is longer
+    than n_out.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    if n_out < 3:
+        return np.array([0, n - 1][:max(n_out, 0)], dtype=int)
+
+    # Interior buckets split points 1..n-2 into n_out-2 groups
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    prev = 0
+    for b in range(n_out - 2):
+        start, end = edges[b], edges[b + 1]
+        # Average of the next bucket (or the last point for the final bucket)
+        if b + 2 < len(edges):
+            next_start, next_end = edges[b + 1], edges[b + 2]
+            avg_x = x[next_start:next_end].mean()
+            avg_y = y[next_start:next_end].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        area = np.abs((x[prev] - avg_x) * (y[start:end] - y[prev]) -
+                      (x[prev] - x[start:end]) * (avg_y - y[prev]))
+        prev = start + int(np.nanargmax(area)) if end > start else start
+        selected[b + 1] = prev
+
+    return selected
+
+
+DOWNSAMPLERS = {
+    'minmax': minmax_downsample,
+    'lttb': lttb_downsample,
+}
+
+
+def decimate(x, y, point_budget=DEFAULT_POINT_BUDGET, method='minmax'):
+    """Reduce (x, y) to at most point_budget points
+
+    Returns (x, y, dropped) where dropped is the number of removed points.
+    method=None leaves the data untouched.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if method is None or len(y) <= point_budget:
+        return x, y, 0
+    if method not in DOWNSAMPLERS:
+        raise ValueError(f"Unknown downsampling method '{method}', "
+                         f"expected one of {sorted(DOWNSAMPLERS)}")
+
+    idx = DOWNSAMPLERS[method](x, y, point_budget)
+    return x[idx], y[idx], len(y) - len(idx)
+
+
+def series_trace(x, y, point_budget=DEFAULT_POINT_BUDGET, method='minmax', **kwargs):
+    """Build a line trace that stays responsive for any series length
+
+    Series within point_budget become a regular SVG Scatter. Longer series
+    are decimated with method and drawn with WebGL Scattergl. Returns
+    (trace, dropped_points).
+    """
+    if len(y) <= point_budget:
+        return go.Scatter(x=x, y=y, **kwargs), 0
+
+    x, y, dropped = decimate(x, y, point_budget, method)
+    return go.Scattergl(x=x, y=y, **kwargs), dropped
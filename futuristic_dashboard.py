@@ -4,94 +4,80 @@ Professional ML Visualization Suite - Game-Changing Charts
 """
 
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from matplotlib.patches import Circle, Rectangle, Polygon
 import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-from plotly.offline import plot
-import plotly.figure_factory as ff
+import simulation_data as sd
+from html_export import restore_assets, write_html
+from decimation import DEFAULT_POINT_BUDGET, series_trace
+from panel_dashboard import Panel, PanelDashboard
+from plot_style import style_rc, styled
+from themes import get_theme
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set professional styling
-plt.style.use('dark_background')
-sns.set_palette("husl")
+# Every builder here renders with plotly; the dark matplotlib styling is only
+# built (and matplotlib only imported) when style() is used, and only applies
+# inside that block
+MATPLOTLIB_STYLE = 'dark_background'
 
 class FuturisticDashboard:
-    def __init__(self):
-        self.setup_fonts()
+    def __init__(self, theme='futuristic'):
+        self.theme = get_theme(theme)
     
-    def setup_fonts(self):
-        """Setup professional futuristic font configurations"""
-        plt.rcParams.update({
-            'font.size': 12,
-            'axes.titlesize': 16,
-            'axes.labelsize': 14,
-            'xtick.labelsize': 11,
-            'ytick.labelsize': 11,
-            'legend.fontsize': 12,
-            'figure.titlesize': 18
-        })
+    def style(self):
+        """Context that applies the futuristic dark styling to figures built in it"""
+        return styled(style_rc(MATPLOTLIB_STYLE))
     
-    def create_neural_network_probability_map(self):
-        """Create a futuristic neural network probability visualization"""
-        fig = go.Figure()
+    def create_neural_network_probability_map(self, data=None, rng=None, layers=None):
+        """Create a futuristic neural network probability visualization
         
-        # Generate sophisticated neural network structure
-        layers = [20, 30, 40, 50, 60, 50, 40, 30, 20, 10]  # Multi-layer structure
-        layer_positions = []
-        neuron_positions = []
-        connections = []
+        layers overrides the neuron count per layer; connections and neurons
+        are each drawn as a single WebGL trace, so 10k+ neurons stay responsive.
+        """
+        # Multi-layer structure with ~30% of adjacent neurons connected
+        if data is None:
+            if layers is None:
+                data = sd.neural_network_data(sd.make_rng(rng))
+            else:
+                data = sd.neural_network_data(sd.make_rng(rng), layers=layers)
+        x, y = data['x'], data['y']
+        source, target = data['connections']
+        theme = self.theme
         
-        for i, n_neurons in enumerate(layers):
-            y_positions = np.linspace(-5, 5, n_neurons) if n_neurons > 1 else [0]
-            for j, y_pos in enumerate(y_positions):
-                neuron_positions.append((i * 2, y_pos, f'L{i}-N{j}', np.random.random()))
+        # Big networks get quantised palette colours, so hover reads the
+        # activation from customdata instead of the colour index
+        activation = data['activation']
+        customdata = [data['layer'], data['index']]
+        hover_activation = '%{marker.color:.2f}'
+        if theme.indexes(len(activation)):
+            customdata.append(np.round(activation, 2))
+            hover_activation = '%{customdata[2]:.2f}'
         
-        # Create connections between layers
-        for i in range(len(layers)-1):
-            current_layer_start = sum(layers[:i])
-            next_layer_start = sum(layers[:i+1])
-            for j in range(layers[i]):
-                for k in range(layers[i+1]):
-                    if np.random.random() > 0.7:  # Only connect some neurons
-                        connections.append((
-                            neuron_positions[current_layer_start + j][0:2],
-                            neuron_positions[next_layer_start + k][0:2]
-                        ))
+        fig = go.Figure()
         
-        # Create trace for neural connections
-        for conn in connections:
-            fig.add_trace(go.Scatter(
-                x=[conn[0][0], conn[1][0]],
-                y=[conn[0][1], conn[1][1]],
-                mode='lines',
-                line=dict(color='rgba(100, 100, 255, 0.2)', width=1),
-                showlegend=False,
-                hoverinfo='skip'
-            ))
+        # Create one merged trace for all neural connections
+        fig.add_trace(go.Scattergl(
+            x=sd.line_segments(x[source], x[target]),
+            y=sd.line_segments(y[source], y[target]),
+            mode='lines',
+            line=dict(color=theme.colors['edges'], width=1),
+            showlegend=False,
+            hoverinfo='skip',
+            connectgaps=False
+        ))
         
         # Create trace for neurons
-        x_neurons = [pos[0] for pos in neuron_positions]
-        y_neurons = [pos[1] for pos in neuron_positions]
-        colors = [pos[3] for pos in neuron_positions]
-        
-        fig.add_trace(go.Scatter(
-            x=x_neurons,
-            y=y_neurons,
+        fig.add_trace(go.Scattergl(
+            x=x,
+            y=y,
             mode='markers',
             marker=dict(
                 size=10,
-                color=colors,
-                colorscale='Viridis',
-                showscale=True,
-                colorbar=dict(title="Activation")
+                **theme.marker_colors('activation', activation, colorbar=dict(title="Activation")),
+                showscale=True
             ),
-            text=[pos[2] for pos in neuron_positions],
-            hovertemplate='<b>%{text}</b><br>Activation: %{marker.color:.2f}<extra></extra>',
+            customdata=np.column_stack(customdata),
+            hovertemplate='<b>L%{customdata[0]}-N%{customdata[1]}</b><br>Activation: ' +
+                          hover_activation + '<extra></extra>',
             name='Neurons'
         ))
         
@@ -100,40 +86,28 @@ class FuturisticDashboard:
                   '<sub>Multi-Dimensional Probability Mapping with Advanced ML Architecture</sub>',
             xaxis_title='Network Layer',
             yaxis_title='Neuron Position',
-            plot_bgcolor='rgba(0,0,0,0.8)',
-            paper_bgcolor='rgba(0,0,0,0.9)',
-            font=dict(color='white'),
+            **self.theme.layout(),
             width=1200,
             height=700
         )
         
         return fig
     
-    def create_quantum_superposition_visualization(self):
+    def create_quantum_superposition_visualization(self, data=None, rng=None):
         """Create a quantum superposition probability visualization"""
-        # Generate quantum state data
-        x = np.linspace(-5, 5, 200)
-        y = np.linspace(-5, 5, 200)
-        X, Y = np.meshgrid(x, y)
-        
-        # Create multiple quantum wave functions
-        Z1 = np.exp(-(X**2 + Y**2) / 4) * np.cos(2*X) * np.cos(2*Y)
-        Z2 = np.exp(-((X-1)**2 + (Y-1)**2) / 3) * np.sin(3*X) * np.cos(3*Y)
-        Z3 = np.exp(-((X+1)**2 + (Y+1)**2) / 3) * np.cos(3*X) * np.sin(3*Y)
-        
-        # Superposition
-        Z = Z1 + Z2 + Z3
-        probability = np.abs(Z)**2
+        # Superposition of multiple quantum wave functions
+        if data is None:
+            data = sd.quantum_superposition_data()
         
         fig = go.Figure(data=go.Contour(
-            z=probability,
-            x=x,
-            y=y,
-            colorscale='Plasma',
+            z=data['probability'],
+            x=data['x'],
+            y=data['y'],
+            colorscale=self.theme.colorscales['superposition'],
             contours=dict(
                 coloring='fill',
                 showlabels=True,
-                labelfont=dict(size=12, color='white')
+                labelfont=dict(size=12, color=self.theme.text['primary'])
             ),
             colorbar=dict(title="Probability Density")
         ))
@@ -143,130 +117,68 @@ class FuturisticDashboard:
                   '<sub>Advanced Multi-State Quantum Simulation Visualization</sub>',
             xaxis_title='Position X',
             yaxis_title='Position Y',
-            plot_bgcolor='rgba(0,0,0,0.8)',
-            paper_bgcolor='rgba(0,0,0,0.9)',
-            font=dict(color='white'),
+            **self.theme.layout(),
             width=1000,
             height=700
         )
         
         return fig
     
-    def create_dimensional_matrix_dashboard(self):
-        """Create a complex dimensional matrix with multiple subplots"""
-        fig = make_subplots(
-            rows=3, cols=3,
-            subplot_titles=('Dimensional Probability Flow', 'Quantum Entanglement', 'Simulation Confidence',
-                           'Multi-Dimensional Correlation', 'Temporal Analysis', 'Energy Distribution',
-                           'Information Entropy', 'Pattern Recognition', 'Reality Signature'),
-            specs=[[{"type": "scatter3d"}, {"type": "heatmap"}, {"type": "scatter"}],
-                   [{"type": "scatter"}, {"type": "bar"}, {"type": "scatter3d"}],
-                   [{"type": "heatmap"}, {"type": "scatter"}, {"type": "surface"}]]
-        )
-        
-        # 3D Dimensional Flow (top-left)
-        t = np.linspace(0, 10, 100)
-        x1 = np.sin(t) * np.exp(-t/10)
-        y1 = np.cos(t) * np.exp(-t/10) 
-        z1 = t * 0.1
-        fig.add_trace(
-            go.Scatter3d(x=x1, y=y1, z=z1, mode='lines', name='Dim Flow'),
-            row=1, col=1
-        )
-        
-        # Correlation Heatmap (top-center)
-        data_corr = np.random.rand(10, 10)
-        np.fill_diagonal(data_corr, 1)
-        fig.add_trace(
-            go.Heatmap(z=data_corr, colorscale='Viridis', name='Correlation'),
-            row=1, col=2
-        )
-        
-        # Probability Scatter (top-right)
-        x_prob = np.linspace(1, 11, 100)
-        prob = 0.2 + 0.3*np.sin(x_prob*0.5) + 0.2*np.exp(-((x_prob-5)**2)/10)
-        fig.add_trace(
-            go.Scatter(x=x_prob, y=prob, mode='markers+lines', name='Probability'),
-            row=1, col=3
-        )
-        
-        # Temporal Analysis (middle-left)
-        time = np.linspace(0, 100, 1000)
-        signal = np.sin(0.1*time) * np.exp(-time/100) + np.random.normal(0, 0.1, 1000)
-        fig.add_trace(
-            go.Scatter(x=time, y=signal, mode='lines', name='Temporal'),
-            row=2, col=1
-        )
-        
-        # Energy Distribution (middle-center)
-        energy_levels = [10, 25, 40, 30, 50, 45, 35, 20, 15, 25]
-        fig.add_trace(
-            go.Bar(x=[f'Level {i+1}' for i in range(10)], y=energy_levels, name='Energy'),
-            row=2, col=2
-        )
-        
-        # 3D Pattern Recognition (middle-right)
-        x_pat = np.random.normal(0, 1, 200)
-        y_pat = np.random.normal(0, 1, 200)
-        z_pat = x_pat**2 + y_pat**2 + np.random.normal(0, 0.5, 200)
-        fig.add_trace(
-            go.Scatter3d(x=x_pat, y=y_pat, z=z_pat, mode='markers', name='Pattern'),
-            row=2, col=3
-        )
-        
-        # Information Entropy (bottom-left)
-        entropy_matrix = np.random.exponential(2, (10, 10))
-        fig.add_trace(
-            go.Heatmap(z=entropy_matrix, colorscale='Plasma', name='Entropy'),
-            row=3, col=1
-        )
+    def create_dimensional_matrix_dashboard(self, data=None, rng=None,
+                                            point_budget=DEFAULT_POINT_BUDGET,
+                                            downsample='minmax'):
+        """Create a complex dimensional matrix with multiple subplots
         
-        # Reality Signature (bottom-center)
-        signature = np.random.gamma(2, 2, 100)
-        fig.add_trace(
-            go.Scatter(x=np.arange(100), y=signature, mode='lines+markers', name='Signature'),
-            row=3, col=2
-        )
+        The temporal panel is decimated and switched to WebGL above
+        point_budget samples; dropped points are recorded in
+        fig.layout.meta['dropped_points']. Use dimensional_matrix() for a
+        dashboard that updates single panels in place.
+        """
+        if data is None:
+            data = sd.dimensional_matrix_data(sd.make_rng(rng))
         
-        # Reality Surface (bottom-right)
-        x_surf, y_surf = np.meshgrid(np.linspace(-2, 2, 50), np.linspace(-2, 2, 50))
-        z_surf = np.sin(x_surf) * np.cos(y_surf) * np.exp(-(x_surf**2 + y_surf**2)/2)
-        fig.add_trace(
-            go.Surface(z=z_surf, colorscale='RdBu', name='Reality'),
-            row=3, col=3
-        )
+        board = self.dimensional_matrix(point_budget=point_budget, downsample=downsample)
+        board.preload(data)
+        return board.figure()
+    
+    def dimensional_matrix(self, seed=None, jobs=1, point_budget=DEFAULT_POINT_BUDGET,
+                           downsample='minmax', figure_class=None, **sizes):
+        """Incremental dimensional matrix dashboard (a PanelDashboard)
         
-        fig.update_layout(
+        Each of the nine panels is computed from its own seed and memoised;
+        figure() computes missing panels in jobs threads and afterwards only
+        recomputes and patches panels changed with set_params or reseed.
+        sizes are the size parameters of sd.dimensional_matrix_data.
+        """
+        unknown = set(sizes) - {name for _, params in sd.DIMENSIONAL_PANELS.values() for name in params}
+        if unknown:
+            raise TypeError(f'Unknown dimensional matrix sizes: {sorted(unknown)}')
+        panels = [Panel(name, row, col, spec, title, sd.DIMENSIONAL_PANELS[name][0], traces,
+                        {param: sizes[param] for param in sd.DIMENSIONAL_PANELS[name][1]
+                         if param in sizes})
+                  for name, row, col, spec, title, traces in DIMENSIONAL_MATRIX_PANELS]
+        layout = dict(
             title='Futuristic Multi-Dimensional Reality Analysis Dashboard<br>' +
                   '<sub>Advanced Quantum-Classical Interface Visualization System</sub>',
             height=1200,
             showlegend=False,
-            plot_bgcolor='rgba(0,0,0,0.8)',
-            paper_bgcolor='rgba(0,0,0,0.9)',
-            font=dict(color='white')
+            **self.theme.layout()
         )
-        
-        return fig
+        options = dict(theme=self.theme, point_budget=point_budget, downsample=downsample)
+        return PanelDashboard(panels, 3, 3, layout, options, seed=seed, jobs=jobs,
+                              figure_class=figure_class)
     
-    def create_advanced_probability_landscape(self):
+    def create_advanced_probability_landscape(self, data=None, rng=None):
         """Create an advanced probability landscape visualization"""
-        # Create complex 3D landscape with multiple peaks and valleys
-        x = np.linspace(-3, 3, 100)
-        y = np.linspace(-3, 3, 100)
-        X, Y = np.meshgrid(x, y)
-        
-        # Complex probability function with multiple modes
-        Z = (0.3 * np.exp(-((X-1)**2 + (Y-0.5)**2) / 0.5) +
-             0.25 * np.exp(-((X+1)**2 + (Y+1)**2) / 0.7) +
-             0.2 * np.exp(-((X-0.5)**2 + (Y+1.5)**2) / 0.4) +
-             0.15 * np.sin(2*X) * np.cos(2*Y) * np.exp(-(X**2 + Y**2)/4) +
-             0.1 * np.random.random((100, 100)) * 0.1)
+        # Complex 3D landscape with multiple peaks and valleys
+        if data is None:
+            data = sd.probability_landscape_data(sd.make_rng(rng))
         
         fig = go.Figure(data=[go.Surface(
-            z=Z,
-            x=x,
-            y=y,
-            colorscale='Jet',
+            z=data['Z'],
+            x=data['x'],
+            y=data['y'],
+            colorscale=self.theme.colorscales['landscape'],
             lighting=dict(
                 ambient=0.8,
                 diffuse=0.9,
@@ -287,39 +199,117 @@ class FuturisticDashboard:
             ),
             width=1000,
             height=800,
-            plot_bgcolor='rgba(0,0,0,0.8)',
-            paper_bgcolor='rgba(0,0,0,0.9)',
-            font=dict(color='white')
+            **self.theme.layout()
         )
         
         return fig
 
-def generate_future_dashboard():
-    """Generate all futuristic visualizations"""
+# Trace builders for the dimensional matrix panels: f(data, options) -> (trace, meta)
+
+def _flow_trace(data, options):
+    # 3D Dimensional Flow
+    x1, y1, z1 = data['flow']
+    return go.Scatter3d(x=x1, y=y1, z=z1, mode='lines', name='Dim Flow'), None
+
+def _entanglement_trace(data, options):
+    # Correlation Heatmap
+    colorscale = options['theme'].colorscales['correlation']
+    return go.Heatmap(z=data['correlation'], colorscale=colorscale, name='Correlation'), None
+
+def _confidence_trace(data, options):
+    # Probability Scatter
+    return go.Scatter(x=data['x_prob'], y=data['prob'], mode='markers+lines', name='Probability'), None
+
+def _temporal_trace(data, options):
+    # Temporal Analysis, decimated above the point budget
+    temporal, dropped = series_trace(data['time'], data['signal'], options['point_budget'],
+                                     options['downsample'], mode='lines', name='Temporal')
+    return temporal, {'dropped_points': {'Temporal': dropped}}
+
+def _energy_trace(data, options):
+    # Energy Distribution
+    energy_levels = data['energy_levels']
+    return go.Bar(x=[f'Level {i+1}' for i in range(len(energy_levels))], y=energy_levels,
+                  name='Energy'), None
+
+def _pattern_trace(data, options):
+    # 3D Pattern Recognition
+    x_pat, y_pat, z_pat = data['pattern']
+    return go.Scatter3d(x=x_pat, y=y_pat, z=z_pat, mode='markers', name='Pattern'), None
+
+def _entropy_trace(data, options):
+    # Information Entropy
+    colorscale = options['theme'].colorscales['entropy']
+    return go.Heatmap(z=data['entropy'], colorscale=colorscale, name='Entropy'), None
+
+def _signature_trace(data, options):
+    # Reality Signature
+    signature = data['signature']
+    return go.Scatter(x=np.arange(len(signature)), y=signature, mode='lines+markers',
+                      name='Signature'), None
+
+def _surface_trace(data, options):
+    # Reality Surface
+    colorscale = options['theme'].colorscales['surface']
+    return go.Surface(z=data['surface'], colorscale=colorscale, name='Reality'), None
+
+# Dimensional matrix layout: (panel, row, col, subplot spec, subplot title, trace builder)
+DIMENSIONAL_MATRIX_PANELS = [
+    ('flow', 1, 1, {"type": "scatter3d"}, 'Dimensional Probability Flow', _flow_trace),
+    ('entanglement', 1, 2, {"type": "heatmap"}, 'Quantum Entanglement', _entanglement_trace),
+    ('confidence', 1, 3, {"type": "scatter"}, 'Simulation Confidence', _confidence_trace),
+    ('temporal', 2, 1, {"type": "scatter"}, 'Multi-Dimensional Correlation', _temporal_trace),
+    ('energy', 2, 2, {"type": "bar"}, 'Temporal Analysis', _energy_trace),
+    ('pattern', 2, 3, {"type": "scatter3d"}, 'Energy Distribution', _pattern_trace),
+    ('entropy', 3, 1, {"type": "heatmap"}, 'Information Entropy', _entropy_trace),
+    ('signature', 3, 2, {"type": "scatter"}, 'Pattern Recognition', _signature_trace),
+    ('surface', 3, 3, {"type": "surface"}, 'Reality Signature', _surface_trace),
+]
+
+# Figures produced by generate_future_dashboard, in output order
+DASHBOARD_FIGURES = [
+    ('create_neural_network_probability_map', 'neural_network_dashboard.html'),
+    ('create_quantum_superposition_visualization', 'quantum_superposition_visualization.html'),
+    ('create_dimensional_matrix_dashboard', 'dimensional_matrix_dashboard.html'),
+    ('create_advanced_probability_landscape', 'advanced_probability_landscape.html'),
+]
+
+def generate_future_dashboard(cache=None, seed=None, compact_html=False):
+    """Generate all futuristic visualizations
+    
+    If a RenderCache is given and seed is set, unchanged figures are copied
+    from it instead of being rebuilt. A seed makes every figure
+    reproducible; unseeded runs are random and never cached. compact_html
+    writes against a shared plotly.min.js with compactly encoded arrays.
+    """
     dashboard = FuturisticDashboard()
     
     print("Generating Futuristic Professional Visualizations...")
     
     # Create each visualization
-    neural_fig = dashboard.create_neural_network_probability_map()
-    neural_fig.write_html('neural_network_dashboard.html')
-    
-    quantum_fig = dashboard.create_quantum_superposition_visualization()
-    quantum_fig.write_html('quantum_superposition_visualization.html')
-    
-    matrix_fig = dashboard.create_dimensional_matrix_dashboard()
-    matrix_fig.write_html('dimensional_matrix_dashboard.html')
-    
-    landscape_fig = dashboard.create_advanced_probability_landscape()
-    landscape_fig.write_html('advanced_probability_landscape.html')
+    for i, (method_name, filename) in enumerate(DASHBOARD_FIGURES):
+        builder = getattr(dashboard, method_name)
+        figure_seed = None if seed is None else seed + i
+        cached = cache is not None and figure_seed is not None
+        if cached:
+            key = cache.key(builder, format='html', seed=figure_seed, compact=compact_html)
+            if cache.fetch(key, filename):
+                if compact_html:
+                    restore_assets(filename)
+                continue
+        
+        fig = builder(rng=sd.make_rng(seed=figure_seed))
+        write_html(fig, filename, compact=compact_html)
+        if cached:
+            cache.store(key, filename)
     
     print("All futuristic visualizations generated successfully!")
     print("Files created:")
-    print("- neural_network_dashboard.html")
-    print("- quantum_superposition_visualization.html") 
-    print("- dimensional_matrix_dashboard.html")
-    print("- advanced_probability_landscape.html")
+    for _, filename in DASHBOARD_FIGURES:
+        print(f"- {filename}")
     print("\nThese are interactive HTML files that work as live demos!")
+    if cache is not None:
+        cache.report()
 
 if __name__ == "__main__":
     generate_future_dashboard()
\ No newline at end of file
@@ -0,0 +1,166 @@
+"""
+Compact HTML Export
+Smaller interactive dashboards: shared plotly.js asset and compact arrays
+"""
+
+import base64
+import os
+import re
+import numpy as np
+import plotly.io as pio
+
+PLOTLYJS_FILENAME = 'plotly.min.js'
+
+# plotly.js understands {'dtype', 'bdata', 'shape'} typed-array specs from 2.28
+TYPED_ARRAY_MIN_VERSION = (2, 28)
+
+# Arrays shorter than this are left as plain JSON lists
+MIN_ENCODED_LENGTH = 16
+
+# A template reference to the text property: %{text}, %{text:.2f} or %{text|%x}
+TEXT_PLACEHOLDER = re.compile(r'%\{text[}:|]')
+
+TYPED_ARRAY_DTYPES = {
+    np.dtype('float32'): 'f4', np.dtype('float64'): 'f8',
+    np.dtype('int8'): 'i1', np.dtype('uint8'): 'u1',
+    np.dtype('int16'): 'i2', np.dtype('uint16'): 'u2',
+    np.dtype('int32'): 'i4', np.dtype('uint32'): 'u4',
+}
+
+
+def supports_typed_arrays():
+    """Whether the bundled plotly.js can decode base64 typed arrays"""
+    from plotly.offline import get_plotlyjs_version
+    version = tuple(int(part) for part in get_plotlyjs_version().split('.')[:2])
+    return version >= TYPED_ARRAY_MIN_VERSION
+
+
+def write_plotlyjs(asset_dir):
+    """Write the shared plotly.js bundle once and return its path"""
+    os.makedirs(asset_dir, exist_ok=True)
+    path = os.path.join(asset_dir, PLOTLYJS_FILENAME)
+    if not os.path.exists(path):
+        from plotly.offline import get_plotlyjs
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(get_plotlyjs())
+    return path
+
+
+def restore_assets(*paths):
+    """Write the shared plotly.js next to each HTML file in paths
+
+    write_compact_html does this itself; call it for compact HTML copied in
+    from elsewhere, such as a render cache hit in a fresh output directory.
+    """
+    for path in paths:
+        if path.endswith('.html'):
+            write_plotlyjs(os.path.dirname(os.path.abspath(path)))
+
+
+def encode_array(arr, encoding='typed', precision=6):
+    """Encode one numeric array compactly
+
+    'typed' returns a base64 typed-array spec with floats stored as float32
+    and integers in the smallest 32-bit-or-narrower type that fits; 'round'
+    returns a list rounded to precision significant digits.
+    """
+    if encoding == 'round':
+        finite = np.abs(arr[np.isfinite(arr)])
+        magnitude = int(np.floor(np.log10(finite.max()))) if finite.size and finite.max() > 0 else 0
+        decimals = max(0, precision - 1 - magnitude)
+        return np.round(arr.astype(float), decimals)
+
+    if arr.dtype.kind == 'f' or arr.dtype.kind == 'b':
+        arr = arr.astype(np.float32)
+    elif arr.dtype.kind in 'iu' and arr.dtype not in TYPED_ARRAY_DTYPES:
+        info = np.iinfo(np.int32)
+        fits = arr.size == 0 or (arr.min() >= info.min and arr.max() <= info.max)
+        arr = arr.astype(np.int32 if fits else np.float64)
+
+    arr = np.ascontiguousarray(arr)
+    spec = {
+        'dtype': TYPED_ARRAY_DTYPES[arr.dtype],
+        'bdata': base64.b64encode(arr.tobytes()).decode('ascii'),
+    }
+    if arr.ndim > 1:
+        spec['shape'] = ', '.join(str(dim) for dim in arr.shape)
+    return spec
+
+
+def _compact_value(value, encoding, precision):
+    """Recursively replace large numeric arrays inside a trace dict"""
+    if isinstance(value, dict):
+        return {k: _compact_value(v, encoding, precision) for k, v in value.items()}
+    if isinstance(value, (list, tuple)) and len(value) >= MIN_ENCODED_LENGTH:
+        try:
+            arr = np.asarray(value)
+        except ValueError:
+            return value
+        value = arr if arr.dtype.kind in 'fiub' else value
+    if isinstance(value, np.ndarray) and value.dtype.kind in 'fiub' \
+            and value.size >= MIN_ENCODED_LENGTH:
+        return encode_array(value, encoding, precision)
+    return value
+
+
+def _drop_unused_text(trace):
+    """Remove per-point text that no label or hover template displays"""
+    text = trace.get('text')
+    if text is None or isinstance(text, str):
+        return trace
+    shown_as_label = 'text' in str(trace.get('mode', ''))
+    used_in_template = any(TEXT_PLACEHOLDER.search(str(trace.get(key, '')))
+                           for key in ('hovertemplate', 'texttemplate'))
+    hoverinfo = str(trace.get('hoverinfo', 'all'))
+    uses_hoverinfo = 'hovertemplate' not in trace and ('text' in hoverinfo or hoverinfo == 'all')
+    if not (shown_as_label or used_in_template or uses_hoverinfo):
+        trace = dict(trace)
+        del trace['text']
+    return trace
+
+
+def compact_figure_dict(fig, encoding='auto', precision=6, drop_text=True):
+    """Return the figure as a dict with compactly encoded trace arrays
+
+    encoding is 'typed' (base64 typed arrays), 'round' (JSON rounded to
+    precision significant digits) or 'auto' (typed when the bundled
+    plotly.js supports it).
+    """
+    if encoding == 'auto':
+        encoding = 'typed' if supports_typed_arrays() else 'round'
+
+    fig_dict = fig.to_plotly_json() if hasattr(fig, 'to_plotly_json') else dict(fig)
+    data = []
+    for trace in fig_dict.get('data', []):
+        if drop_text:
+            trace = _drop_unused_text(trace)
+        data.append(_compact_value(trace, encoding, precision))
+
+    return {**fig_dict, 'data': data}
+
+
+def write_compact_html(fig, path, asset_dir=None, encoding='auto', precision=6,
+                       drop_text=True):
+    """Write fig as HTML that loads a shared plotly.js instead of embedding it
+
+    The bundle is written once to asset_dir (default: next to path) and
+    referenced by relative URL, so many dashboards share one cached copy.
+    """
+    out_dir = os.path.dirname(os.path.abspath(path))
+    asset_dir = out_dir if asset_dir is None else asset_dir
+    asset = write_plotlyjs(asset_dir)
+    src = os.path.relpath(asset, out_dir).replace(os.sep, '/')
+
+    fig_dict = compact_figure_dict(fig, encoding, precision, drop_text)
+    html = pio.to_html(fig_dict, include_plotlyjs=src, validate=False)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(html)
+    return path
+
+
+def write_html(fig, path, compact=False, **kwargs):
+    """Write fig with plotly's standalone writer or the compact pipeline"""
+    if compact:
+        return write_compact_html(fig, path, **kwargs)
+    fig.write_html(path)
+    return path
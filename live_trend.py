@@ -0,0 +1,218 @@
+"""
+Live Probability Trend Analysis
+Updatable variant of SimulationVisualizer.create_probability_trend_analysis
+"""
+
+import numpy as np
+import simulation_data as sd
+from visualization import SimulationVisualizer
+
+# Fraction of the data span added on each side when limits are rescaled,
+# so small fluctuations in later updates can still be blitted
+RESCALE_HEADROOM = 0.15
+
+
+def _band_vertices(x, lower, upper):
+    """Closed polygon outline of a fill_between band"""
+    x = np.asarray(x, dtype=float)
+    return np.concatenate([np.column_stack([x, lower]),
+                           np.column_stack([x[::-1], upper[::-1]])])
+
+
+def _extent(x, y):
+    """(x_min, x_max, y_min, y_max) of the finite values"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    return np.nanmin(x), np.nanmax(x), np.nanmin(y), np.nanmax(y)
+
+
+def _merge(a, b):
+    if a is None:
+        return b
+    return min(a[0], b[0]), max(a[1], b[1]), min(a[2], b[2]), max(a[3], b[3])
+
+
+def _within(ax, extent):
+    """Whether an extent lies inside the current view limits"""
+    x_low, x_high = sorted(ax.get_xlim())
+    y_low, y_high = sorted(ax.get_ylim())
+    return (extent[0] >= x_low and extent[1] <= x_high and
+            extent[2] >= y_low and extent[3] <= y_high)
+
+
+def _set_limits(ax, extent):
+    """Fit ax to extent plus RESCALE_HEADROOM on each side"""
+    x_min, x_max, y_min, y_max = extent
+    x_pad = RESCALE_HEADROOM * (x_max - x_min)
+    y_pad = RESCALE_HEADROOM * (y_max - y_min)
+    ax.set_xlim(x_min - x_pad, x_max + x_pad)
+    # Keep zero baselines (histogram bars) anchored at zero
+    ax.set_ylim(y_min if y_min == 0 else y_min - y_pad, y_max + y_pad)
+
+
+class LiveProbabilityTrend:
+    """Probability trend dashboard that is built once and refreshed in place
+
+    The figure, axes, layout and colorbar are created by the regular
+    builder on construction. update() swaps new data into the existing
+    artists (set_data / set_offsets / set_verts / set_array) and, while the
+    data stays inside the current axis and colour limits, blits only those
+    artists over a cached background. Out-of-range data triggers one full
+    redraw with rescaled limits, after which blitting resumes.
+    """
+
+    def __init__(self, data=None, rng=None, visualizer=None, blit=True):
+        self.rng = sd.make_rng(rng)
+        if data is None:
+            data = sd.probability_trend_data(self.rng)
+        self.visualizer = visualizer or SimulationVisualizer()
+        self.fig = self.visualizer.create_probability_trend_analysis(data)
+        self.canvas = self.fig.canvas
+        self.blit = blit
+        self.full_draws = 0
+        self.blits = 0
+
+        trend_ax, hist_ax, scatter_ax, heat_ax = self.fig.axes[:4]
+        self.axes = {'trend': trend_ax, 'hist': hist_ax, 'scatter': scatter_ax,
+                     'heatmap': heat_ax}
+        self.artists = {
+            'actual': trend_ax.lines[0],
+            'expected': trend_ax.lines[1],
+            'band': trend_ax.collections[0],
+            'bars': list(hist_ax.containers[0]),
+            'scatter': scatter_ax.collections[0],
+            'regression': scatter_ax.lines[0],
+            'image': heat_ax.images[0],
+            'sample_count': hist_ax.texts[0],
+        }
+        self._background = None
+
+        for artist in self._animated():
+            artist.set_animated(blit)
+        self.redraw()
+
+    def _animated(self):
+        """Every artist whose data changes between updates"""
+        artists = dict(self.artists)
+        bars = artists.pop('bars')
+        return list(artists.values()) + bars
+
+    def redraw(self):
+        """Full draw of the figure, caching the static background for blitting"""
+        self.canvas.draw()
+        if self.blit:
+            self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+            self._draw_animated()
+        self.full_draws += 1
+
+    def _draw_animated(self):
+        for artist in self._animated():
+            artist.axes.draw_artist(artist)
+
+    def _rebuild_bars(self, heights, edges):
+        """Replace the histogram bars when the number of bins changes"""
+        ax = self.axes['hist']
+        old = self.artists['bars']
+        style = old[0]
+        ax.containers[:] = [c for c in ax.containers if style not in c]
+        for bar in old:
+            bar.remove()
+        bars = ax.bar(edges[:-1], heights, width=np.diff(edges), align='edge',
+                      color=style.get_facecolor(), edgecolor=style.get_edgecolor(),
+                      linewidth=style.get_linewidth(), zorder=style.get_zorder())
+        for bar in bars:
+            bar.set_animated(self.blit)
+        self.artists['bars'] = list(bars)
+
+    def _rescale(self, extents):
+        """Fit the view limits to extents and the colour limits to the image"""
+        for key, extent in extents.items():
+            if not _within(self.axes[key], extent):
+                _set_limits(self.axes[key], extent)
+        image = self.artists['image']
+        image.set_clim(np.nanmin(image.get_array()), np.nanmax(image.get_array()))
+
+    def update(self, data):
+        """Swap new data into the existing artists and refresh the canvas
+
+        data holds any subset of the probability_trend_data keys; missing
+        panels keep their current contents. A histogram with a different
+        number of bins gets new bars and a full redraw. Returns 'blit' or
+        'redraw'.
+        """
+        art = self.artists
+        extents = {'trend': None, 'hist': None, 'scatter': None}
+        clim_fits = True
+        rebuilt = False
+
+        if 'prob_with_noise' in data or 'time' in data:
+            time = data.get('time', art['actual'].get_xdata())
+            actual = data.get('prob_with_noise', art['actual'].get_ydata())
+            art['actual'].set_data(time, actual)
+            extents['trend'] = _merge(extents['trend'], _extent(time, actual))
+        if 'base_prob' in data:
+            time = data.get('time', art['expected'].get_xdata())
+            art['expected'].set_data(time, data['base_prob'])
+            extents['trend'] = _merge(extents['trend'], _extent(time, data['base_prob']))
+        if 'prob_lower' in data and 'prob_upper' in data:
+            time = data.get('time', art['actual'].get_xdata())
+            art['band'].set_verts([_band_vertices(time, data['prob_lower'], data['prob_upper'])])
+            band = np.concatenate([data['prob_lower'], data['prob_upper']])
+            extents['trend'] = _merge(extents['trend'], _extent(time, band))
+
+        if 'prob_hist' in data:
+            heights, edges = data['prob_hist']
+            if len(edges) - 1 != len(art['bars']):
+                self._rebuild_bars(heights, edges)
+                rebuilt = True
+            for bar, height, left, width in zip(art['bars'], heights, edges[:-1], np.diff(edges)):
+                bar.set_x(left)
+                bar.set_width(width)
+                bar.set_height(height)
+            extents['hist'] = _extent(edges, np.append(heights, 0))
+        if 'monte_carlo' in data:
+            art['sample_count'].set_text(f"n = {data['monte_carlo']['prior_samples']:,}")
+
+        if 'dimensions' in data and 'prob_dim' in data:
+            art['scatter'].set_offsets(np.column_stack([data['dimensions'], data['prob_dim']]))
+            extents['scatter'] = _extent(data['dimensions'], data['prob_dim'])
+        if 'trend' in data:
+            x_reg = data.get('x_reg', art['regression'].get_xdata())
+            art['regression'].set_data(x_reg, data['trend'])
+            extents['scatter'] = _merge(extents['scatter'], _extent(x_reg, data['trend']))
+
+        if 'Z_sensitivity' in data:
+            image = art['image']
+            values = np.asarray(data['Z_sensitivity'])
+            image.set_data(values)
+            low, high = image.get_clim()
+            clim_fits = bool(np.nanmin(values) >= low and np.nanmax(values) <= high)
+
+        extents = {key: extent for key, extent in extents.items() if extent is not None}
+        fits = clim_fits and all(_within(self.axes[key], extent)
+                                 for key, extent in extents.items())
+        if not self.blit or not fits or rebuilt or self._background is None:
+            if not fits:
+                self._rescale(extents)
+            self.redraw()
+            return 'redraw'
+
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.fig.bbox)
+        self.blits += 1
+        return 'blit'
+
+    def refresh(self, **data_kwargs):
+        """Draw a new realisation from the instance rng and update with it"""
+        return self.update(sd.probability_trend_data(self.rng, **data_kwargs))
+
+    def frame(self):
+        """Current canvas pixels as an (height, width, 4) uint8 RGBA array"""
+        return np.asarray(self.canvas.buffer_rgba()).copy()
+
+    def save(self, path):
+        """Write the current canvas (including blitted artists) as an image"""
+        from PIL import Image
+        Image.fromarray(self.frame()).save(path)
+        return path
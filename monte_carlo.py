@@ -0,0 +1,155 @@
+"""
+Monte Carlo Engine
+Batched sampling with streaming statistics and convergence-based stopping
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+import numpy as np
+
+
+class RunningStats:
+    """Streaming mean and variance (Welford) over batches of samples
+
+    Samples may be scalars or arrays; statistics are kept per element.
+    Batches are folded in with the pairwise (Chan et al.) form of Welford's
+    update, so two RunningStats can also be merged exactly.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def merge(self, count, mean, m2):
+        """Fold in the (count, mean, M2) summary of another set of samples"""
+        if count == 0:
+            return self
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean = self.mean + delta * (count / total)
+        self.m2 = self.m2 + m2 + delta ** 2 * (self.count * count / total)
+        self.count = total
+        return self
+
+    def update(self, batch):
+        """Fold in a batch of samples stacked along axis 0"""
+        batch = np.asarray(batch, dtype=float)
+        mean = batch.mean(axis=0)
+        return self.merge(len(batch), mean, ((batch - mean) ** 2).sum(axis=0))
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else np.zeros_like(self.mean)
+
+    @property
+    def std(self):
+        return np.sqrt(self.variance)
+
+    def ci_halfwidth(self, confidence=0.95):
+        """Half-width of the normal confidence interval of the mean"""
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        return z * self.std / np.sqrt(max(self.count, 1))
+
+
+def beta_probability_sampler(rng, n):
+    """Simulation probabilities from the Beta(2, 5) prior scaled into [0.1, 0.9]"""
+    return rng.beta(2, 5, n) * 0.8 + 0.1
+
+
+def trend_sampler(rng, n, time):
+    """n probability trajectories over time with amplitude, phase and noise uncertainty"""
+    amplitude = rng.normal(0.1, 0.02, (n, 1))
+    phase = rng.normal(0.0, 0.2, (n, 1))
+    noise = rng.normal(0, 0.02, (n, len(time)))
+    return 0.4 + amplitude * np.sin(0.1 * time + phase) + 0.05 * np.cos(0.05 * time) + noise
+
+
+def _run_batch(sampler, seed, batch_size, edges=None):
+    """Draw one batch and return its (count, mean, M2, histogram counts)"""
+    batch = np.asarray(sampler(np.random.default_rng(seed), batch_size), dtype=float)
+    mean = batch.mean(axis=0)
+    m2 = ((batch - mean) ** 2).sum(axis=0)
+    counts = None if edges is None else np.histogram(batch, bins=edges)[0]
+    return len(batch), mean, m2, counts
+
+
+def run_monte_carlo(sampler, batch_size=10000, tolerance=0.002, confidence=0.95,
+                    min_samples=None, max_samples=1_000_000, seed=None, jobs=1,
+                    bins=None, hist_range=None):
+    """Sample in batches until the confidence interval of the mean is narrow enough
+
+    sampler(rng, n) returns n samples stacked along axis 0 (scalars or
+    arrays). Sampling stops once the full CI width (2 x half-width, worst
+    element for array samples) is at most tolerance, or at max_samples.
+    Each batch draws from its own SeedSequence child, and batches are
+    merged in order and the stop is checked after every batch, so the result
+    does not depend on jobs; jobs > 1 evaluates batches in a process pool
+    (the sampler must then be picklable), jobs=None uses one per CPU.
+
+    Returns a dict with the running statistics, the CI, the sample count,
+    whether the target was met and, if bins is given, the accumulated
+    histogram (counts, density and edges) of scalar samples; an integer
+    bins needs hist_range so every batch shares the same edges.
+    """
+    edges = None
+    if bins is not None:
+        if np.ndim(bins) == 0 and hist_range is None:
+            raise ValueError("hist_range is required when bins is a bin count")
+        edges = np.histogram_bin_edges([], bins=bins, range=hist_range)
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    min_samples = batch_size if min_samples is None else min_samples
+    root = np.random.SeedSequence(seed)
+    stats = RunningStats()
+    hist_counts = None
+    batches = 0
+    converged = False
+
+    def absorb(result):
+        nonlocal hist_counts, batches, converged
+        count, mean, m2, counts = result
+        stats.merge(count, mean, m2)
+        if counts is not None:
+            hist_counts = counts if hist_counts is None else hist_counts + counts
+        batches += 1
+        width = 2 * np.max(stats.ci_halfwidth(confidence))
+        converged = stats.count >= min_samples and width <= tolerance
+        return converged or stats.count >= max_samples
+
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        done = False
+        while not done:
+            seeds = root.spawn(jobs)
+            if pool is None:
+                results = (_run_batch(sampler, s, batch_size, edges) for s in seeds)
+            else:
+                futures = [pool.submit(_run_batch, sampler, s, batch_size, edges) for s in seeds]
+                results = (future.result() for future in futures)
+            for result in results:
+                if absorb(result):
+                    done = True
+                    break
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    halfwidth = stats.ci_halfwidth(confidence)
+    result = {
+        'mean': stats.mean,
+        'std': stats.std,
+        'ci_low': stats.mean - halfwidth,
+        'ci_high': stats.mean + halfwidth,
+        'n_samples': stats.count,
+        'n_batches': batches,
+        'converged': converged,
+        'confidence': confidence,
+    }
+    if hist_counts is not None:
+        result['hist_counts'] = hist_counts
+        result['hist_edges'] = edges
+        result['hist_density'] = hist_counts / (hist_counts.sum() * np.diff(edges))
+    return result
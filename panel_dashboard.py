@@ -0,0 +1,222 @@
+"""
+Incremental Panel Dashboards
+Subplot dashboards whose panels are computed independently and patched in place
+
+A dashboard is a list of Panels, each with a data function f(rng, **params)
+and a trace function f(data, options) -> (trace, meta). PanelDashboard
+memoises panel data by (panel, seed, params), computes missing panels in a
+thread pool and builds the make_subplots figure once. Later calls to
+figure() recompute only the panels whose parameters or seed changed and
+patch their traces into the existing figure:
+
+    board = dashboard.dimensional_matrix(seed=7, jobs=4)
+    fig = board.figure()                          # nine panels in parallel
+    board.set_params('temporal', n_temporal=100_000)
+    board.figure()                                # recomputes one panel
+"""
+
+import inspect
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import simulation_data as sd
+
+# Panel datasets kept in memory per dashboard
+DEFAULT_MEMO_SIZE = 64
+
+
+class Panel:
+    """One subplot: where it goes and how its data and trace are made
+
+    data(rng, **params) returns the panel's data dict; params override the
+    defaults of its signature. traces(data, options) returns the plotly trace and
+    a dict merged into the figure's layout.meta (or None).
+    """
+
+    def __init__(self, name, row, col, spec, title, data, traces, params=None):
+        self.name = name
+        self.row = row
+        self.col = col
+        self.spec = spec
+        self.title = title
+        self.data = data
+        self.traces = traces
+        self.params = {name: p.default for name, p in inspect.signature(data).parameters.items()
+                       if p.default is not inspect.Parameter.empty}
+        self.params.update(params or {})
+
+
+class PanelDashboard:
+    """Memoised, incrementally updated make_subplots dashboard
+
+    Panel seeds are drawn from seed like simulation_data.panel_seeds, so a
+    board and the matching one-shot data function give the same panels.
+    options (theme, point budgets, ...) are passed to every trace function;
+    layout is fixed and applied once when the figure is built. figure_class may be
+    go.FigureWidget, whose panels then update live in a notebook.
+    """
+
+    def __init__(self, panels, rows, cols, layout=None, options=None, seed=None, jobs=1,
+                 memo_size=DEFAULT_MEMO_SIZE, figure_class=None):
+        self.panels = list(panels)
+        self.rows = rows
+        self.cols = cols
+        self.layout = dict(layout or {})
+        self.options = dict(options or {})
+        self.jobs = (os.cpu_count() or 1) if jobs is None else jobs
+        self.memo_size = memo_size
+        self.figure_class = figure_class
+        self.params = {panel.name: dict(panel.params) for panel in self.panels}
+        self._rng = sd.make_rng(seed=seed)
+        self.seeds = dict(zip(self.params, sd.panel_seeds(self._rng, len(self.panels))))
+        self.stats = {'computed': 0, 'memoised': 0, 'patched': 0, 'built': 0}
+        self._memo = OrderedDict()
+        self._shown = {}
+        self._meta = {}
+        self.fig = None
+
+    def _panel(self, name):
+        for panel in self.panels:
+            if panel.name == name:
+                return panel
+        raise KeyError(f"Unknown panel '{name}', expected one of {list(self.params)}")
+
+    def _key(self, name):
+        return (name, self.seeds[name], tuple(sorted(self.params[name].items())))
+
+    def set_params(self, name, **params):
+        """Change a panel's data parameters; it is recomputed on the next figure()"""
+        self._panel(name)
+        self.params[name].update(params)
+
+    def set_options(self, **options):
+        """Change trace options; every panel is redrawn from memoised data"""
+        self.options.update(options)
+        self._shown.clear()
+
+    def reseed(self, *names):
+        """Draw new seeds (a new realisation) for names (default: every panel)"""
+        for name in names or list(self.params):
+            self._panel(name)
+            self.seeds[name] = sd.panel_seeds(self._rng, 1)[0]
+
+    def preload(self, data, names=None):
+        """Use precomputed data (e.g. a merged dict of every panel's keys) for names
+
+        The data stands in for the panels' current parameters and seeds
+        until they change.
+        """
+        for name in names or list(self.params):
+            self._panel(name)
+            self._memo[self._key(name)] = data
+            self._shown.pop(name, None)
+
+    def stale(self):
+        """Names of the panels whose figure traces are out of date"""
+        return [name for name in self.params if self._shown.get(name) != self._key(name)]
+
+    def _compute(self, name):
+        panel = self._panel(name)
+        return panel.data(np.random.default_rng(self.seeds[name]), **self.params[name])
+
+    def panel_data(self, names):
+        """{name: data} for names, from the memo or computed in parallel"""
+        result, missing = {}, []
+        for name in names:
+            key = self._key(name)
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                result[name] = self._memo[key]
+                self.stats['memoised'] += 1
+            else:
+                missing.append(name)
+
+        if self.jobs > 1 and len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.jobs, len(missing))) as pool:
+                computed = list(pool.map(self._compute, missing))
+        else:
+            computed = [self._compute(name) for name in missing]
+
+        for name, data in zip(missing, computed):
+            self._memo[self._key(name)] = data
+            result[name] = data
+            self.stats['computed'] += 1
+        while len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+        return result
+
+    def _traces(self, names):
+        data = self.panel_data(names)
+        traces = {}
+        for name in names:
+            trace, meta = self._panel(name).traces(data[name], self.options)
+            traces[name] = trace
+            self._meta[name] = meta or {}
+        return traces
+
+    def _merged_meta(self):
+        meta = {}
+        for panel_meta in self._meta.values():
+            for key, value in panel_meta.items():
+                meta.setdefault(key, {}).update(value)
+        return meta
+
+    def _build(self):
+        from plotly.subplots import make_subplots
+
+        specs = [[None] * self.cols for _ in range(self.rows)]
+        titles = [''] * (self.rows * self.cols)
+        for panel in self.panels:
+            specs[panel.row - 1][panel.col - 1] = panel.spec
+            titles[(panel.row - 1) * self.cols + panel.col - 1] = panel.title
+
+        fig = make_subplots(rows=self.rows, cols=self.cols, subplot_titles=titles, specs=specs)
+        traces = self._traces([panel.name for panel in self.panels])
+        for panel in self.panels:
+            fig.add_trace(traces[panel.name], row=panel.row, col=panel.col)
+        fig.update_layout(**self.layout, meta=self._merged_meta())
+        if self.figure_class is not None:
+            fig = self.figure_class(fig)
+
+        self.fig = fig
+        self._shown = {name: self._key(name) for name in self.params}
+        self.stats['built'] += 1
+        return fig
+
+    def figure(self):
+        """The dashboard, with stale panels recomputed and patched in place
+
+        Each panel owns one trace (in panel order). A stale panel's trace is
+        updated with the new properties; if its trace type changes (e.g. a
+        series switching to WebGL) the figure is rebuilt from memoised data.
+        """
+        if self.fig is None:
+            return self._build()
+        stale = self.stale()
+        if not stale:
+            return self.fig
+
+        traces = self._traces(stale)
+        index = {panel.name: i for i, panel in enumerate(self.panels)}
+        if any(self.fig.data[index[name]].type != traces[name].type for name in stale):
+            return self._build()
+
+        with self.fig.batch_update():
+            for name in stale:
+                patch = traces[name].to_plotly_json()
+                # Keep the trace type and the subplot the trace was placed on
+                for axis in ('type', 'xaxis', 'yaxis', 'scene'):
+                    patch.pop(axis, None)
+                self.fig.data[index[name]].update(patch, overwrite=True)
+                self._shown[name] = self._key(name)
+            self.fig.layout.meta = self._merged_meta()
+        self.stats['patched'] += len(stale)
+        return self.fig
+
+    def report(self):
+        """Print how panels were served"""
+        print(f"Panel dashboard: {len(self.panels)} panels, {self.stats['computed']} computed, "
+              f"{self.stats['memoised']} memoised, {self.stats['patched']} patched, "
+              f"built {self.stats['built']} times")
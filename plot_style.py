@@ -0,0 +1,172 @@
+"""
+Shared Matplotlib Styling
+Scoped, thread-safe style setup for the matplotlib-based visualizations
+
+Nothing here changes the global rcParams permanently. Builders create
+figures through the object-oriented Figure API inside styled(), which
+applies a style with matplotlib.rc_context while the artists are created.
+Artists copy most of the style when they are created; the few settings
+matplotlib still reads while drawing (tick defaults, font lookup) are
+resolved into the figure when the styled block ends (pin_style), so drawing
+and saving happen outside styled() and need no lock.
+"""
+
+import inspect
+import threading
+from contextlib import contextmanager
+
+# Same colours as seaborn's sns.set_palette("husl"), without importing seaborn
+HUSL_PALETTE = ['#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4']
+
+# Professional font configuration shared by both dashboards
+FONT_RC = {
+    'font.size': 12,
+    'axes.titlesize': 16,
+    'axes.labelsize': 14,
+    'xtick.labelsize': 11,
+    'ytick.labelsize': 11,
+    'legend.fontsize': 12,
+    'figure.titlesize': 18
+}
+
+# rcParams are process-global, so rc_context alone is not enough when
+# threads create artists concurrently: styled() blocks run one at a time.
+# Reentrant so a styled builder can call another styled helper.
+RC_LOCK = threading.RLock()
+
+# Figures created by new_figure in the innermost styled() block of a thread
+_scope = threading.local()
+
+
+def style_rc(style):
+    """rcParams for a named matplotlib style plus the husl cycle and FONT_RC"""
+    import matplotlib.style
+    from cycler import cycler
+
+    rc = dict(matplotlib.style.library[style])
+    rc['axes.prop_cycle'] = cycler(color=HUSL_PALETTE)
+    rc.update(FONT_RC)
+    rc['font.family'] = resolve_font_family(rc)
+    return rc
+
+
+def resolve_font_family(rc):
+    """The first installed font of rc's font.family, as a one-name list
+
+    Generic families ('sans-serif', ...) are otherwise expanded through the
+    global rcParams every time text is drawn. Returns font.family unchanged
+    if none of its fonts is installed.
+    """
+    import matplotlib
+    from matplotlib.font_manager import FontProperties, findfont
+
+    families = rc.get('font.family', matplotlib.rcParamsDefault['font.family'])
+    families = [families] if isinstance(families, str) else list(families)
+    generic = {'serif', 'sans-serif', 'cursive', 'fantasy', 'monospace'}
+    for family in families:
+        key = f'font.{family}'
+        candidates = rc.get(key, matplotlib.rcParamsDefault[key]) if family in generic else [family]
+        for name in candidates:
+            if name in generic:
+                continue
+            try:
+                findfont(FontProperties(family=name), fallback_to_default=False)
+            except ValueError:
+                continue
+            return [name]
+    return families
+
+
+# Axis.tick_params names that Tick.__init__ knows by another name
+TICK_INIT_NAMES = {'length': 'size', 'direction': 'tickdir'}
+
+
+def _tick_defaults(prefix, which):
+    """tick_params that new ticks would otherwise read from rcParams at draw time
+
+    Only settings this matplotlib's ticks accept are returned (e.g.
+    labelfontfamily needs matplotlib 3.8).
+    """
+    import matplotlib
+    from matplotlib.axis import Tick
+    from matplotlib.font_manager import FontProperties
+
+    rc = matplotlib.rcParams
+    color = rc[f'{prefix}.color']
+    labelcolor = rc[f'{prefix}.labelcolor']
+    defaults = {
+        'length': rc[f'{prefix}.{which}.size'],
+        'width': rc[f'{prefix}.{which}.width'],
+        'pad': rc[f'{prefix}.{which}.pad'],
+        'color': color,
+        'labelcolor': color if labelcolor == 'inherit' else labelcolor,
+        'labelsize': FontProperties(size=rc[f'{prefix}.labelsize']).get_size_in_points(),
+        'labelfontfamily': rc['font.family'],
+        'direction': rc[f'{prefix}.direction'],
+        'grid_color': rc['grid.color'],
+        'grid_linestyle': rc['grid.linestyle'],
+        'grid_linewidth': rc['grid.linewidth'],
+        'grid_alpha': rc['grid.alpha'],
+    }
+    accepted = inspect.signature(Tick.__init__).parameters
+    return {key: value for key, value in defaults.items()
+            if TICK_INIT_NAMES.get(key, key) in accepted}
+
+
+def pin_style(fig):
+    """Store the current rcParams that drawing fig would read in its axes
+
+    Axes create tick marks lazily while drawing, and the tick locators size
+    themselves by the tick label size; both read rcParams at that point.
+    Called inside styled() (automatically for figures from new_figure), this
+    fills in every tick setting the builder did not set itself, so the
+    figure draws the same under any global rcParams. Uses
+    Axis.get_tick_params, new in matplotlib 3.7.
+    """
+    for ax in fig.axes:
+        for axis in (ax.xaxis, ax.yaxis, getattr(ax, 'zaxis', None)):
+            if axis is None:
+                continue
+            prefix = 'ytick' if axis.axis_name == 'y' else 'xtick'
+            for which in ('major', 'minor'):
+                current = axis.get_tick_params(which=which)
+                unset = {key: value for key, value in _tick_defaults(prefix, which).items()
+                         if key not in current}
+                axis.set_tick_params(which=which, **unset)
+    return fig
+
+
+@contextmanager
+def styled(rc):
+    """Create matplotlib artists with rc (e.g. from style_rc) in the block only
+
+    RC_LOCK is held for the block, so keep it to building figures. Figures
+    made with new_figure in the block are pinned (pin_style) when it ends;
+    draw and save them afterwards, outside the block and without the lock.
+    """
+    import matplotlib
+    with RC_LOCK, matplotlib.rc_context(rc):
+        outer = getattr(_scope, 'figures', None)
+        _scope.figures = []
+        try:
+            yield
+            for fig in _scope.figures:
+                pin_style(fig)
+        finally:
+            _scope.figures = outer
+
+
+def new_figure(**kwargs):
+    """Figure with its own Agg canvas, never registered with pyplot
+
+    Inside styled(), the figure is pinned to the style when the block ends.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    figures = getattr(_scope, 'figures', None)
+    if figures is not None:
+        figures.append(fig)
+    return fig
@@ -0,0 +1,129 @@
+"""
+Point Level of Detail
+Bound the size of 3D scatter figures however many points there are
+
+reduce_points thins a point cloud to at most budget points, either by a
+uniform random sample (which preserves the point density) or by merging
+the points of each cell of a voxel grid into their centroid (which keeps
+sparse regions and outliers visible and records how many points each
+marker stands for). density_volume bins the cloud into a fixed grid of
+point densities for a volume rendering. Both take the dicts returned by
+simulation_data.interactive_3d_data and its data_sources counterparts.
+"""
+
+import numpy as np
+
+LOD_METHODS = ('voxel', 'random')
+
+# Points sent to the browser by the 3D scatter builders
+DEFAULT_POINT_BUDGET = 20000
+
+# Finest voxel grid tried by the voxel method (cells per axis)
+MAX_VOXEL_GRID = 512
+
+# Points used to choose the voxel grid before checking it on the whole cloud
+VOXEL_SEARCH_POINTS = 1_000_000
+
+
+def _voxel_keys(coords, grid, lower, upper):
+    """Flat voxel index of every point on a grid x grid x grid lattice"""
+    keys = np.zeros(len(coords[0]), dtype=np.int64)
+    for values, lo, hi in zip(coords, lower, upper):
+        span = hi - lo if hi > lo else 1.0
+        cell = ((values - lo) * (grid / span)).astype(np.int64)
+        keys = keys * grid + np.minimum(cell, grid - 1)
+    return keys
+
+
+def _search_grid(coords, budget, lower, upper, high):
+    """Binary search for the finest grid up to high with at most budget occupied voxels"""
+    low = 1
+    while low < high:
+        grid = (low + high + 1) // 2
+        occupied = np.count_nonzero(np.bincount(_voxel_keys(coords, grid, lower, upper)))
+        if occupied <= budget:
+            low = grid
+        else:
+            high = grid - 1
+    return low
+
+
+def voxel_grid_for(coords, budget, lower, upper):
+    """(grid, keys): a grid (cells per axis) with at most budget occupied voxels
+
+    The finest such grid is searched for on an evenly strided sample of at
+    most VOXEL_SEARCH_POINTS points. The full cloud occupies more voxels
+    than the sample, so while the grid overflows on it the grid shrinks by
+    sqrt(budget / occupied): occupancy grows at least as fast as grid^2
+    (a surface) and at most as grid^3 (a volume), so this converges in a
+    pass or two. keys are the voxel indices of every point on that grid.
+    """
+    step = max(1, -(-len(coords[0]) // VOXEL_SEARCH_POINTS))
+    grid = _search_grid([c[::step] for c in coords], budget, lower, upper, MAX_VOXEL_GRID)
+    while True:
+        keys = _voxel_keys(coords, grid, lower, upper)
+        occupied = np.count_nonzero(np.bincount(keys))
+        if occupied <= budget or grid == 1:
+            return grid, keys
+        grid = min(grid - 1, int(grid * np.sqrt(budget / occupied)))
+
+
+def reduce_points(data, budget=DEFAULT_POINT_BUDGET, method='voxel', seed=0):
+    """At most budget points of a {'x', 'y', 'z', 'colors'} cloud
+
+    'random' keeps a uniform sample of the points in their original order.
+    'voxel' replaces the points of every occupied voxel by their centroid and
+    mean colour, on the finest grid with at most budget occupied voxels;
+    the result has a 'counts' array of the points behind each marker. Clouds
+    already within budget are returned unchanged.
+    """
+    if method not in LOD_METHODS:
+        raise ValueError(f"Unknown level-of-detail method '{method}', expected one of {LOD_METHODS}")
+    coords = [np.asarray(data[axis], dtype=np.float64) for axis in ('x', 'y', 'z')]
+    colors = np.asarray(data['colors'], dtype=np.float64)
+    n_points = len(coords[0])
+    if n_points <= budget:
+        return data
+
+    if method == 'random':
+        keep = np.sort(np.random.default_rng(seed).choice(n_points, budget, replace=False))
+        return {'x': coords[0][keep], 'y': coords[1][keep], 'z': coords[2][keep],
+                'colors': colors[keep]}
+
+    # Points with a NaN coordinate (e.g. stereographic poles) have no voxel
+    finite = np.isfinite(coords[0]) & np.isfinite(coords[1]) & np.isfinite(coords[2])
+    if not finite.all():
+        coords, colors = [c[finite] for c in coords], colors[finite]
+    lower = [c.min() for c in coords]
+    upper = [c.max() for c in coords]
+    _, keys = voxel_grid_for(coords, budget, lower, upper)
+    counts = np.bincount(keys)
+    occupied = np.flatnonzero(counts)
+    counts = counts[occupied]
+
+    def mean(values):
+        return np.bincount(keys, weights=values)[occupied] / counts
+
+    return {'x': mean(coords[0]), 'y': mean(coords[1]), 'z': mean(coords[2]),
+            'colors': mean(colors), 'counts': counts}
+
+
+def density_volume(data, bins=40):
+    """Point density of a cloud on a bins x bins x bins grid, for go.Volume
+
+    Returns flattened 'x', 'y', 'z' cell centres and 'density' (points per
+    unit volume), so the figure size depends on bins only.
+    """
+    coords = [np.asarray(data[axis], dtype=np.float64) for axis in ('x', 'y', 'z')]
+    finite = np.isfinite(coords[0]) & np.isfinite(coords[1]) & np.isfinite(coords[2])
+    coords = [c[finite] for c in coords]
+    lower = [c.min() if len(c) else 0.0 for c in coords]
+    upper = [c.max() if len(c) else 1.0 for c in coords]
+    keys = _voxel_keys(coords, bins, lower, upper)
+    counts = np.bincount(keys, minlength=bins ** 3).astype(np.float64)
+
+    spans = [hi - lo if hi > lo else 1.0 for lo, hi in zip(lower, upper)]
+    centres = [lo + (np.arange(bins) + 0.5) * span / bins for lo, span in zip(lower, spans)]
+    X, Y, Z = np.meshgrid(*centres, indexing='ij')
+    return {'x': X.ravel(), 'y': Y.ravel(), 'z': Z.ravel(),
+            'density': counts / (np.prod(spans) / bins ** 3)}
@@ -0,0 +1,231 @@
+"""
+N-Dimensional Projection
+Vectorised NumPy port of utils/DimensionProjector.js
+
+Points are (n_points, n_dims) arrays (memory-maps included) and are
+projected in chunks of rows, so memory stays bounded however many points
+there are. The orthographic, perspective and stereographic methods follow
+the JavaScript projector exactly; 'pca' is a real principal component
+projection instead of its random weights. scatter_3d_data returns the dict
+the 3D scatter builders take:
+
+    points = sd.hypershell_points(rng, n_points=1_000_000, n_dims=6)
+    fig = viz.create_interactive_3d_plotly(data=scatter_3d_data(points, 'pca'))
+"""
+
+import numpy as np
+from correlation import DEFAULT_CHUNK_BYTES, chunk_rows_for, streaming_correlation
+
+PCA_METHODS = ('auto', 'incremental', 'randomized')
+
+# 'auto' switches to randomized PCA above this many input dimensions, where
+# the dims x dims covariance of incremental PCA gets large
+RANDOMIZED_MIN_DIMS = 2048
+
+
+def orthographic(block, target_dims):
+    """First target_dims coordinates"""
+    return block[:, :target_dims]
+
+
+def perspective(block, target_dims):
+    """First target_dims coordinates divided by |last coordinate| + 0.1
+
+    The last coordinate acts as the w (depth) coordinate. Points that have
+    no more than target_dims coordinates are left undivided.
+    """
+    if block.shape[1] <= target_dims:
+        return block[:, :target_dims]
+    return block[:, :target_dims] / (np.abs(block[:, -1:]) + 0.1)
+
+
+def stereographic(block, target_dims):
+    """Stereographic projection of the unit (n-1)-sphere onto n-1 dimensions
+
+    Points are first scaled onto the unit hypersphere; the first target_dims
+    of the remaining n-1 coordinates are kept. Points at the origin are
+    passed through like in the JavaScript projector, and points at the
+    projection pole (last coordinate = +magnitude) have no image and come
+    out as NaN, which plotly leaves out.
+    """
+    magnitude = np.sqrt(np.einsum('ij,ij->i', block, block))[:, None]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        normalized = block / magnitude
+        factor = 1 / (1 - normalized[:, -1:])
+        projected = normalized[:, :-1][:, :target_dims] * factor
+    projected[~np.isfinite(projected)] = np.nan
+    origin = magnitude[:, 0] == 0
+    if origin.any():
+        projected[origin] = block[origin, :projected.shape[1]]
+    return projected
+
+
+def _flip_signs(components):
+    """Make the largest loading of each component positive (deterministic signs)"""
+    largest = components[np.arange(len(components)), np.abs(components).argmax(axis=1)]
+    return components * np.where(largest < 0, -1.0, 1.0)[:, None]
+
+
+def _row_chunks(n_rows, chunk_rows):
+    for start in range(0, n_rows, chunk_rows):
+        yield slice(start, min(start + chunk_rows, n_rows))
+
+
+class PCA:
+    """Principal component projection fitted in chunks of rows
+
+    'incremental' streams the rows once through a CorrelationAccumulator
+    (exact; O(dims^2) memory however many rows) and takes the leading
+    eigenvectors of the covariance. 'randomized' is the randomized SVD of
+    Halko, Martinsson and Tropp: 2 x n_iter + 4 passes over the rows and
+    O(rows x (n_components + n_oversamples)) memory, for data too wide for
+    a covariance matrix. 'auto' picks incremental up to RANDOMIZED_MIN_DIMS
+    input dimensions. Component signs are normalised, so fits are
+    reproducible.
+    """
+
+    def __init__(self, n_components=3, method='auto', n_oversamples=10, n_iter=4,
+                 seed=0, max_chunk_bytes=DEFAULT_CHUNK_BYTES, jobs=1):
+        if method not in PCA_METHODS:
+            raise ValueError(f"Unknown PCA method '{method}', expected one of {PCA_METHODS}")
+        self.n_components = n_components
+        self.method = method
+        self.n_oversamples = n_oversamples
+        self.n_iter = n_iter
+        self.seed = seed
+        self.max_chunk_bytes = max_chunk_bytes
+        self.jobs = jobs
+        self.count = 0
+        self.mean = None
+        self.components = None
+        self.explained_variance = None
+        self.explained_variance_ratio = None
+
+    def fit(self, points):
+        """Fit to a (n_points, n_dims) array or memory-map"""
+        n_rows, n_dims = points.shape
+        method = self.method
+        if method == 'auto':
+            method = 'incremental' if n_dims <= RANDOMIZED_MIN_DIMS else 'randomized'
+        if method == 'randomized':
+            return self._fit_randomized(points)
+        chunk_rows = chunk_rows_for(n_dims, self.max_chunk_bytes)
+        blocks = (points[rows] for rows in _row_chunks(n_rows, chunk_rows))
+        return self.fit_moments(streaming_correlation(blocks, range(n_dims), self.jobs))
+
+    def fit_moments(self, acc):
+        """Fit from a CorrelationAccumulator over the rows (e.g. source_correlation)"""
+        covariance = acc.covariance()
+        variances, vectors = np.linalg.eigh(covariance)
+        order = np.argsort(variances)[::-1][:self.n_components]
+        self.count = acc.count
+        self.mean = acc.mean
+        self.components = _flip_signs(vectors[:, order].T)
+        self.explained_variance = np.maximum(variances[order], 0.0)
+        total = np.trace(covariance)
+        self.explained_variance_ratio = self.explained_variance / total if total > 0 else np.zeros(len(order))
+        return self
+
+    def _fit_randomized(self, points):
+        n_rows, n_dims = points.shape
+        k = min(self.n_components, n_dims, n_rows)
+        width = min(k + self.n_oversamples, n_dims, n_rows)
+        chunk_rows = chunk_rows_for(n_dims, self.max_chunk_bytes)
+        chunks = list(_row_chunks(n_rows, chunk_rows))
+
+        def block(rows):
+            return np.asarray(points[rows], dtype=np.float64) - mean
+
+        mean = np.zeros(n_dims)
+        for rows in chunks:
+            mean += np.asarray(points[rows], dtype=np.float64).sum(axis=0)
+        mean /= n_rows
+
+        def times(matrix):
+            """Centred points @ matrix, (n_rows, width)"""
+            return np.concatenate([block(rows) @ matrix for rows in chunks])
+
+        def transpose_times(matrix):
+            """Centred points.T @ matrix, (n_dims, width)"""
+            return sum(block(rows).T @ matrix[rows] for rows in chunks)
+
+        # Range finder with power iterations, re-orthonormalised every step
+        rng = np.random.default_rng(self.seed)
+        basis, _ = np.linalg.qr(times(rng.standard_normal((n_dims, width))))
+        for _ in range(self.n_iter):
+            basis, _ = np.linalg.qr(transpose_times(basis))
+            basis, _ = np.linalg.qr(times(basis))
+        _, singular, vt = np.linalg.svd(transpose_times(basis).T, full_matrices=False)
+
+        total = sum(np.einsum('ij,ij->', b, b) for b in map(block, chunks)) / max(n_rows - 1, 1)
+        self.count = n_rows
+        self.mean = mean
+        self.components = _flip_signs(vt[:k])
+        self.explained_variance = singular[:k] ** 2 / max(n_rows - 1, 1)
+        self.explained_variance_ratio = self.explained_variance / total if total > 0 else np.zeros(k)
+        return self
+
+    def transform(self, block):
+        """Coordinates of a (rows, n_dims) block along the fitted components"""
+        if self.components is None:
+            raise RuntimeError('PCA is not fitted yet')
+        return (np.asarray(block, dtype=np.float64) - self.mean) @ self.components.T
+
+
+PROJECTIONS = {
+    'orthographic': orthographic,
+    'perspective': perspective,
+    'stereographic': stereographic,
+}
+
+PROJECTION_METHODS = tuple(PROJECTIONS) + ('pca',)
+
+
+def project(points, target_dims=3, method='perspective', max_chunk_bytes=DEFAULT_CHUNK_BYTES,
+            pca=None):
+    """Project (n_points, n_dims) points to at most target_dims dimensions
+
+    Rows are read and projected max_chunk_bytes at a time into one float64
+    result array. For 'pca', pca may be a fitted PCA to reuse (otherwise
+    one is fitted to points with the default options).
+    """
+    if method not in PROJECTION_METHODS:
+        raise ValueError(f"Unknown projection method '{method}', expected one of {PROJECTION_METHODS}")
+    if points.ndim != 2:
+        raise ValueError(f'points must be (n_points, n_dims), got shape {points.shape}')
+    n_rows, n_dims = points.shape
+
+    if method == 'pca':
+        if pca is None:
+            pca = PCA(min(target_dims, n_dims), max_chunk_bytes=max_chunk_bytes).fit(points)
+        transform = pca.transform
+    else:
+        projection = PROJECTIONS[method]
+        transform = lambda block: projection(np.asarray(block, dtype=np.float64), target_dims)
+
+    chunk_rows = chunk_rows_for(n_dims, max_chunk_bytes)
+    result = None
+    for rows in _row_chunks(n_rows, chunk_rows):
+        projected = transform(points[rows])
+        if result is None:
+            result = np.empty((n_rows, projected.shape[1]))
+        result[rows] = projected
+    return result if result is not None else np.empty((0, min(target_dims, n_dims)))
+
+
+def scatter_3d_data(points, method='perspective', colors=None, pca=None,
+                    max_chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Input for the 3D scatter builders from (n_points, n_dims) points
+
+    Same dict as simulation_data.interactive_3d_data. Points are coloured by
+    colors, or by their distance from the origin in the full n_dims space.
+    """
+    xyz = project(points, 3, method, max_chunk_bytes, pca)
+    if xyz.shape[1] < 3:
+        raise ValueError(f"'{method}' projection of {points.shape[1]}-dimensional points "
+                         f'has only {xyz.shape[1]} dimensions')
+    if colors is None:
+        chunk_rows = chunk_rows_for(points.shape[1], max_chunk_bytes)
+        colors = np.concatenate([np.linalg.norm(np.asarray(points[rows], dtype=np.float64), axis=1)
+                                 for rows in _row_chunks(len(points), chunk_rows)] or [np.empty(0)])
+    return {'x': xyz[:, 0], 'y': xyz[:, 1], 'z': xyz[:, 2], 'colors': colors}
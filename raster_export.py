@@ -0,0 +1,117 @@
+"""
+Static Figure Export
+Quality profiles and single-draw multi-format export for matplotlib figures
+"""
+
+import io
+import os
+
+# Named quality tiers: output DPI, plot_surface sampling (max rows/columns,
+# matplotlib derives the stride from it) and antialiasing
+QUALITY_PROFILES = {
+    'preview': {'dpi': 72, 'surface_count': 20, 'antialiased': False},
+    'web': {'dpi': 150, 'surface_count': 35, 'antialiased': True},
+    'print': {'dpi': 300, 'surface_count': 50, 'antialiased': True},
+}
+
+DEFAULT_QUALITY = 'print'
+
+# Formats encoded from the one Agg rasterisation, and vector formats that
+# need their own (vector) draw
+RASTER_FORMATS = ('png', 'webp', 'jpg')
+VECTOR_FORMATS = ('svg', 'pdf')
+
+# Lossy encoder settings for the derived raster formats
+ENCODER_OPTIONS = {
+    'webp': {'quality': 90, 'method': 4},
+    'jpg': {'quality': 92, 'optimize': True},
+}
+
+
+def quality_profile(quality=None):
+    """Resolve a profile name (or a profile dict) to a full profile dict"""
+    if quality is None:
+        quality = DEFAULT_QUALITY
+    if isinstance(quality, dict):
+        return {**QUALITY_PROFILES[DEFAULT_QUALITY], **quality}
+    if quality not in QUALITY_PROFILES:
+        raise ValueError(f"Unknown quality profile '{quality}', "
+                         f"expected one of {sorted(QUALITY_PROFILES)}")
+    return dict(QUALITY_PROFILES[quality])
+
+
+def tight_bbox(fig, dpi, pad_inches=None):
+    """Tight bounding box of fig in inches at dpi, from a layout-only pass
+
+    This is what savefig(bbox_inches='tight') computes on every call;
+    computing it once lets all formats share it.
+    """
+    import matplotlib
+    if pad_inches is None:
+        pad_inches = matplotlib.rcParams['savefig.pad_inches']
+    original_dpi = fig.dpi
+    fig.dpi = dpi
+    try:
+        fig.draw_without_rendering()
+        bbox = fig.get_tightbbox()
+    finally:
+        fig.dpi = original_dpi
+    return bbox.padded(pad_inches)
+
+
+def set_antialiased(fig, antialiased):
+    """Switch antialiasing for every artist of fig that supports it"""
+    for artist in fig.findobj(lambda a: hasattr(a, 'set_antialiased')):
+        artist.set_antialiased(antialiased)
+
+
+def save_figure(fig, stem, formats=('png',), quality=None, dpi=None):
+    """Write fig once per format as stem.<format> and return the paths
+
+    Raster formats come from a single Agg draw: PNG is written as rendered
+    and WebP/JPEG are re-encoded from its pixels. Vector formats are drawn
+    by their own backend. The tight bounding box is computed once for all.
+    """
+    profile = quality_profile(quality)
+    dpi = dpi or profile['dpi']
+    unknown = [fmt for fmt in formats if fmt not in RASTER_FORMATS + VECTOR_FORMATS]
+    if unknown:
+        raise ValueError(f"Unsupported format(s) {unknown}, "
+                         f"expected {RASTER_FORMATS + VECTOR_FORMATS}")
+
+    if not profile['antialiased']:
+        set_antialiased(fig, False)
+    bbox = tight_bbox(fig, dpi)
+
+    paths = []
+    raster = [fmt for fmt in formats if fmt in RASTER_FORMATS]
+    if raster:
+        png = io.BytesIO()
+        fig.savefig(png, format='png', dpi=dpi, bbox_inches=bbox)
+        image = None
+        for fmt in raster:
+            path = f'{stem}.{fmt}'
+            if fmt == 'png':
+                with open(path, 'wb') as f:
+                    f.write(png.getbuffer())
+            else:
+                if image is None:
+                    from PIL import Image
+                    png.seek(0)
+                    image = Image.open(png).convert('RGB')
+                image.save(path, **ENCODER_OPTIONS.get(fmt, {}))
+            paths.append(path)
+
+    for fmt in formats:
+        if fmt in VECTOR_FORMATS:
+            path = f'{stem}.{fmt}'
+            fig.savefig(path, format=fmt, dpi=dpi, bbox_inches=bbox)
+            paths.append(path)
+
+    return paths
+
+
+def output_paths(filename, formats=('png',)):
+    """Output files of a static figure for formats, keyed by its .png filename"""
+    stem = os.path.splitext(filename)[0]
+    return [f'{stem}.{fmt}' for fmt in formats]
@@ -0,0 +1,155 @@
+"""
+Streaming Reality Signature Tracker
+Incremental, constant-memory variant of cyberpunk_dashboard.create_reality_tracker
+"""
+
+from itertools import islice
+
+import numpy as np
+import simulation_data as sd
+from cyberpunk_dashboard import create_reality_tracker
+
+# Tracker series in trace order of create_reality_tracker
+TRACKER_SERIES = ('prob_signal', 'dim_stability', 'quantum_coh', 'reality_sig',
+                  'cumulative_deviation')
+
+
+class RingBuffer:
+    """Fixed-capacity float buffer that keeps the most recent values"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._data = np.zeros(capacity)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def extend(self, values):
+        """Append values, overwriting the oldest entries once full"""
+        values = np.asarray(values, dtype=float).ravel()[-self.capacity:]
+        n = len(values)
+        end = (self._start + self._size) % self.capacity
+        first = min(n, self.capacity - end)
+        self._data[end:end + first] = values[:first]
+        self._data[:n - first] = values[first:]
+
+        overflow = max(0, self._size + n - self.capacity)
+        self._start = (self._start + overflow) % self.capacity
+        self._size = min(self.capacity, self._size + n)
+
+    def values(self):
+        """Return the buffered values oldest first (a copy)"""
+        idx = (self._start + np.arange(self._size)) % self.capacity
+        return self._data[idx]
+
+
+class RealityTrackerStream:
+    """Reality tracker fed incrementally from a live sample source
+
+    Each signal lives in a ring buffer of ``capacity`` samples and the
+    cumulative deviation is carried forward as a running total, so memory
+    and per-tick cost stay constant however long the stream runs. Every
+    update returns a patch in Plotly ``extendTraces`` form::
+
+        {'data': {'x': [...], 'y': [...]}, 'indices': [...], 'max_points': capacity}
+
+    which a browser can apply with ``Plotly.extendTraces(gd, patch['data'],
+    patch['indices'], patch['max_points'])`` or Python with apply_patch().
+    """
+
+    def __init__(self, capacity=1000):
+        self.capacity = capacity
+        self.time = RingBuffer(capacity)
+        self.buffers = {key: RingBuffer(capacity) for key in TRACKER_SERIES}
+        self.cumulative = 0.0
+        self.samples_seen = 0
+
+    def figure(self):
+        """Build the tracker figure from the current buffer contents"""
+        data = {key: buf.values() for key, buf in self.buffers.items()}
+        data['time'] = self.time.values()
+        return create_reality_tracker(data=data, downsample=None)
+
+    def push(self, sample):
+        """Ingest one sample or a batch of samples and return the patch
+
+        sample is a dict with 'time' and the four signal keys, holding
+        scalars or equal-length arrays.
+        """
+        time_points = np.atleast_1d(np.asarray(sample['time'], dtype=float))
+        prob = np.atleast_1d(np.asarray(sample['prob_signal'], dtype=float))
+
+        # Running total carried across batches instead of a full cumsum
+        deviation = self.cumulative + np.cumsum(prob - 0.5)
+        self.cumulative = deviation[-1]
+
+        chunk = {key: np.atleast_1d(np.asarray(sample[key], dtype=float))
+                 for key in TRACKER_SERIES[:-1]}
+        chunk['cumulative_deviation'] = deviation
+
+        self.time.extend(time_points)
+        for key in TRACKER_SERIES:
+            self.buffers[key].extend(chunk[key])
+        self.samples_seen += len(time_points)
+
+        return {
+            'data': {
+                'x': [time_points] * len(TRACKER_SERIES),
+                'y': [chunk[key] for key in TRACKER_SERIES],
+            },
+            'indices': list(range(len(TRACKER_SERIES))),
+            'max_points': self.capacity,
+        }
+
+    def consume(self, samples, limit=None):
+        """Yield one patch per sample drawn from an iterator
+
+        With a limit, exactly limit samples are drawn, so a shared source
+        keeps the rest.
+        """
+        for sample in islice(samples, limit):
+            yield self.push(sample)
+
+    async def aconsume(self, samples, limit=None):
+        """Yield one patch per sample drawn from an async iterator
+
+        With a limit, exactly limit samples are drawn, so a shared source
+        keeps the rest.
+        """
+        if limit is not None and limit <= 0:
+            return
+        i = 0
+        async for sample in samples:
+            yield self.push(sample)
+            i += 1
+            if limit is not None and i >= limit:
+                break
+
+
+def apply_patch(fig, patch):
+    """Apply an extendTraces-style patch to a figure in place
+
+    Works on go.Figure and go.FigureWidget; each trace is trimmed to the
+    patch's max_points so long sessions do not grow the figure.
+    """
+    max_points = patch['max_points']
+    with fig.batch_update():
+        for i, x_new, y_new in zip(patch['indices'], patch['data']['x'], patch['data']['y']):
+            trace = fig.data[i]
+            old_x = np.asarray(trace.x if trace.x is not None else [], dtype=float)
+            old_y = np.asarray(trace.y if trace.y is not None else [], dtype=float)
+            trace.x = np.concatenate([old_x, x_new])[-max_points:]
+            trace.y = np.concatenate([old_y, y_new])[-max_points:]
+    return fig
+
+
+def stream_reality_tracker(rng=None, capacity=1000, dt=0.1, batch_size=1, ticks=None):
+    """Run a simulated live feed through a RealityTrackerStream
+
+    Returns (stream, patches) where patches is a generator of updates.
+    """
+    stream = RealityTrackerStream(capacity)
+    samples = sd.reality_tracker_samples(sd.make_rng(rng), dt=dt, batch_size=batch_size)
+    return stream, stream.consume(samples, limit=ticks)
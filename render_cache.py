@@ -0,0 +1,221 @@
+"""
+Content-Addressed Render Cache
+On-disk cache for rendered figure files (PNG/HTML/JSON)
+"""
+
+import ast
+import hashlib
+import inspect
+import json
+import os
+import shutil
+
+
+def library_versions():
+    """Return the versions of the rendering libraries that affect output"""
+    import matplotlib
+    import numpy
+    import plotly
+    return {
+        'numpy': numpy.__version__,
+        'matplotlib': matplotlib.__version__,
+        'plotly': plotly.__version__,
+    }
+
+
+def local_dependencies(path):
+    """Paths of path and of every module next to it that it imports, transitively
+
+    Imports are read from the source (function-level imports included), so
+    a figure module's key covers the data layer and engines it uses.
+    """
+    root = os.path.dirname(os.path.abspath(path))
+    seen, pending = set(), [os.path.abspath(path)]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        with open(current, encoding='utf-8') as f:
+            tree = ast.parse(f.read(), current)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                candidate = os.path.join(root, name.split('.')[0] + '.py')
+                if os.path.exists(candidate):
+                    pending.append(candidate)
+    return sorted(seen)
+
+
+def dependency_digest(func):
+    """Hash of the source of func's module and the local modules it imports"""
+    try:
+        path = inspect.getsourcefile(func)
+    except TypeError:
+        path = None
+    digest = hashlib.sha256()
+    if path is None or not os.path.exists(path):
+        return digest.hexdigest()
+    for dependency in local_dependencies(path):
+        digest.update(os.path.basename(dependency).encode())
+        with open(dependency, 'rb') as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+def resolved_params(func, params):
+    """params completed with the defaults of func's signature (data and rng excluded)"""
+    try:
+        signature = inspect.signature(func)
+    except (TypeError, ValueError):
+        return dict(params)
+    resolved = {name: p.default for name, p in signature.parameters.items()
+                if p.default is not inspect.Parameter.empty and name not in ('data', 'rng')}
+    resolved.update(params)
+    return resolved
+
+
+class RenderCache:
+    """Size-bounded LRU cache of rendered figure files
+
+    Each entry is a directory named ``<builder>-<digest>`` holding the files
+    produced for one (builder, parameters, library versions) combination.
+    The digest covers the builder's source, the source of its module and of
+    every local module that module imports (simulation_data and the engines
+    behind it), and the parameters with the builder's defaults filled in,
+    so editing a data function or a default size is a cache miss.
+    The entry's modification time records its last use for LRU eviction.
+    """
+
+    def __init__(self, cache_dir='.render_cache', max_bytes=512 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.events = []
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, builder, **params):
+        """Build the cache key for a figure builder and its parameters"""
+        func = getattr(builder, '__func__', builder)
+        try:
+            source = inspect.getsource(func)
+        except (OSError, TypeError):
+            source = ''
+
+        payload = json.dumps({
+            'figure': f'{func.__module__}.{func.__qualname__}',
+            'source': hashlib.sha256(source.encode()).hexdigest(),
+            'dependencies': dependency_digest(func),
+            'params': resolved_params(func, params),
+            'versions': library_versions(),
+        }, sort_keys=True, default=str)
+        digest = hashlib.sha256(payload.encode()).hexdigest()[:20]
+        return f'{func.__name__}-{digest}'
+
+    def _entry_dir(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def path(self, key, name):
+        """Path of the cached file called name in the entry for key
+
+        For files kept only in the cache (e.g. a figure's JSON next to its
+        HTML), read in place after a successful fetch.
+        """
+        return os.path.join(self._entry_dir(key), name)
+
+    def fetch(self, key, *paths):
+        """Copy cached files for key to paths; return True on a cache hit"""
+        entry = self._entry_dir(key)
+        cached = [os.path.join(entry, os.path.basename(p)) for p in paths]
+
+        if not all(os.path.exists(c) for c in cached):
+            self.misses += 1
+            self.events.append((key, 'miss'))
+            return False
+
+        for src, dest in zip(cached, paths):
+            shutil.copyfile(src, dest)
+        os.utime(entry)
+        self.hits += 1
+        self.events.append((key, 'hit'))
+        return True
+
+    def store(self, key, *paths):
+        """Add freshly rendered files to the cache and evict if over budget"""
+        entry = self._entry_dir(key)
+        tmp_entry = f'{entry}.tmp-{os.getpid()}'
+        os.makedirs(tmp_entry, exist_ok=True)
+        for path in paths:
+            shutil.copyfile(path, os.path.join(tmp_entry, os.path.basename(path)))
+
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(tmp_entry, entry)
+        self.evict()
+
+    def entries(self):
+        """Return [(key, size_bytes, last_used)] sorted oldest first"""
+        result = []
+        for name in os.listdir(self.cache_dir):
+            entry = self._entry_dir(name)
+            if not os.path.isdir(entry) or '.tmp-' in name:
+                continue
+            size = sum(os.path.getsize(os.path.join(entry, f)) for f in os.listdir(entry))
+            result.append((name, size, os.path.getmtime(entry)))
+        return sorted(result, key=lambda e: e[2])
+
+    def size(self):
+        """Total bytes held by the cache"""
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits max_bytes"""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for key, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(self._entry_dir(key), ignore_errors=True)
+            total -= size
+            self.evictions += 1
+
+    def invalidate(self, builder=None):
+        """Remove cached entries for one builder, or everything if None"""
+        prefix = None
+        if builder is not None:
+            name = builder if isinstance(builder, str) else getattr(builder, '__func__', builder).__name__
+            prefix = f'{name}-'
+
+        removed = 0
+        for key, _, _ in self.entries():
+            if prefix is None or key.startswith(prefix):
+                shutil.rmtree(self._entry_dir(key), ignore_errors=True)
+                removed += 1
+        return removed
+
+    def summary(self):
+        """Return hit/miss statistics as a dict"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size_bytes': self.size(),
+            'max_bytes': self.max_bytes,
+        }
+
+    def report(self):
+        """Print a cache hit/miss report"""
+        stats = self.summary()
+        print(f"Render cache: {stats['hits']} hits, {stats['misses']} misses "
+              f"({stats['hit_rate']:.0%} hit rate), {stats['evictions']} evictions, "
+              f"{stats['size_bytes'] / 1e6:.1f}/{stats['max_bytes'] / 1e6:.1f} MB")
+        for key, outcome in self.events:
+            print(f"  {outcome.upper():4s} {key}")
@@ -0,0 +1,387 @@
+"""
+Simulation Render Service
+Local asyncio HTTP service that renders any figure on request
+
+Endpoints (GET):
+    /figures                        figure names, libraries and formats
+    /figures/<name>.<format>        render one figure: png/webp/jpg/svg/pdf for
+                                    matplotlib figures, html/json for plotly
+        ?seed=7&resolution=80&quality=web&dpi=120
+    /metrics                        per-endpoint latency, coalescing and load
+    /health                         liveness
+
+Figures render in a bounded process pool. Identical concurrent requests
+(same figure, format and parameters) share one render. When max_pending
+distinct renders are already queued, new ones get 503 with Retry-After
+instead of piling up. resolution and dpi are capped (MAX_RESOLUTION,
+MAX_DPI) so one request cannot exhaust a worker's memory, and a pool whose
+worker died anyway is replaced. seed is a base seed like cli --seed, so a figure
+matches the one `python cli.py --seed N` renders; omitting it gives a
+random figure, which coalesced requests share.
+
+Usage:
+    python render_service.py --port 8050 --jobs 4
+    curl -o trend.png 'http://127.0.0.1:8050/figures/probability_trend.png?seed=3'
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import numpy as np
+import cli
+from raster_export import QUALITY_PROFILES
+
+CONTENT_TYPES = {
+    'png': 'image/png',
+    'webp': 'image/webp',
+    'jpg': 'image/jpeg',
+    'svg': 'image/svg+xml',
+    'pdf': 'application/pdf',
+    'html': 'text/html; charset=utf-8',
+    'json': 'application/json',
+}
+
+# Latencies kept per endpoint for the percentiles reported by /metrics
+LATENCY_WINDOW = 1024
+
+# Seconds a client may take to send its request line and headers
+REQUEST_TIMEOUT = 10.0
+MAX_HEADERS = 100
+
+# Largest resolution and dpi a request may ask for; quantum_field is a
+# resolution^3 volume, so it has its own cap
+MAX_RESOLUTION = 2048
+RESOLUTION_LIMITS = {'quantum_field': 200}
+MAX_DPI = 1200
+
+
+def render_bytes(name, fmt, quality=None, dpi=None, resolution=None, seed=None, tiles=None):
+    """Render one figure in fmt and return the file contents (runs in a worker)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = cli.output_paths(name, tmp, [fmt])[0]
+        cli.render_figure(name, [path], quality, dpi, resolution, seed, False, tiles)
+        with open(path, 'rb') as f:
+            return f.read()
+
+
+def endpoint_name(path):
+    """Metrics bucket of a request path: one per figure, whatever the format"""
+    if path in ('/health', '/metrics'):
+        return path
+    if path.rstrip('/') == '/figures':
+        return '/figures'
+    if path.startswith('/figures/'):
+        stem = path[len('/figures/'):].rpartition('.')[0]
+        if stem in cli.FIGURES:
+            return f'/figures/{stem}'
+    return 'other'
+
+
+def figure_formats(name):
+    """Formats a figure can be served in"""
+    kind = cli.FIGURES[name][3]
+    return cli.MATPLOTLIB_FORMATS if kind == 'matplotlib' else cli.PLOTLY_FORMATS
+
+
+class HTTPError(Exception):
+    """Error answered with status and a JSON {"error": message} body"""
+
+    def __init__(self, status, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+class EndpointMetrics:
+    """Request count, status codes, coalescing and recent latencies of one endpoint"""
+
+    def __init__(self):
+        self.requests = 0
+        self.coalesced = 0
+        self.statuses = {}
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def record(self, status, seconds, coalesced=False):
+        self.requests += 1
+        self.coalesced += coalesced
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.latencies.append(seconds)
+
+    def summary(self):
+        latencies = np.array(self.latencies) * 1e3
+        result = {
+            'requests': self.requests,
+            'coalesced': self.coalesced,
+            'statuses': {str(code): n for code, n in sorted(self.statuses.items())},
+        }
+        if len(latencies):
+            p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+            result['latency_ms'] = {'mean': latencies.mean(), 'p50': p50, 'p95': p95,
+                                    'p99': p99, 'max': latencies.max()}
+        return result
+
+
+class RenderService:
+    """asyncio HTTP front end for cli.render_figure over a process pool
+
+    jobs worker processes render at most jobs figures at a time; up to
+    max_pending distinct renders (default 4 x jobs) may be queued or running.
+    tiles is a tile cache directory for the tiled surfaces (see cli --tiles).
+    """
+
+    def __init__(self, host='127.0.0.1', port=8050, jobs=2, max_pending=None, tiles=None):
+        self.host = host
+        self.port = port
+        self.jobs = jobs or os.cpu_count() or 1
+        self.max_pending = max_pending or 4 * self.jobs
+        self.tiles = tiles
+        self.metrics = {}
+        self.rejected = 0
+        self.renders = 0
+        self.pool_restarts = 0
+        self._inflight = {}
+        self._pool = None
+        self._server = None
+        self._started = None
+
+    def _new_pool(self):
+        # Workers come from a fork server where available: workers forked
+        # from this process while it serves would inherit open client
+        # sockets and keep those connections from closing
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else None)
+        return ProcessPoolExecutor(max_workers=self.jobs, initializer=cli._init_worker,
+                                   mp_context=context)
+
+    async def _restart_pool(self, broken):
+        """Replace broken, the pool a dead worker (e.g. OOM-killed) left unusable"""
+        if self._pool is not broken:
+            return
+        self._pool = self._new_pool()
+        self.pool_restarts += 1
+        broken.shutdown(wait=False, cancel_futures=True)
+        await asyncio.get_running_loop().run_in_executor(self._pool, int)
+
+    async def start(self):
+        self._pool = self._new_pool()
+        # Start the workers before listening, so the first requests do not wait
+        await asyncio.get_running_loop().run_in_executor(self._pool, int)
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._started = time.time()
+        return self
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+
+    async def serve_forever(self):
+        await self.start()
+        print(f"Render service on http://{self.host}:{self.port} "
+              f"({self.jobs} workers, {self.max_pending} pending renders)")
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def render(self, name, fmt, params):
+        """Render bytes for (name, fmt, params), sharing identical in-flight renders
+
+        Returns (body, coalesced). Raises HTTPError 503 when the pending
+        render budget is exhausted. If a worker dies the pool is rebuilt: a
+        render not yet submitted goes to the new pool, one in progress fails.
+        """
+        key = (name, fmt) + tuple(sorted(params.items()))
+        future = self._inflight.get(key)
+        if future is not None:
+            return await asyncio.shield(future), True
+
+        if len(self._inflight) >= self.max_pending:
+            self.rejected += 1
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE,
+                            f"{len(self._inflight)} renders pending, retry later",
+                            {'Retry-After': '1'})
+
+        loop = asyncio.get_running_loop()
+        args = (render_bytes, name, fmt, params['quality'], params['dpi'],
+                params['resolution'], cli.figure_seed(name, params['seed']), self.tiles)
+        pool = self._pool
+        try:
+            future = loop.run_in_executor(pool, *args)
+        except BrokenProcessPool:
+            await self._restart_pool(pool)
+            pool = self._pool
+            future = loop.run_in_executor(pool, *args)
+        self._inflight[key] = future
+        self.renders += 1
+        try:
+            return await asyncio.shield(future), False
+        except BrokenProcessPool:
+            await self._restart_pool(pool)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def _figure_params(self, name, query):
+        """Validated render parameters from the query string"""
+        def integer(key, low=None, high=None):
+            if key not in query:
+                return None
+            try:
+                value = int(query[key][-1])
+            except ValueError:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, f"{key} must be an integer") from None
+            if low is not None and value < low:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, f"{key} must be at least {low}")
+            if high is not None and value > high:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, f"{key} must be at most {high}")
+            return value
+
+        quality = query.get('quality', [None])[-1]
+        if quality is not None and quality not in QUALITY_PROFILES:
+            raise HTTPError(HTTPStatus.BAD_REQUEST,
+                            f"quality must be one of {list(QUALITY_PROFILES)}")
+        resolution = integer('resolution', 2, RESOLUTION_LIMITS.get(name, MAX_RESOLUTION))
+        if resolution is not None and name not in cli.RESOLUTION_DATA:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"{name} has no resolution parameter")
+        return {'seed': integer('seed', 0), 'resolution': resolution,
+                'quality': quality, 'dpi': integer('dpi', 1, MAX_DPI)}
+
+    async def _route(self, path, query):
+        """Dispatch a GET request; returns (headers, body, coalesced)"""
+        if path == '/health':
+            return {}, {'status': 'ok'}, False
+        if path == '/metrics':
+            return {}, self.summary(), False
+        if path.rstrip('/') == '/figures':
+            figures = {name: {'library': kind, 'module': module, 'formats': list(figure_formats(name)),
+                              'resolution': name in cli.RESOLUTION_DATA}
+                       for name, (module, _, _, kind) in cli.FIGURES.items()}
+            return {}, figures, False
+
+        if path.startswith('/figures/'):
+            stem, _, fmt = path[len('/figures/'):].rpartition('.')
+            if stem not in cli.FIGURES:
+                raise HTTPError(HTTPStatus.NOT_FOUND, f"unknown figure '{stem or fmt}', see /figures")
+            if fmt not in figure_formats(stem):
+                raise HTTPError(HTTPStatus.NOT_FOUND,
+                                f"{stem} is served as {', '.join(figure_formats(stem))}")
+            params = self._figure_params(stem, query)
+            body, coalesced = await self.render(stem, fmt, params)
+            return {'Content-Type': CONTENT_TYPES[fmt]}, body, coalesced
+
+        raise HTTPError(HTTPStatus.NOT_FOUND, f"no endpoint {path}")
+
+    async def _read_request(self, reader):
+        """(method, target) of an HTTP/1.x request; headers are read and ignored"""
+        line = await reader.readline()
+        parts = line.decode('latin-1').split()
+        if len(parts) != 3 or not parts[2].startswith('HTTP/'):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "malformed request line")
+        for _ in range(MAX_HEADERS):
+            header = await reader.readline()
+            if header in (b'\r\n', b'\n', b''):
+                return parts[0], parts[1]
+        raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "too many headers")
+
+    async def _handle(self, reader, writer):
+        start = time.perf_counter()
+        endpoint, status, headers, body, coalesced = 'other', HTTPStatus.OK, {}, b'', False
+        try:
+            try:
+                method, target = await asyncio.wait_for(self._read_request(reader), REQUEST_TIMEOUT)
+                url = urlsplit(target)
+                path = unquote(url.path)
+                endpoint = endpoint_name(path)
+                if method != 'GET':
+                    raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "only GET is supported",
+                                    {'Allow': 'GET'})
+                headers, body, coalesced = await self._route(path, parse_qs(url.query))
+            except HTTPError as exc:
+                status, headers, body = exc.status, exc.headers, {'error': str(exc)}
+            except asyncio.TimeoutError:
+                status, body = HTTPStatus.REQUEST_TIMEOUT, {'error': 'request not received in time'}
+            except ValueError:
+                # StreamReader.readline raises ValueError for lines over its limit
+                status, body = HTTPStatus.BAD_REQUEST, {'error': 'request line or header too long'}
+            except Exception as exc:  # render failures surface as 500s, the service stays up
+                status, body = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': f'{type(exc).__name__}: {exc}'}
+
+            if not isinstance(body, bytes):
+                body = json.dumps(body, indent=2, default=float).encode()
+                headers.setdefault('Content-Type', CONTENT_TYPES['json'])
+            elapsed = time.perf_counter() - start
+            headers.update({'Content-Length': str(len(body)), 'Connection': 'close',
+                            'X-Render-Seconds': f'{elapsed:.4f}',
+                            'X-Coalesced': '1' if coalesced else '0'})
+            head = f'HTTP/1.1 {status.value} {status.phrase}\r\n' + ''.join(
+                f'{key}: {value}\r\n' for key, value in headers.items()) + '\r\n'
+            writer.write(head.encode('latin-1') + body)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.metrics.setdefault(endpoint, EndpointMetrics()).record(
+                status.value, time.perf_counter() - start, coalesced)
+            writer.close()
+
+    def summary(self):
+        """Service-wide load plus per-endpoint metrics as a dict"""
+        return {
+            'uptime_s': time.time() - self._started if self._started else 0.0,
+            'workers': self.jobs,
+            'max_pending': self.max_pending,
+            'pending': len(self._inflight),
+            'renders': self.renders,
+            'rejected': self.rejected,
+            'pool_restarts': self.pool_restarts,
+            'endpoints': {name: m.summary() for name, m in sorted(self.metrics.items())},
+        }
+
+    def report(self):
+        """Print per-endpoint request counts and latencies"""
+        stats = self.summary()
+        print(f"Render service: {stats['renders']} renders, {stats['rejected']} rejected")
+        for name, m in stats['endpoints'].items():
+            latency = m.get('latency_ms', {})
+            print(f"  {name:40s} {m['requests']:6d} req {m['coalesced']:5d} coalesced "
+                  f"p50 {latency.get('p50', 0):8.1f} ms  p95 {latency.get('p95', 0):8.1f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve simulation figures over HTTP')
+    parser.add_argument('--host', default='127.0.0.1', help='interface to bind')
+    parser.add_argument('--port', type=int, default=8050, help='port (0 = any free port)')
+    parser.add_argument('-j', '--jobs', type=int, default=2,
+                        help='render processes (0 = one per CPU)')
+    parser.add_argument('--max-pending', type=int, default=None,
+                        help='distinct renders queued before answering 503 (default 4 x jobs)')
+    parser.add_argument('--tiles', metavar='DIR', default=None,
+                        help='sample the surface figures from a tile pyramid cached in DIR')
+    args = parser.parse_args(argv)
+
+    service = RenderService(args.host, args.port, args.jobs or None, args.max_pending, args.tiles)
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    service.report()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
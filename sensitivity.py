@@ -0,0 +1,124 @@
+"""
+Parameter Sensitivity Engine
+Vectorised, chunked evaluation of closed-form models over parameter grids
+"""
+
+from itertools import product
+
+import numpy as np
+
+# Upper bound on the temporary array evaluated per chunk
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+
+REDUCERS = {
+    'mean': np.mean,
+    'max': np.max,
+    'min': np.min,
+    'std': np.std,
+    'sum': np.sum,
+}
+
+
+def bilinear_sensitivity(p1, p2):
+    """Default simulation-probability response to two normalised parameters"""
+    return 0.2 + 0.3 * p1 + 0.2 * p2 + 0.3 * p1 * p2
+
+
+def _broadcast_axes(axes, index):
+    """Reshape each axis, sliced by index, so the model sees an open grid"""
+    ndim = len(axes)
+    views = []
+    for i, values in enumerate(axes):
+        values = values[index[i]]
+        shape = [1] * ndim
+        shape[i] = len(values)
+        views.append(np.reshape(values, shape))
+    return views
+
+
+def _block_shape(shape, split_axes, dtype, max_chunk_bytes):
+    """Largest block of shape, cut only along split_axes, that fits max_chunk_bytes
+
+    Split axes are kept whole from the last one back; the first that does
+    not fit is cut and any before it get length 1. Raises ValueError when a
+    single entry along every split axis is already over the budget.
+    """
+    budget = max_chunk_bytes // np.dtype(dtype).itemsize
+    block = list(shape)
+    size = int(np.prod([n for i, n in enumerate(shape) if i not in split_axes]))
+    if size > budget:
+        raise ValueError(f"max_chunk_bytes={max_chunk_bytes} is too small: one block needs "
+                         f"{size * np.dtype(dtype).itemsize} bytes for the axes that "
+                         "cannot be split")
+    for axis in reversed(split_axes):
+        block[axis] = max(1, min(shape[axis], budget // max(size, 1)))
+        size *= block[axis]
+    return block
+
+
+def _blocks(shape, block):
+    """Index tuples of slices tiling shape with blocks of shape block"""
+    starts = [range(0, n, max(b, 1)) for n, b in zip(shape, block)]
+    for corner in product(*starts):
+        yield tuple(slice(start, min(start + b, n))
+                    for start, b, n in zip(corner, block, shape))
+
+
+def evaluate_grid(model, axes, chunk_size=None, dtype=np.float64, out=None,
+                  max_chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Evaluate model over the outer product of axes
+
+    model takes one array per axis and must broadcast (any NumPy expression
+    does). The result has shape (len(axes[0]), len(axes[1]), ...) and is
+    filled block by block, each at most max_chunk_bytes (or chunk_size rows
+    of the first axis), so only one block of temporaries exists at a time;
+    pass a np.memmap as out for grids larger than memory.
+    """
+    axes = [np.asarray(a, dtype=dtype) for a in axes]
+    shape = tuple(len(a) for a in axes)
+    if out is None:
+        out = np.empty(shape, dtype=dtype)
+    if chunk_size is None:
+        block = _block_shape(shape, tuple(range(len(shape))), dtype, max_chunk_bytes)
+    else:
+        block = (chunk_size,) + shape[1:]
+
+    for index in _blocks(shape, block):
+        values = model(*_broadcast_axes(axes, index))
+        out[index] = np.broadcast_to(values, tuple(s.stop - s.start for s in index))
+    return out
+
+
+def sensitivity_map(model, axes, keep=(0, 1), reduce='mean', chunk_size=None,
+                    dtype=np.float64, max_chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """2D heatmap of model over axes[keep], reducing every other axis
+
+    Returns an array of shape (len(axes[keep[1]]), len(axes[keep[0]])), i.e.
+    rows follow the second kept parameter as imshow expects. Higher
+    dimensional sweeps are reduced block by block over the kept axes with
+    reduce (a REDUCERS name or a callable taking ``axis=``), so the full
+    N-D grid is never materialised. The reduced axes are evaluated whole,
+    so a ValueError is raised if one kept point of them exceeds
+    max_chunk_bytes.
+    """
+    x_axis, y_axis = keep
+    axes = [np.asarray(a, dtype=dtype) for a in axes]
+    shape = tuple(len(a) for a in axes)
+    reducer = REDUCERS[reduce] if isinstance(reduce, str) else reduce
+    other = tuple(i for i in range(len(axes)) if i not in keep)
+
+    result = np.empty((shape[y_axis], shape[x_axis]), dtype=dtype)
+    if chunk_size is None:
+        block = _block_shape(shape, (x_axis, y_axis), dtype, max_chunk_bytes)
+    else:
+        block = list(shape)
+        block[x_axis] = chunk_size
+
+    for index in _blocks(shape, block):
+        values = np.broadcast_to(model(*_broadcast_axes(axes, index)),
+                                 tuple(s.stop - s.start for s in index))
+        if other:
+            values = reducer(values, axis=other)
+        # Remaining axes are (x, y) in index order; the map is indexed [y, x]
+        result[index[y_axis], index[x_axis]] = values.T if x_axis < y_axis else values
+    return result
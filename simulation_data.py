@@ -0,0 +1,635 @@
+"""
+Simulation Data Generation Layer
+Pure, seeded array generators for every figure builder
+
+Each function takes a numpy.random.Generator (where randomness is involved)
+plus size parameters and returns a dict of arrays. Nothing here touches the
+global numpy random state or any plotting library, so the data can be cached,
+profiled and generated in parallel independently of rendering.
+"""
+
+from functools import partial
+from statistics import NormalDist
+
+import numpy as np
+from correlation import CorrelationAccumulator, streaming_correlation
+from monte_carlo import beta_probability_sampler, run_monte_carlo, trend_sampler
+from projection import scatter_3d_data
+from sensitivity import bilinear_sensitivity, sensitivity_map
+
+
+def make_rng(rng=None, seed=None):
+    """Return rng unchanged, or a new Generator seeded with seed"""
+    if rng is not None:
+        return rng
+    return np.random.default_rng(seed)
+
+
+def factor_model_blocks(rng, loadings, n_rows, chunk_rows=100_000):
+    """Yield (rows, columns) blocks of a latent factor model
+
+    Column i is loadings[i] . f + noise with unit variance, where f are
+    independent standard normal factors, so corr(i, j) = loadings[i] .
+    loadings[j]. Rows are generated chunk by chunk, never all at once.
+    """
+    loadings = np.atleast_2d(np.asarray(loadings, dtype=float).T).T
+    noise_scale = np.sqrt(np.clip(1 - (loadings ** 2).sum(axis=1), 0, None))
+    for start in range(0, n_rows, chunk_rows):
+        n = min(chunk_rows, n_rows - start)
+        factors = rng.standard_normal((n, loadings.shape[1]))
+        yield factors @ loadings.T + rng.standard_normal((n, len(loadings))) * noise_scale
+
+
+def line_segments(start, end):
+    """Interleave segment endpoints with NaN breaks for a single line trace
+
+    Plotly draws ``[a0, b0, nan, a1, b1, nan, ...]`` as disjoint segments, so
+    any number of edges can share one trace instead of one trace per edge.
+    """
+    start = np.asarray(start, dtype=float)
+    return np.column_stack([start, end, np.full_like(start, np.nan)]).ravel()
+
+
+# ---------------------------------------------------------------------------
+# visualization.SimulationVisualizer
+# ---------------------------------------------------------------------------
+
+def dimension_probability_field(D, P):
+    """Simulation probability at dimensions D and complexity P (broadcasts)"""
+    return (0.1 +
+            0.3 * np.sin(D * 0.5) * np.cos(P * 3) +
+            0.2 * np.exp(-((D - 4)**2) / 8) +
+            0.15 * np.power(P, 2) * np.sin(D * 0.8))
+
+
+def dimension_probability_surface_data(n_dimensions=100, n_parameters=100):
+    """Dimension vs complexity probability surface"""
+    dimensions = np.linspace(1, 11, n_dimensions)
+    parameters = np.linspace(0.1, 1.0, n_parameters)
+    D, P = np.meshgrid(dimensions, parameters)
+
+    return {'D': D, 'P': P, 'Z': dimension_probability_field(D, P)}
+
+
+def particle_physics_data(rng, n_particles=1000, n_pdf=1000, n_dims=3, projection='perspective'):
+    """Particle cloud, energy spectrum, attribute correlations and PDF
+
+    With n_dims > 3 the particles live in n_dims dimensions and are shown
+    through the given projection (see projection.PROJECTION_METHODS); the
+    radius is measured in the full space.
+    """
+    if n_dims == 3:
+        x = rng.normal(0, 1, n_particles)
+        y = rng.normal(0, 1, n_particles)
+        z = rng.normal(0, 1, n_particles)
+        radius = np.sqrt(x**2 + y**2 + z**2)
+    else:
+        cloud = scatter_3d_data(rng.normal(0, 1, (n_particles, n_dims)), projection)
+        x, y, z, radius = cloud['x'], cloud['y'], cloud['z'], cloud['colors']
+    energies = rng.exponential(2, n_particles)
+
+    x_pdf = np.linspace(-3, 3, n_pdf)
+    y_pdf = 0.3 * np.exp(-0.5 * (x_pdf - 1)**2) + 0.2 * np.exp(-0.5 * (x_pdf + 1)**2)
+
+    params = ['X', 'Y', 'Z', 'Radius', 'Energy']
+    acc = CorrelationAccumulator(params).update(np.column_stack([x, y, z, radius, energies]))
+
+    return {
+        'x': x,
+        'y': y,
+        'z': z,
+        'colors': radius,
+        'energies': energies,
+        'correlation': acc.correlation(),
+        'params': params,
+        'x_pdf': x_pdf,
+        'y_pdf': y_pdf,
+    }
+
+
+def probability_trend_data(rng, n_time=1000, n_scatter=500, sensitivity_size=20,
+                           sensitivity_model=bilinear_sensitivity, confidence=0.95,
+                           mc_tolerance=0.002, mc_jobs=1):
+    """Time series, Monte Carlo results, dimension scatter and sensitivity grid
+
+    The histogram and the confidence band come from run_monte_carlo: the
+    probability prior is sampled until its mean's CI is mc_tolerance wide,
+    and the band is the confidence-level spread of simulated trajectories.
+    sensitivity_model is any broadcasting f(param1, param2); the grid is
+    evaluated vectorised and in chunks, so large sizes stay cheap.
+    """
+    time = np.linspace(0, 100, n_time)
+    base_prob = 0.4 + 0.1 * np.sin(0.1 * time) + 0.05 * np.cos(0.05 * time)
+
+    dimensions = rng.uniform(1, 11, n_scatter)
+    prob_dim = (0.3 + 0.05 * dimensions + 0.02 * dimensions**1.5 +
+                rng.normal(0, 0.05, n_scatter))
+
+    # Quadratic regression through the dimension scatter
+    x_reg = np.linspace(1, 11, 100)
+    trend = np.poly1d(np.polyfit(dimensions, prob_dim, 2))(x_reg)
+
+    param1 = np.linspace(0.1, 1.0, sensitivity_size)
+    param2 = np.linspace(0.1, 1.0, sensitivity_size)
+    Z_sensitivity = sensitivity_map(sensitivity_model, [param1, param2])
+
+    prob_with_noise = base_prob + rng.normal(0, 0.02, n_time)
+    prior_seed, trend_seed = rng.integers(0, 2**63, 2)
+    prior = run_monte_carlo(beta_probability_sampler, tolerance=mc_tolerance,
+                            confidence=confidence, seed=int(prior_seed), jobs=mc_jobs,
+                            bins=50, hist_range=(0.1, 0.9))
+    trajectories = run_monte_carlo(partial(trend_sampler, time=time), batch_size=200,
+                                   tolerance=2 * mc_tolerance, confidence=confidence,
+                                   seed=int(trend_seed), jobs=mc_jobs)
+    spread = NormalDist().inv_cdf(0.5 + confidence / 2) * trajectories['std']
+
+    return {
+        'time': time,
+        'base_prob': base_prob,
+        'prob_with_noise': prob_with_noise,
+        'prob_upper': trajectories['mean'] + spread,
+        'prob_lower': trajectories['mean'] - spread,
+        'prob_hist': (prior['hist_density'], prior['hist_edges']),
+        'monte_carlo': {
+            'prior_samples': prior['n_samples'],
+            'prior_mean': prior['mean'],
+            'prior_ci': (prior['ci_low'], prior['ci_high']),
+            'trajectories': trajectories['n_samples'],
+            'converged': prior['converged'] and trajectories['converged'],
+            'confidence': confidence,
+        },
+        'dimensions': dimensions,
+        'prob_dim': prob_dim,
+        'x_reg': x_reg,
+        'trend': trend,
+        'param1': param1,
+        'param2': param2,
+        'Z_sensitivity': Z_sensitivity,
+    }
+
+
+def hypershell_points(rng, n_points=2000, n_dims=4, radius=2.0, thickness=0.5):
+    """(n_points, n_dims) noisy spherical shell around the origin"""
+    directions = rng.standard_normal((n_points, n_dims))
+    directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+    return directions * (radius + thickness * rng.standard_normal(n_points))[:, None]
+
+
+def interactive_3d_data(rng, n_points=2000, n_dims=3, projection='perspective'):
+    """Noisy spherical shell of points coloured by radius
+
+    With n_dims > 3 the shell is n_dims-dimensional and shown through the
+    given projection (see projection.PROJECTION_METHODS).
+    """
+    if n_dims != 3:
+        return scatter_3d_data(hypershell_points(rng, n_points, n_dims), projection)
+    theta = rng.uniform(0, 2*np.pi, n_points)
+    phi = rng.uniform(0, np.pi, n_points)
+    r = 2 + 0.5 * rng.standard_normal(n_points)
+
+    x = r * np.sin(phi) * np.cos(theta)
+    y = r * np.sin(phi) * np.sin(theta)
+    z = r * np.cos(phi)
+
+    return {'x': x, 'y': y, 'z': z, 'colors': np.sqrt(x**2 + y**2 + z**2)}
+
+
+def correlation_matrix_data(rng, n_columns=8, n_rows=200_000, jobs=1):
+    """Physics parameter correlations measured on simulated observations
+
+    Observations come from a one-factor model whose loadings plant the
+    realistic correlations below, and the matrix is accumulated in one
+    streaming pass over the rows.
+    """
+    loadings = rng.uniform(-0.3, 0.3, n_columns)
+    if n_columns >= 7:
+        loadings[4] = 0.95   # Probability
+        loadings[0] = 0.65   # Dimension-Probability correlation ~0.6
+        loadings[2] = 0.75   # Quantization-Probability correlation ~0.7
+        loadings[3] = 0.55   # Symmetry-Probability correlation ~0.5
+        loadings[6] = 0.85   # Information-Probability correlation ~0.8
+
+    acc = streaming_correlation(factor_model_blocks(rng, loadings, n_rows),
+                                range(n_columns), jobs)
+    return {'correlation': acc.correlation(), 'n_rows': acc.count}
+
+
+# ---------------------------------------------------------------------------
+# futuristic_dashboard.FuturisticDashboard
+# ---------------------------------------------------------------------------
+
+def neural_network_data(rng, layers=(20, 30, 40, 50, 60, 50, 40, 30, 20, 10),
+                        connection_probability=0.3):
+    """Layered neuron positions, activations and sampled connections
+
+    Neurons are stored as flat arrays ordered layer by layer; ``offsets[i]``
+    is the index of the first neuron of layer i. Connections are a
+    (2, n_connections) array of source/target neuron indices.
+    """
+    layers = np.asarray(layers)
+    offsets = np.concatenate([[0], np.cumsum(layers)])
+
+    layer_index = np.repeat(np.arange(len(layers)), layers)
+    neuron_index = np.arange(offsets[-1]) - offsets[layer_index]
+    # Neurons spread evenly over [-5, 5]; single-neuron layers sit at 0
+    spacing = np.where(layers > 1, 10 / np.maximum(layers - 1, 1), 0)[layer_index]
+    y = np.where(layers[layer_index] > 1, -5 + neuron_index * spacing, 0.0)
+
+    sources, targets = [], []
+    for i in range(len(layers) - 1):
+        mask = rng.random((layers[i], layers[i+1])) < connection_probability
+        j, k = np.nonzero(mask)
+        sources.append(offsets[i] + j)
+        targets.append(offsets[i+1] + k)
+
+    return {
+        'x': layer_index * 2.0,
+        'y': y,
+        'layer': layer_index,
+        'index': neuron_index,
+        'activation': rng.random(offsets[-1]),
+        'offsets': offsets,
+        'connections': np.vstack([np.concatenate(sources or [[]]),
+                                  np.concatenate(targets or [[]])]).astype(int),
+    }
+
+
+def quantum_superposition_data(resolution=200):
+    """Probability density of three superposed wave functions"""
+    x = np.linspace(-5, 5, resolution)
+    y = np.linspace(-5, 5, resolution)
+    X, Y = np.meshgrid(x, y)
+
+    Z1 = np.exp(-(X**2 + Y**2) / 4) * np.cos(2*X) * np.cos(2*Y)
+    Z2 = np.exp(-((X-1)**2 + (Y-1)**2) / 3) * np.sin(3*X) * np.cos(3*Y)
+    Z3 = np.exp(-((X+1)**2 + (Y+1)**2) / 3) * np.cos(3*X) * np.sin(3*Y)
+
+    return {'x': x, 'y': y, 'probability': np.abs(Z1 + Z2 + Z3)**2}
+
+
+# Each panel of the dimensional matrix dashboard has its own data function
+# taking a Generator and its size parameters, so panels can be computed,
+# cached and recomputed independently (see panel_dashboard.PanelDashboard).
+
+def dimensional_flow_data(rng, n_flow=100):
+    """Damped spiral through three dimensions (rng unused)"""
+    t = np.linspace(0, 10, n_flow)
+    return {'flow': (np.sin(t) * np.exp(-t/10), np.cos(t) * np.exp(-t/10), t * 0.1)}
+
+
+def entanglement_correlation_data(rng, matrix_size=10, n_observations=50_000):
+    """Dimension correlations measured on two-factor simulated observations"""
+    loadings = rng.uniform(-1, 1, (matrix_size, 2))
+    loadings *= 0.95 / np.maximum(np.linalg.norm(loadings, axis=1, keepdims=True), 0.95)
+    data_corr = streaming_correlation(factor_model_blocks(rng, loadings, n_observations),
+                                      range(matrix_size)).correlation()
+    return {'correlation': data_corr}
+
+
+def simulation_confidence_data(rng, n_prob=100):
+    """Smooth probability curve over the dimension axis (rng unused)"""
+    x_prob = np.linspace(1, 11, n_prob)
+    return {'x_prob': x_prob,
+            'prob': 0.2 + 0.3*np.sin(x_prob*0.5) + 0.2*np.exp(-((x_prob-5)**2)/10)}
+
+
+def temporal_analysis_data(rng, n_temporal=1000):
+    """Decaying oscillation with measurement noise"""
+    time = np.linspace(0, 100, n_temporal)
+    return {'time': time,
+            'signal': np.sin(0.1*time) * np.exp(-time/100) + rng.normal(0, 0.1, n_temporal)}
+
+
+def energy_distribution_data(rng):
+    """Fixed energy levels (rng unused)"""
+    return {'energy_levels': np.array([10, 25, 40, 30, 50, 45, 35, 20, 15, 25])}
+
+
+def pattern_recognition_data(rng, n_pattern=200):
+    """Noisy paraboloid point cloud"""
+    x_pat = rng.normal(0, 1, n_pattern)
+    y_pat = rng.normal(0, 1, n_pattern)
+    return {'pattern': (x_pat, y_pat, x_pat**2 + y_pat**2 + rng.normal(0, 0.5, n_pattern))}
+
+
+def information_entropy_data(rng, matrix_size=10):
+    """Exponentially distributed entropy matrix"""
+    return {'entropy': rng.exponential(2, (matrix_size, matrix_size))}
+
+
+def reality_signature_data(rng, n_signature=100):
+    """Gamma-distributed signature series"""
+    return {'signature': rng.gamma(2, 2, n_signature)}
+
+
+def reality_surface_data(rng, surface_size=50):
+    """Damped sine-cosine surface (rng unused)"""
+    x_surf, y_surf = np.meshgrid(np.linspace(-2, 2, surface_size),
+                                 np.linspace(-2, 2, surface_size))
+    return {'surface': np.sin(x_surf) * np.cos(y_surf) * np.exp(-(x_surf**2 + y_surf**2)/2)}
+
+
+# Dimensional matrix panels in layout order: name -> (data function, size parameters)
+DIMENSIONAL_PANELS = {
+    'flow': (dimensional_flow_data, ('n_flow',)),
+    'entanglement': (entanglement_correlation_data, ('matrix_size', 'n_observations')),
+    'confidence': (simulation_confidence_data, ()),
+    'temporal': (temporal_analysis_data, ('n_temporal',)),
+    'energy': (energy_distribution_data, ()),
+    'pattern': (pattern_recognition_data, ('n_pattern',)),
+    'entropy': (information_entropy_data, ('matrix_size',)),
+    'signature': (reality_signature_data, ('n_signature',)),
+    'surface': (reality_surface_data, ('surface_size',)),
+}
+
+
+def panel_seeds(rng, n_panels):
+    """One independent seed per panel, drawn from rng"""
+    return [int(seed) for seed in rng.integers(0, 2**63, n_panels)]
+
+
+def dimensional_matrix_data(rng, n_flow=100, n_temporal=1000, n_pattern=200,
+                            matrix_size=10, n_signature=100, surface_size=50,
+                            n_observations=50_000):
+    """Data for the nine panels of the dimensional matrix dashboard
+
+    Every panel draws from its own Generator seeded by panel_seeds, so a
+    panel's data does not depend on the sizes of the others.
+    """
+    sizes = {'n_flow': n_flow, 'n_temporal': n_temporal, 'n_pattern': n_pattern,
+             'matrix_size': matrix_size, 'n_signature': n_signature,
+             'surface_size': surface_size, 'n_observations': n_observations}
+    data = {}
+    seeds = panel_seeds(rng, len(DIMENSIONAL_PANELS))
+    for (func, params), seed in zip(DIMENSIONAL_PANELS.values(), seeds):
+        data.update(func(np.random.default_rng(seed), **{name: sizes[name] for name in params}))
+    return data
+
+
+def probability_landscape_field(X, Y):
+    """Noise-free multi-modal probability landscape (broadcasts)"""
+    return (0.3 * np.exp(-((X-1)**2 + (Y-0.5)**2) / 0.5) +
+            0.25 * np.exp(-((X+1)**2 + (Y+1)**2) / 0.7) +
+            0.2 * np.exp(-((X-0.5)**2 + (Y+1.5)**2) / 0.4) +
+            0.15 * np.sin(2*X) * np.cos(2*Y) * np.exp(-(X**2 + Y**2)/4))
+
+
+def probability_landscape_data(rng, resolution=100):
+    """Multi-modal probability landscape with a small noise floor"""
+    x = np.linspace(-3, 3, resolution)
+    y = np.linspace(-3, 3, resolution)
+    X, Y = np.meshgrid(x, y)
+
+    Z = probability_landscape_field(X, Y) + 0.1 * rng.random((resolution, resolution)) * 0.1
+
+    return {'x': x, 'y': y, 'Z': Z}
+
+
+# ---------------------------------------------------------------------------
+# cyberpunk_dashboard
+# ---------------------------------------------------------------------------
+
+def neural_matrix_data(rng, layers=(50, 60, 70, 60, 50), connection_probability=0.15):
+    """Spiral neuron layers with sparse inter-layer edges
+
+    Returns a list with one dict per layer holding neuron coordinates and the
+    edges connecting it to the previous layer as a (6, n_edges) array of
+    x0, x1, y0, y1, z0, z1 rows. Edges are sampled with a single Bernoulli
+    mask per layer pair, so cost scales with the number of kept edges.
+    """
+    result = []
+    for layer_idx, n_neurons in enumerate(layers):
+        theta = np.linspace(0, 2*np.pi, n_neurons, endpoint=False)
+        radius = 2 + layer_idx * 1.5  # Spiral outward
+
+        x = radius * np.cos(theta) + layer_idx * 3
+        y = radius * np.sin(theta)
+        z = rng.random(n_neurons)  # Activation probability
+
+        edges = np.empty((6, 0))
+        if layer_idx > 0:
+            prev = result[-1]
+            # Sparse connections: rows index this layer, columns the previous one
+            mask = rng.random((n_neurons, len(prev['x']))) < connection_probability
+            i, j = np.nonzero(mask)
+            edges = np.vstack([prev['x'][j], x[i], prev['y'][j], y[i],
+                               rng.random(len(i)), z[i]])
+
+        result.append({'x': x, 'y': y, 'z': z, 'edges': edges})
+
+    return result
+
+
+def holographic_field(X, Y):
+    """Noise-free holographic interference pattern (broadcasts)"""
+    return (np.sin(X*2) * np.cos(Y*2) * np.exp(-(X**2 + Y**2)/8) +
+            0.5 * np.sin(X*Y) * np.exp(-(X**2 + Y**2)/12) +
+            0.3 * np.cos(np.sqrt(X**2 + Y**2)*3) * np.exp(-(X**2 + Y**2)/10))
+
+
+def holographic_data(rng, resolution=100, n_streams=10, stream_size=50):
+    """Interference field with smoothed quantum noise plus particle streams"""
+    from scipy.ndimage import gaussian_filter
+
+    x = np.linspace(-4, 4, resolution)
+    y = np.linspace(-4, 4, resolution)
+    X, Y = np.meshgrid(x, y)
+
+    Z = holographic_field(X, Y)
+
+    # Add quantum fluctuations
+    quantum_noise = rng.random(Z.shape) * 0.1
+    Z = Z + gaussian_filter(quantum_noise, sigma=1)
+
+    return {'x': x, 'y': y, 'Z': Z, 'streams': holographic_streams(rng, n_streams, stream_size)}
+
+
+def holographic_streams(rng, n_streams=10, stream_size=50):
+    """Particle streams scattered over the holographic field"""
+    return [{
+        'x': rng.uniform(-4, 4, stream_size),
+        'y': rng.uniform(-4, 4, stream_size),
+        'size': rng.uniform(2, 8, stream_size),
+    } for _ in range(n_streams)]
+
+
+def quantum_field_slab(axis, start, stop, out=None, work=None):
+    """Evaluate the quantum field for slab axis[start:stop] of the cubic grid
+
+    Uses broadcast (open-grid) coordinates and in-place float32 arithmetic,
+    so only two (stop - start, n, n) buffers are live per slab. out and
+    work may be passed in to reuse buffers across slabs.
+    """
+    n = len(axis)
+    X = axis[start:stop, None, None]
+    Y = axis[None, :, None]
+    Z = axis[None, None, :]
+    shape = (stop - start, n, n)
+    field = np.empty(shape, dtype=axis.dtype) if out is None else out[:shape[0]]
+    tmp = np.empty(shape, dtype=axis.dtype) if work is None else work[:shape[0]]
+
+    # R = sqrt(X^2 + Y^2 + Z^2)
+    np.add(X*X + Y*Y, Z*Z, out=tmp)
+    np.sqrt(tmp, out=tmp)
+
+    # sin(3R) * exp(-R/2)
+    np.multiply(tmp, 3, out=field)
+    np.sin(field, out=field)
+    tmp *= -0.5
+    np.exp(tmp, out=tmp)
+    field *= tmp
+
+    # * cos(XYZ)
+    np.multiply(X*Y, Z, out=tmp)
+    np.cos(tmp, out=tmp)
+    field *= tmp
+
+    # * (1 + 0.1 sin(5X) sin(5Y) sin(5Z))
+    np.multiply(np.sin(5*X) * np.sin(5*Y), np.sin(5*Z), out=tmp)
+    tmp *= 0.1
+    tmp += 1
+    field *= tmp
+
+    return field
+
+
+def quantum_field_paths(n_paths=5, path_length=100):
+    """Decaying spiral particle paths through the quantum field"""
+    t = np.linspace(0, 10, path_length)
+    return [{
+        'x': 1.5 * np.sin(t + i) * np.exp(-t/10),
+        'y': 1.5 * np.cos(t + i) * np.exp(-t/10),
+        'z': 1.5 * np.sin(2*t + i) * np.exp(-t/10),
+        'color': np.sin(t),
+    } for i in range(n_paths)]
+
+
+def quantum_field_data(resolution=50, n_paths=5, path_length=100, chunk_size=16,
+                       dtype=np.float32):
+    """3D quantum field values on a cubic grid plus particle paths
+
+    The field is evaluated chunk_size slabs at a time into a single
+    (resolution,)*3 array indexed [x, y, z]; 'axis' holds the shared
+    coordinate vector.
+    """
+    axis = np.linspace(-3, 3, resolution, dtype=dtype)
+    field = np.empty((resolution,) * 3, dtype=dtype)
+    work = np.empty((min(chunk_size, resolution), resolution, resolution), dtype=dtype)
+
+    for start in range(0, resolution, chunk_size):
+        stop = min(start + chunk_size, resolution)
+        quantum_field_slab(axis, start, stop, out=field[start:stop], work=work)
+
+    return {'axis': axis, 'field': field, 'paths': quantum_field_paths(n_paths, path_length)}
+
+
+def quantum_field_mesh(resolution=50, levels=(0.1, 0.2, 0.3, 0.4, 0.5), n_paths=5,
+                       path_length=100, chunk_size=32, dtype=np.float32):
+    """Pre-extracted isosurface triangles of the quantum field
+
+    Runs marching cubes slab by slab (with one slice of overlap), so only
+    one slab of the volume is ever held in memory and the output grows with
+    the surface area rather than the volume. Requires scikit-image.
+    """
+    from skimage.measure import marching_cubes
+
+    axis = np.linspace(-3, 3, resolution, dtype=dtype)
+    spacing = float(axis[1] - axis[0]) if resolution > 1 else 1.0
+    slab_size = min(chunk_size + 1, resolution)
+    out = np.empty((slab_size, resolution, resolution), dtype=dtype)
+    work = np.empty_like(out)
+
+    vertices, faces, intensity = [], [], []
+    n_vertices = 0
+    for start in range(0, resolution - 1, chunk_size):
+        stop = min(start + chunk_size + 1, resolution)
+        slab = quantum_field_slab(axis, start, stop, out=out, work=work)
+        for level in levels:
+            if not slab.min() < level < slab.max():
+                continue
+            verts, tris, _, _ = marching_cubes(slab, level=level, spacing=(spacing,) * 3)
+            verts[:, 0] += start * spacing
+            vertices.append(verts + axis[0])
+            faces.append(tris + n_vertices)
+            intensity.append(np.full(len(verts), level, dtype=dtype))
+            n_vertices += len(verts)
+
+    return {
+        'vertices': np.concatenate(vertices) if vertices else np.empty((0, 3), dtype=dtype),
+        'faces': np.concatenate(faces) if faces else np.empty((0, 3), dtype=int),
+        'intensity': np.concatenate(intensity) if intensity else np.empty(0, dtype=dtype),
+        'paths': quantum_field_paths(n_paths, path_length),
+    }
+
+
+QUANTUM_FIELD_MODES = ('isosurface', 'mesh')
+
+# From this resolution on, the isosurface triangles are smaller than the volume
+MESH_MIN_RESOLUTION = 40
+
+
+def quantum_field_input(resolution=50, mode=None):
+    """Quantum field data for create_quantum_field in the given mode
+
+    'isosurface' is the whole volume (quantum_field_data): n^3 values for
+    each of x, y, z and value, which plotly.js contours in the browser, so
+    levels can be restyled there. 'mesh' is the triangles of the fixed
+    levels (quantum_field_mesh): extracted once on the server, growing
+    with the surface area instead of the volume. mode=None picks 'mesh'
+    from MESH_MIN_RESOLUTION up.
+    """
+    if mode is None:
+        mode = 'mesh' if resolution >= MESH_MIN_RESOLUTION else 'isosurface'
+    if mode not in QUANTUM_FIELD_MODES:
+        raise ValueError(f"Unknown quantum field mode '{mode}', expected one of {QUANTUM_FIELD_MODES}")
+    if mode == 'mesh':
+        return quantum_field_mesh(resolution)
+    return quantum_field_data(resolution)
+
+
+def reality_signals(rng, time_points):
+    """Evaluate the four tracker signals at the given time points"""
+    n_points = len(time_points)
+
+    prob_signal = (0.5 +
+                   0.2 * np.sin(0.1 * time_points) +
+                   0.15 * np.cos(0.05 * time_points) +
+                   0.1 * np.sin(0.3 * time_points) * np.exp(-time_points/100) +
+                   0.05 * rng.random(n_points))
+
+    dim_stability = 0.8 + 0.15 * np.sin(0.08 * time_points) + 0.05 * rng.random(n_points)
+
+    quantum_coh = 0.7 + 0.2 * np.cos(0.06 * time_points) + 0.1 * rng.random(n_points)
+
+    reality_sig = (0.6 +
+                  0.25 * np.sin(0.07 * time_points + np.pi/4) +
+                  0.15 * np.cos(0.12 * time_points) +
+                  0.1 * rng.random(n_points))
+
+    return {
+        'time': time_points,
+        'prob_signal': prob_signal,
+        'dim_stability': dim_stability,
+        'quantum_coh': quantum_coh,
+        'reality_sig': reality_sig,
+    }
+
+
+def reality_tracker_data(rng, n_points=1000, duration=100):
+    """Probability, stability, coherence and signature time series"""
+    data = reality_signals(rng, np.linspace(0, duration, n_points))
+    data['cumulative_deviation'] = np.cumsum(data['prob_signal'] - 0.5)
+    return data
+
+
+def reality_tracker_samples(rng, dt=0.1, batch_size=1, start=0.0):
+    """Endless generator of tracker samples, batch_size time steps at a time
+
+    Yields dicts shaped like reality_signals(); intended as a live feed for
+    reality_stream.RealityTrackerStream.
+    """
+    step = 0
+    while True:
+        time_points = start + dt * np.arange(step, step + batch_size)
+        yield reality_signals(rng, time_points)
+        step += batch_size
@@ -0,0 +1,368 @@
+"""
+Surface Tile Pyramid
+Multi-resolution, disk-cached evaluation of the probability surfaces
+
+The dimension surface, probability landscape and holographic field are
+closed-form functions of two parameters, so any part of them can be sampled
+at any density. A SurfacePyramid splits the parameter domain into square
+tiles at levels of doubling resolution (level L has 2**L x 2**L tiles of
+tile_size + 1 samples, adjacent tiles sharing their edge samples), evaluates
+a tile the first time it is needed and keeps it in a small in-memory LRU and
+as an .npy file on disk. view() picks the coarsest level that still shows
+max_samples samples across the viewport, so a zoomed-out view of a 4096x4096
+surface costs as much as the full 100x100 grid and zooming in only evaluates
+the tiles that become visible:
+
+    pyramid = SurfacePyramid('probability_landscape', max_resolution=8192)
+    fig = dashboard.create_advanced_probability_landscape(
+        data=pyramid.view_data(x_range=(0.5, 1.5), y_range=(0, 1)))
+"""
+
+import hashlib
+import inspect
+import json
+import math
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import simulation_data as sd
+
+DEFAULT_TILE_SIZE = 256
+
+# Tiles kept in memory per pyramid (256 float32 tiles of 257^2 are ~68 MB)
+DEFAULT_MEMORY_TILES = 256
+
+# Samples per hash-noise kernel radius, in units of the smoothing sigma
+NOISE_TRUNCATE = 4.0
+
+
+def lattice_noise(seed, level, rows, cols):
+    """Uniform [0, 1) noise that is a pure function of the global sample index
+
+    Unlike a Generator stream, the value at (row, col) does not depend on
+    which tile asked for it, so neighbouring tiles (and their halos) agree
+    and the noise is seamless across tile edges.
+    """
+    rows = np.asarray(rows, dtype=np.int64).astype(np.uint64)[:, None]
+    cols = np.asarray(cols, dtype=np.int64).astype(np.uint64)[None, :]
+    h = (rows * np.uint64(0x9E3779B97F4A7C15)) ^ (cols * np.uint64(0xC2B2AE3D27D4EB4F))
+    h ^= np.uint64((seed * 0x165667B19E3779F9 + level * 0x27D4EB2F165667C5) % 2**64)
+    # splitmix64 finaliser
+    h ^= h >> np.uint64(30)
+    h *= np.uint64(0xBF58476D1CE4E5B9)
+    h ^= h >> np.uint64(27)
+    h *= np.uint64(0x94D049BB133111EB)
+    h ^= h >> np.uint64(31)
+    return (h >> np.uint64(11)).astype(np.float64) * 2.0 ** -53
+
+
+def _dimension_surface_data(view, rng=None):
+    D, P = np.meshgrid(view['x'], view['y'])
+    return {'D': D, 'P': P, 'Z': view['Z']}
+
+
+def _landscape_data(view, rng=None):
+    return {'x': view['x'], 'y': view['y'], 'Z': view['Z']}
+
+
+def _holographic_data(view, rng=None):
+    """Field view plus the particle streams (drawn from rng) inside the viewport"""
+    streams = []
+    if rng is not None:
+        for stream in sd.holographic_streams(rng):
+            inside = ((stream['x'] >= view['x'][0]) & (stream['x'] <= view['x'][-1]) &
+                      (stream['y'] >= view['y'][0]) & (stream['y'] <= view['y'][-1]))
+            streams.append({key: values[inside] for key, values in stream.items()})
+    return {'x': view['x'], 'y': view['y'], 'Z': view['Z'], 'streams': streams}
+
+
+# Tiled surfaces by figure name: the noise-free field, its domain, the
+# amplitude (and smoothing, in samples) of the noise floor the full-grid
+# data functions add, and how a view becomes the builder's data dict
+SURFACES = {
+    'dimension_surface': {
+        'field': sd.dimension_probability_field,
+        'x_range': (1.0, 11.0),
+        'y_range': (0.1, 1.0),
+        'noise': 0.0,
+        'noise_sigma': 0,
+        'data': _dimension_surface_data,
+    },
+    'probability_landscape': {
+        'field': sd.probability_landscape_field,
+        'x_range': (-3.0, 3.0),
+        'y_range': (-3.0, 3.0),
+        'noise': 0.01,
+        'noise_sigma': 0,
+        'data': _landscape_data,
+    },
+    'holographic_dimensions': {
+        'field': sd.holographic_field,
+        'x_range': (-4.0, 4.0),
+        'y_range': (-4.0, 4.0),
+        'noise': 0.1,
+        'noise_sigma': 1,
+        'data': _holographic_data,
+    },
+}
+
+
+def _index_range(low, high, start, step, n):
+    """Sample indices [i0, i1] of a regular axis covering [low, high]"""
+    i0 = int(math.floor((low - start) / step + 1e-9))
+    i1 = int(math.ceil((high - start) / step - 1e-9))
+    return max(0, min(i0, n - 1)), max(0, min(i1, n - 1))
+
+
+def _interpolation(axis, points):
+    """(lower sample index, weight of the upper sample) of points on a regular axis"""
+    if len(axis) < 2:
+        return np.zeros(len(points), dtype=int), np.zeros(len(points))
+    position = (points - axis[0]) / (axis[1] - axis[0])
+    lower = np.clip(np.floor(position).astype(int), 0, len(axis) - 2)
+    return lower, np.clip(position - lower, 0.0, 1.0)
+
+
+def resample(view, samples):
+    """A view() regridded to samples x samples points over the same ranges
+
+    Values are bilinearly interpolated, so x and y are evenly spaced from
+    the first to the last sample of the view, like the full-grid data
+    functions' axes.
+    """
+    x = np.linspace(view['x'][0], view['x'][-1], samples)
+    y = np.linspace(view['y'][0], view['y'][-1], samples)
+    Z = np.asarray(view['Z'], dtype=np.float64)
+    if Z.shape[1] > 1:
+        i, w = _interpolation(view['x'], x)
+        Z = Z[:, i] * (1 - w) + Z[:, i + 1] * w
+    else:
+        Z = np.repeat(Z, samples, axis=1)
+    if Z.shape[0] > 1:
+        j, w = _interpolation(view['y'], y)
+        Z = Z[j] * (1 - w[:, None]) + Z[j + 1] * w[:, None]
+    else:
+        Z = np.repeat(Z, samples, axis=0)
+    return dict(view, x=x.astype(view['x'].dtype), y=y.astype(view['y'].dtype),
+                Z=Z.astype(view['Z'].dtype))
+
+
+class SurfacePyramid:
+    """Multi-resolution tile pyramid of one SURFACES entry
+
+    The finest level has at least max_resolution samples per axis. Tiles
+    live in cache_dir/<surface>-<digest>/<level>/<row>_<col>.npy, where the
+    digest covers the field's source, the noise parameters, seed, tile size
+    and dtype, so editing the surface function never serves stale tiles.
+    Pass cache_dir=None to keep tiles in memory only. Safe to share between
+    threads.
+    """
+
+    def __init__(self, surface, max_resolution=4096, tile_size=DEFAULT_TILE_SIZE,
+                 cache_dir='.tile_cache', seed=0, dtype=np.float32,
+                 memory_tiles=DEFAULT_MEMORY_TILES):
+        if surface not in SURFACES:
+            raise ValueError(f"Unknown surface '{surface}', expected one of {list(SURFACES)}")
+        self.surface = surface
+        self.spec = SURFACES[surface]
+        self.tile_size = tile_size
+        self.seed = seed
+        self.dtype = np.dtype(dtype)
+        self.max_level = max(0, math.ceil(math.log2(max(max_resolution - 1, 1) / tile_size)))
+        self.memory_tiles = memory_tiles
+        self.stats = {'memory': 0, 'disk': 0, 'computed': 0}
+        self._tiles = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.cache_dir = None
+        if cache_dir is not None:
+            self.cache_dir = os.path.join(cache_dir, f'{surface}-{self._digest()}')
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _digest(self):
+        source = inspect.getsource(self.spec['field'])
+        payload = json.dumps({
+            'field': hashlib.sha256(source.encode()).hexdigest(),
+            'domain': [self.spec['x_range'], self.spec['y_range']],
+            'noise': [self.spec['noise'], self.spec['noise_sigma']],
+            'seed': self.seed,
+            'tile_size': self.tile_size,
+            'dtype': self.dtype.str,
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+    def samples(self, level):
+        """Samples per axis at level"""
+        return self.tile_size * 2 ** level + 1
+
+    def axes(self, level):
+        """(x, y) sample coordinates of the whole domain at level"""
+        n = self.samples(level)
+        return np.linspace(*self.spec['x_range'], n), np.linspace(*self.spec['y_range'], n)
+
+    def _evaluate(self, level, row, col):
+        """Evaluate one (tile_size + 1)^2 tile, rows along y"""
+        x, y = self.axes(level)
+        t = self.tile_size
+        cols = np.arange(col * t, col * t + t + 1)
+        rows = np.arange(row * t, row * t + t + 1)
+        Z = self.spec['field'](x[cols][None, :], y[rows][:, None])
+
+        amplitude, sigma = self.spec['noise'], self.spec['noise_sigma']
+        if amplitude:
+            if sigma:
+                from scipy.ndimage import gaussian_filter
+                # A halo as wide as the kernel makes the filtered tile equal
+                # the filtered infinite lattice, so tile edges match
+                halo = int(math.ceil(NOISE_TRUNCATE * sigma))
+                noise = lattice_noise(self.seed, level,
+                                      np.arange(rows[0] - halo, rows[-1] + halo + 1),
+                                      np.arange(cols[0] - halo, cols[-1] + halo + 1))
+                noise = gaussian_filter(noise, sigma, truncate=NOISE_TRUNCATE)[halo:-halo, halo:-halo]
+            else:
+                noise = lattice_noise(self.seed, level, rows, cols)
+            Z = Z + amplitude * noise
+        return np.ascontiguousarray(Z, dtype=self.dtype)
+
+    def _tile_path(self, level, row, col):
+        return os.path.join(self.cache_dir, str(level), f'{row}_{col}.npy')
+
+    def tile(self, level, row, col):
+        """Samples of one tile: memory LRU, then disk, then evaluated and cached"""
+        key = (level, row, col)
+        with self._lock:
+            if key in self._tiles:
+                self._tiles.move_to_end(key)
+                self.stats['memory'] += 1
+                return self._tiles[key]
+
+        Z = None
+        path = None
+        if self.cache_dir is not None:
+            path = self._tile_path(level, row, col)
+            if os.path.exists(path):
+                Z = np.load(path)
+                source = 'disk'
+        if Z is None:
+            Z = self._evaluate(level, row, col)
+            source = 'computed'
+            if path is not None:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f'{path[:-4]}.tmp-{os.getpid()}-{threading.get_ident()}.npy'
+                np.save(tmp_path, Z)
+                os.replace(tmp_path, path)
+        Z.flags.writeable = False
+
+        with self._lock:
+            self.stats[source] += 1
+            self._tiles[key] = Z
+            self._tiles.move_to_end(key)
+            while len(self._tiles) > self.memory_tiles:
+                self._tiles.popitem(last=False)
+        return Z
+
+    def level_for(self, x_range=None, y_range=None, max_samples=200):
+        """Coarsest level showing at least max_samples samples across the viewport"""
+        x_range, y_range = self._clamp(x_range, y_range)
+        fraction = min(np.ptp(x_range) / np.ptp(self.spec['x_range']),
+                       np.ptp(y_range) / np.ptp(self.spec['y_range']))
+        for level in range(self.max_level + 1):
+            if fraction * (self.samples(level) - 1) >= max_samples:
+                return level
+        return self.max_level
+
+    def _clamp(self, x_range, y_range):
+        x_low, x_high = self.spec['x_range']
+        y_low, y_high = self.spec['y_range']
+        x_range = sorted(x_range) if x_range is not None else (x_low, x_high)
+        y_range = sorted(y_range) if y_range is not None else (y_low, y_high)
+        return ((max(x_low, x_range[0]), min(x_high, x_range[1])),
+                (max(y_low, y_range[0]), min(y_high, y_range[1])))
+
+    def view(self, x_range=None, y_range=None, max_samples=200, level=None, samples=None):
+        """Stitch the tiles covering a viewport into one grid
+
+        The viewport (default: the whole domain) is clamped to the domain.
+        Returns a dict with the x and y sample coordinates, Z with rows
+        along y, and the pyramid level used. The grid has the level's own
+        samples (at least max_samples across the viewport), unless samples
+        is given: then it is resampled to exactly samples x samples points
+        (see resample).
+        """
+        x_range, y_range = self._clamp(x_range, y_range)
+        if level is None:
+            level = self.level_for(x_range, y_range, max_samples)
+        x, y = self.axes(level)
+        n, t = len(x), self.tile_size
+        i0, i1 = _index_range(*x_range, x[0], x[1] - x[0], n)
+        j0, j1 = _index_range(*y_range, y[0], y[1] - y[0], n)
+
+        Z = np.empty((j1 - j0 + 1, i1 - i0 + 1), dtype=self.dtype)
+        last_tile = 2 ** level - 1
+        for row in range(min(j0 // t, last_tile), min(j1 // t, last_tile) + 1):
+            for col in range(min(i0 // t, last_tile), min(i1 // t, last_tile) + 1):
+                tile = self.tile(level, row, col)
+                r0, r1 = max(j0, row * t), min(j1, row * t + t)
+                c0, c1 = max(i0, col * t), min(i1, col * t + t)
+                Z[r0 - j0:r1 - j0 + 1, c0 - i0:c1 - i0 + 1] = \
+                    tile[r0 - row * t:r1 - row * t + 1, c0 - col * t:c1 - col * t + 1]
+
+        view = {'x': x[i0:i1 + 1], 'y': y[j0:j1 + 1], 'Z': Z, 'level': level}
+        return view if samples is None else resample(view, samples)
+
+    def view_data(self, x_range=None, y_range=None, max_samples=200, rng=None, samples=None):
+        """view() in the data dict format of the surface's figure builder
+
+        rng draws the decorative extras some builders expect (the holographic
+        particle streams); without it they are left empty.
+        """
+        return self.spec['data'](self.view(x_range, y_range, max_samples, samples=samples), rng)
+
+    def prefetch(self, level):
+        """Evaluate (or load) every tile of a level, e.g. to warm the disk cache"""
+        for row in range(2 ** level):
+            for col in range(2 ** level):
+                self.tile(level, row, col)
+
+    def report(self):
+        """Print where tiles were served from"""
+        total = sum(self.stats.values())
+        print(f"Tile pyramid {self.surface}: {total} tile requests, "
+              f"{self.stats['memory']} from memory, {self.stats['disk']} from disk, "
+              f"{self.stats['computed']} computed (levels 0-{self.max_level}, "
+              f"{self.samples(self.max_level)} samples per axis)")
+
+
+def follow_viewport(fig, pyramid, trace=0, max_samples=200):
+    """Re-sample a plotly trace from pyramid whenever the viewport changes
+
+    fig is a plotly FigureWidget (or any figure receiving relayout events).
+    Zooming or panning the 2D axes, or editing the 3D scene axis ranges,
+    replaces trace's x, y and z with pyramid.view() of the new ranges;
+    autoranging (double click) returns to the whole domain. Returns the
+    callback so it can be invoked or removed.
+    """
+    scene = fig.data[trace].type in ('surface', 'mesh3d')
+    prefix = 'scene.' if scene else ''
+
+    def on_change(layout, x_range, y_range, x_auto=None, y_auto=None):
+        # Autoranging would only fit the zoomed-in samples, so a reset
+        # (double click) shows the whole domain with explicit ranges instead
+        reset = bool(x_auto or y_auto)
+        view = pyramid.view(None if reset else x_range, None if reset else y_range,
+                            max_samples)
+        with fig.batch_update():
+            fig.data[trace].x = view['x']
+            fig.data[trace].y = view['y']
+            fig.data[trace].z = view['Z']
+            if reset:
+                for axis, values in (('xaxis', view['x']), ('yaxis', view['y'])):
+                    fig.layout[f'{prefix}{axis}.autorange'] = False
+                    fig.layout[f'{prefix}{axis}.range'] = [values[0], values[-1]]
+        return view
+
+    fig.layout.on_change(on_change, f'{prefix}xaxis.range', f'{prefix}yaxis.range',
+                         f'{prefix}xaxis.autorange', f'{prefix}yaxis.autorange')
+    return on_change
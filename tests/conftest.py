@@ -0,0 +1,10 @@
+"""pytest setup: the Python modules live at the repository root"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+
+matplotlib.use('Agg')
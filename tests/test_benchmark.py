@@ -0,0 +1,31 @@
+import pytest
+
+from benchmark import BENCHMARK_CASES, _build_case, compare, run_benchmarks
+
+
+def _result(case, size, **metrics):
+    return {'case': case, 'size': size,
+            **{'wall_s': 1.0, 'peak_rss_mb': 100.0, 'file_bytes': 1000, **metrics}}
+
+
+def test_compare_flags_only_growth_past_the_threshold():
+    baseline = [_result('a', 1), _result('b', 1)]
+    results = [_result('a', 1, wall_s=1.2, file_bytes=2000),
+               _result('b', 1, peak_rss_mb=50.0),
+               _result('c', 1, wall_s=10.0)]
+    regressions = compare(results, baseline, threshold=0.25)
+    assert [(r['case'], r['metric']) for r in regressions] == [('a', 'file_bytes')]
+    assert regressions[0]['change'] == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize('name', list(BENCHMARK_CASES))
+def test_every_case_builds_at_its_smallest_size(name):
+    _, sizes = BENCHMARK_CASES[name]
+    fig = _build_case(name, min(sizes))
+    assert hasattr(fig, 'write_html') or hasattr(fig, 'savefig')
+
+
+def test_run_reports_metrics_from_a_fresh_process():
+    (result,) = run_benchmarks(['cyberpunk.holographic_dimensions'], size_indices=[0], dpi=50)
+    assert result['param'] == 'resolution' and result['size'] == 100
+    assert result['wall_s'] > 0 and result['file_bytes'] > 0 and result['peak_rss_mb'] > 0
@@ -0,0 +1,41 @@
+import pytest
+
+import cli
+
+
+def test_figure_seed_depends_only_on_the_figure():
+    assert cli.figure_seed('quantum_field', 10) == 10 + list(cli.FIGURES).index('quantum_field')
+    assert cli.figure_seed('quantum_field', None) is None
+
+
+def test_output_paths_fall_back_to_the_native_format(tmp_path):
+    out = str(tmp_path)
+    assert cli.output_paths('holographic_dimensions', out, ['png', 'json']) == \
+        [str(tmp_path / 'holographic_dimensions.json')]
+    assert cli.output_paths('particle_physics', out, ['html']) == \
+        [str(tmp_path / 'particle_physics_visualization.png')]
+
+
+def test_subsets_render_the_same_figure(tmp_path):
+    alone = cli.render_figures(['holographic_dimensions'], str(tmp_path / 'alone'), ['json'],
+                               resolution=20, seed=3)
+    both = cli.render_figures(['reality_tracker', 'holographic_dimensions'], str(tmp_path / 'both'),
+                              ['json'], resolution=20, seed=3)
+    path_alone, path_both = alone[0][1][0], both[1][1][0]
+    with open(path_alone) as a, open(path_both) as b:
+        assert a.read() == b.read()
+
+
+def test_main_writes_selected_figures(tmp_path, capsys):
+    assert cli.main(['probability_trend', 'holographic_dimensions', '-o', str(tmp_path),
+                     '--format', 'png,json', '--quality', 'preview', '--resolution', '20',
+                     '--seed', '1']) == 0
+    assert sorted(p.name for p in tmp_path.iterdir()) == \
+        ['holographic_dimensions.json', 'probability_trend_analysis.png']
+    assert 'Rendered 2 figure(s)' in capsys.readouterr().out
+
+
+def test_main_rejects_unknown_figures():
+    with pytest.raises(SystemExit) as exit_info:
+        cli.main(['no_such_figure'])
+    assert exit_info.value.code == 2
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from correlation import CorrelationAccumulator, chunk_moments, streaming_correlation
+
+
+def _observations(n_rows=3000, n_columns=6, seed=0):
+    rng = np.random.default_rng(seed)
+    factors = rng.standard_normal((n_rows, 2))
+    return factors @ rng.standard_normal((2, n_columns)) + rng.standard_normal((n_rows, n_columns))
+
+
+def _blocks(data, sizes=(1, 10, 700, 1289)):
+    return np.split(data, np.cumsum(sizes))
+
+
+def test_chunked_correlation_matches_corrcoef():
+    data = _observations()
+    acc = CorrelationAccumulator(range(data.shape[1]))
+    for block in _blocks(data):
+        acc.update(block)
+    assert acc.count == len(data)
+    np.testing.assert_allclose(acc.mean, data.mean(axis=0), rtol=1e-12, atol=1e-14)
+    np.testing.assert_allclose(acc.covariance(), np.cov(data, rowvar=False), rtol=1e-12)
+    np.testing.assert_allclose(acc.correlation(), np.corrcoef(data, rowvar=False), atol=1e-12)
+
+
+def test_rows_with_nan_are_skipped():
+    data = _observations(seed=1)
+    with_nan = data.copy()
+    with_nan[::7, 2] = np.nan
+    with_nan[3::11, 4] = np.nan
+    complete = ~np.isnan(with_nan).any(axis=1)
+
+    acc = CorrelationAccumulator(range(data.shape[1]))
+    for block in _blocks(with_nan):
+        acc.update(block)
+    assert acc.count == complete.sum()
+    np.testing.assert_allclose(acc.correlation(), np.corrcoef(data[complete], rowvar=False),
+                               atol=1e-12)
+
+
+def test_an_all_nan_block_contributes_nothing():
+    count, mean, comoment = chunk_moments(np.full((5, 3), np.nan))
+    assert count == 0
+    assert CorrelationAccumulator(range(3)).merge_moments(count, mean, comoment).count == 0
+
+
+def test_merge_order_does_not_matter():
+    blocks = _blocks(_observations(seed=2))
+    parts = [CorrelationAccumulator(range(6)).update(block) for block in blocks]
+    forward = CorrelationAccumulator(range(6))
+    for part in parts:
+        forward.merge(part)
+    paired = CorrelationAccumulator(range(6)).merge(parts[2].merge(parts[3])).merge(
+        parts[0].merge(parts[1]).merge(parts[4]))
+    np.testing.assert_allclose(paired.comoment, forward.comoment, rtol=1e-10)
+    np.testing.assert_allclose(paired.mean, forward.mean, rtol=1e-12, atol=1e-14)
+
+
+@pytest.mark.parametrize('jobs', [1, 3])
+def test_streaming_correlation_does_not_depend_on_jobs(jobs):
+    data = _observations(seed=3)
+    acc = streaming_correlation(iter(_blocks(data)), range(6), jobs=jobs, max_pending=2)
+    np.testing.assert_allclose(acc.correlation(), np.corrcoef(data, rowvar=False), atol=1e-12)
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from data_sources import (ArraySource, correlation_matrix_data, interactive_3d_data,
+                          open_source, reservoir_sample, sample)
+
+
+@pytest.fixture
+def npy_source(tmp_path):
+    rows = np.random.default_rng(0).normal(size=(5000, 4))
+    path = str(tmp_path / 'points.npy')
+    np.save(path, rows)
+    return rows, open_source(path, columns=['x', 'y', 'z', 'energy'])
+
+
+def test_npy_columns_are_memory_mapped_views(npy_source):
+    rows, source = npy_source
+    assert isinstance(source.array, np.memmap)
+    assert len(source) == 5000 and source.columns == ['x', 'y', 'z', 'energy']
+    assert not isinstance(source.read(['x'], slice(0, 3))['x'], np.memmap)
+    np.testing.assert_array_equal(source.column('energy'), rows[:, 3])
+
+
+def test_raw_binary_needs_a_dtype(tmp_path):
+    path = str(tmp_path / 'values.bin')
+    np.arange(12, dtype=np.float32).tofile(path)
+    with pytest.raises(ValueError, match='dtype'):
+        ArraySource(path)
+    source = ArraySource(path, dtype=np.float32, shape=(4, 3))
+    np.testing.assert_array_equal(source.column('c2'), [2, 5, 8, 11])
+
+
+@pytest.mark.parametrize('method', ['stride', 'reservoir'])
+def test_filtered_sample_keeps_matching_rows_in_order(npy_source, method):
+    rows, source = npy_source
+    kept = rows[rows[:, 3] > 0]
+    picked = sample(source, ['x', 'energy'], max_points=300, method=method,
+                    rng=np.random.default_rng(1), where=lambda c: c['energy'] > 0,
+                    chunk_rows=700)
+    assert 0 < len(picked['x']) <= 300
+    assert np.all(picked['energy'] > 0)
+    positions = np.searchsorted(kept[:, 0], picked['x'], sorter=np.argsort(kept[:, 0]))
+    order = np.argsort(kept[:, 0])[positions]
+    assert np.all(np.diff(order) > 0)
+
+
+def test_reservoir_sample_is_uniform_over_chunks():
+    counts = np.zeros(10)
+    for seed in range(50):
+        chunks = ({'i': np.arange(start, start + 100)} for start in range(0, 10_000, 100))
+        picked = reservoir_sample(chunks, 200, np.random.default_rng(seed))['i']
+        assert len(picked) == 200 and np.all(np.diff(picked) > 0)
+        counts += np.bincount(picked // 1000, minlength=10)
+    assert counts.min() > 0.8 * counts.mean()
+
+
+def test_adapters_return_builder_dicts(npy_source):
+    rows, source = npy_source
+    points = interactive_3d_data(source, max_points=100, rng=np.random.default_rng(2))
+    assert set(points) == {'x', 'y', 'z', 'colors'} and len(points['x']) == 100
+    matrix = correlation_matrix_data(source)
+    np.testing.assert_allclose(matrix['correlation'], np.corrcoef(rows, rowvar=False), atol=1e-10)
+    assert matrix['n_rows'] == 5000
+
+
+def test_parquet_reads_selected_rows_across_row_groups(tmp_path):
+    pa = pytest.importorskip('pyarrow')
+    pq = pytest.importorskip('pyarrow.parquet')
+    path = str(tmp_path / 'rows.parquet')
+    pq.write_table(pa.table({'x': np.arange(1000.0), 'y': -np.arange(1000.0)}), path,
+                   row_group_size=128)
+    source = open_source(path)
+    picked = source.read(['y'], np.array([3, 200, 999]))
+    np.testing.assert_array_equal(picked['y'], [-3, -200, -999])
@@ -0,0 +1,70 @@
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
+from decimation import decimate, lttb_downsample, minmax_downsample, series_trace
+
+
+def _series(n=100_003, seed=0):
+    rng = np.random.default_rng(seed)
+    x = np.arange(n, dtype=float)
+    return x, np.cumsum(rng.standard_normal(n))
+
+
+@pytest.mark.parametrize('budget', [4, 5, 100, 5000])
+def test_minmax_stays_within_budget_and_keeps_the_envelope(budget):
+    x, y = _series()
+    idx = minmax_downsample(x, y, budget)
+    assert len(idx) <= budget
+    assert np.all(np.diff(idx) > 0)
+    assert idx[0] == 0 and idx[-1] == len(y) - 1
+    assert y.argmin() in idx and y.argmax() in idx
+
+
+def test_minmax_ignores_nan():
+    x, y = _series(10_000)
+    y[::3] = np.nan
+    idx = minmax_downsample(x, y, 200)
+    assert len(idx) <= 200
+    assert np.nanargmax(y) in idx and np.nanargmin(y) in idx
+
+
+@pytest.mark.parametrize('budget', [1, 2, 3])
+def test_minmax_tiny_budgets_stay_within_budget(budget):
+    x, y = _series()
+    idx = minmax_downsample(x, y, budget)
+    assert len(idx) == budget
+    assert np.all(np.diff(idx) > 0)
+    assert idx[0] == 0
+
+
+@pytest.mark.parametrize('budget', [2, 3, 10, 1000])
+def test_lttb_returns_exactly_the_budget(budget):
+    x, y = _series()
+    idx = lttb_downsample(x, y, budget)
+    assert len(idx) == budget
+    assert np.all(np.diff(idx) > 0)
+    assert idx[0] == 0 and idx[-1] == len(y) - 1
+
+
+@pytest.mark.parametrize('method', ['minmax', 'lttb'])
+def test_short_series_are_left_alone(method):
+    x, y = _series(50)
+    assert decimate(x, y, 50, method)[2] == 0
+    np.testing.assert_array_equal(decimate(x, y, 50, method)[1], y)
+
+
+def test_series_trace_switches_to_webgl_over_budget():
+    x, y = _series(6000)
+    trace, dropped = series_trace(x, y, point_budget=6000)
+    assert isinstance(trace, go.Scatter) and dropped == 0
+    trace, dropped = series_trace(x, y, point_budget=1000, method='lttb', name='signal')
+    assert isinstance(trace, go.Scattergl)
+    assert len(trace.y) == 1000 and dropped == 5000
+    assert trace.name == 'signal'
+
+
+def test_unknown_method_is_rejected():
+    x, y = _series(100)
+    with pytest.raises(ValueError):
+        decimate(x, y, 10, 'median')
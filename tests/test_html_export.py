@@ -0,0 +1,34 @@
+import plotly.graph_objects as go
+import pytest
+
+from html_export import _drop_unused_text, compact_figure_dict
+
+TEXT = [f'point {i}' for i in range(20)]
+
+
+@pytest.mark.parametrize('template', [
+    '%{text}',
+    '%{text:.2f}<extra></extra>',
+    'x=%{x}<br>%{text|%Y-%m-%d}',
+])
+def test_text_referenced_by_hovertemplate_is_kept(template):
+    trace = {'type': 'scatter', 'mode': 'markers', 'text': TEXT, 'hovertemplate': template}
+    assert _drop_unused_text(trace)['text'] == TEXT
+
+
+def test_text_referenced_by_texttemplate_is_kept():
+    trace = {'type': 'scatter', 'mode': 'markers', 'text': TEXT, 'texttemplate': '%{text:.1f}',
+             'hovertemplate': '%{x}'}
+    assert _drop_unused_text(trace)['text'] == TEXT
+
+
+@pytest.mark.parametrize('template', ['%{x}', '%{textinfo}', '%{customdata[0]}'])
+def test_unreferenced_text_is_dropped(template):
+    trace = {'type': 'scatter', 'mode': 'markers', 'text': TEXT, 'hovertemplate': template}
+    assert 'text' not in _drop_unused_text(trace)
+
+
+def test_compact_figure_keeps_formatted_text():
+    fig = go.Figure(go.Scatter(x=list(range(20)), y=list(range(20)), mode='markers', text=TEXT,
+                               hovertemplate='%{text:>10}<extra></extra>'))
+    assert list(compact_figure_dict(fig)['data'][0]['text']) == TEXT
@@ -0,0 +1,24 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from plot_style import HUSL_PALETTE
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ('matplotlib', 'seaborn', 'pandas', 'plotly.express', 'plotly.offline')
+
+
+@pytest.mark.parametrize('module', ['visualization', 'futuristic_dashboard', 'cyberpunk_dashboard'])
+def test_importing_an_entry_module_defers_heavy_libraries(module):
+    code = (f"import sys, {module}; "
+            f"print(' '.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))")
+    loaded = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout.split()
+    assert loaded == []
+
+
+def test_husl_palette_matches_seaborn():
+    sns = pytest.importorskip('seaborn')
+    assert HUSL_PALETTE == sns.color_palette('husl').as_hex()
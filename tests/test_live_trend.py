@@ -0,0 +1,35 @@
+import numpy as np
+
+import simulation_data as sd
+from live_trend import LiveProbabilityTrend
+from visualization import SimulationVisualizer
+
+
+def _live():
+    return LiveProbabilityTrend(rng=np.random.default_rng(1),
+                                visualizer=SimulationVisualizer('preview'))
+
+
+def test_in_range_updates_are_blitted():
+    live = _live()
+    data = sd.probability_trend_data(np.random.default_rng(2))
+    heights, edges = data['prob_hist']
+    assert live.update({'prob_hist': (heights * 0.5, edges)}) == 'blit'
+    assert live.blits == 1 and live.full_draws == 1
+
+
+def test_new_bin_count_rebuilds_the_bars_with_a_full_redraw():
+    live = _live()
+    hist_ax = live.axes['hist']
+    style = live.artists['bars'][0].get_facecolor()
+    edges = np.linspace(0.2, 0.8, 8)
+    heights = np.arange(1.0, 8.0) / 10
+
+    assert live.update({'prob_hist': (heights, edges)}) == 'redraw'
+    bars = live.artists['bars']
+    assert len(bars) == 7 and len(hist_ax.patches) == 7
+    np.testing.assert_allclose([bar.get_height() for bar in bars], heights)
+    assert bars[0].get_facecolor() == style
+
+    # Same bin count again: the rebuilt bars are blitted
+    assert live.update({'prob_hist': (heights * 0.9, edges)}) == 'blit'
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from monte_carlo import RunningStats, beta_probability_sampler, run_monte_carlo
+
+
+@pytest.mark.parametrize('shape', [(), (3,)])
+def test_batched_updates_match_one_pass_statistics(shape):
+    samples = np.random.default_rng(0).normal(5.0, 2.0, (1000,) + shape)
+    stats = RunningStats()
+    for batch in np.array_split(samples, [1, 7, 300, 301, 650]):
+        stats.update(batch)
+    assert stats.count == len(samples)
+    np.testing.assert_allclose(stats.mean, samples.mean(axis=0), rtol=1e-12)
+    np.testing.assert_allclose(stats.variance, samples.var(axis=0, ddof=1), rtol=1e-12)
+
+
+def test_merged_stats_match_stats_over_all_samples():
+    samples = np.random.default_rng(1).exponential(3.0, 2000)
+    left = RunningStats().update(samples[:500])
+    right = RunningStats().update(samples[500:1200]).update(samples[1200:])
+    merged = RunningStats().merge(left.count, left.mean, left.m2)
+    merged.merge(right.count, right.mean, right.m2)
+    whole = RunningStats().update(samples)
+    assert merged.count == whole.count
+    assert merged.mean == pytest.approx(whole.mean, rel=1e-12)
+    assert merged.m2 == pytest.approx(whole.m2, rel=1e-12)
+
+
+def test_merging_an_empty_summary_changes_nothing():
+    stats = RunningStats().update([1.0, 2.0, 4.0])
+    before = (stats.count, stats.mean, stats.m2)
+    assert (stats.merge(0, 0.0, 0.0).count, stats.mean, stats.m2) == before
+
+
+def test_run_monte_carlo_is_reproducible_and_meets_the_tolerance():
+    first = run_monte_carlo(beta_probability_sampler, batch_size=5000, tolerance=0.005, seed=3)
+    second = run_monte_carlo(beta_probability_sampler, batch_size=5000, tolerance=0.005, seed=3)
+    assert first['n_samples'] == second['n_samples']
+    assert first['mean'] == second['mean']
+    assert first['converged']
+    assert first['ci_high'] - first['ci_low'] <= 0.005
@@ -0,0 +1,61 @@
+import json
+
+import plotly.graph_objects as go
+import pytest
+
+from futuristic_dashboard import FuturisticDashboard
+
+SIZES = dict(n_flow=20, matrix_size=6, n_observations=500, n_temporal=200,
+             n_pattern=40, n_signature=30, surface_size=12)
+
+
+def _board(**changes):
+    return FuturisticDashboard().dimensional_matrix(seed=7, **dict(SIZES, **changes))
+
+
+def test_patched_figure_equals_a_fresh_build():
+    board = _board()
+    fig = board.figure()
+    board.set_params('temporal', n_temporal=300)
+    board.set_params('surface', surface_size=15)
+    patched = board.figure()
+
+    assert patched is fig
+    assert board.stats['patched'] == 2 and board.stats['built'] == 1
+    fresh = _board(n_temporal=300, surface_size=15).figure()
+    assert json.loads(patched.to_json()) == json.loads(fresh.to_json())
+
+
+def test_unchanged_board_returns_the_same_figure_without_work():
+    board = _board()
+    fig = board.figure()
+    computed = board.stats['computed']
+    assert board.figure() is fig
+    assert board.stats['computed'] == computed and board.stats['patched'] == 0
+
+
+def test_reverting_a_parameter_is_served_from_the_memo():
+    board = _board()
+    board.figure()
+    board.set_params('flow', n_flow=25)
+    board.figure()
+    board.set_params('flow', n_flow=20)
+    board.figure()
+    assert board.stats['computed'] == 10 and board.stats['memoised'] == 1
+
+
+def test_trace_type_change_rebuilds_the_figure():
+    board = _board(n_temporal=200)
+    board.set_options(point_budget=100)
+    fig = board.figure()
+    assert isinstance(fig.data[3], go.Scattergl)
+    board.set_options(point_budget=10_000)
+    rebuilt = board.figure()
+    assert isinstance(rebuilt.data[3], go.Scatter) and board.stats['built'] == 2
+
+
+def test_unknown_sizes_and_panels_are_rejected():
+    with pytest.raises(TypeError):
+        FuturisticDashboard().dimensional_matrix(n_rows=5)
+    with pytest.raises(KeyError):
+        _board().set_params('missing', n=1)
@@ -0,0 +1,75 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib
+import numpy as np
+
+import simulation_data as sd
+from plot_style import new_figure, style_rc, styled
+from visualization import SimulationVisualizer
+
+# Global settings unlike either dashboard style, read by an unpinned draw
+HOSTILE_RC = {
+    'font.family': ['serif'],
+    'font.size': 30,
+    'xtick.labelsize': 40,
+    'ytick.labelsize': 40,
+    'xtick.direction': 'in',
+    'xtick.major.size': 20,
+    'xtick.color': 'red',
+    'grid.color': 'red',
+}
+
+
+def _png(fig):
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=40)
+    return buffer.getvalue()
+
+
+def _trend(viz, seed):
+    data = sd.probability_trend_data(np.random.default_rng(seed))
+    return viz.create_probability_trend_analysis(data)
+
+
+def test_styled_leaves_global_rcparams_alone():
+    before = dict(matplotlib.rcParams)
+    with styled(style_rc('dark_background')):
+        new_figure()
+    assert dict(matplotlib.rcParams) == before
+
+
+def test_built_figure_draws_the_same_outside_the_style():
+    viz = SimulationVisualizer('preview')
+    fig = _trend(viz, 1)
+    with viz.style():
+        expected = _png(fig)
+    assert _png(fig) == expected
+    with matplotlib.rc_context(HOSTILE_RC):
+        assert _png(fig) == expected
+
+
+def test_threaded_renders_match_serial_renders():
+    viz = SimulationVisualizer('preview')
+    expected = [_png(_trend(viz, seed)) for seed in range(3)]
+
+    def other_style():
+        for _ in range(20):
+            with styled(style_rc('dark_background')):
+                new_figure().subplots()
+
+    with ThreadPoolExecutor(4) as pool:
+        interference = pool.submit(other_style)
+        rendered = list(pool.map(lambda seed: _png(_trend(viz, seed)), range(3)))
+        interference.result()
+    assert rendered == expected
+
+
+def test_pin_style_keeps_tick_params_the_builder_set():
+    with styled(style_rc('dark_background')):
+        ax = new_figure().subplots()
+        ax.tick_params(axis='x', labelsize=7)
+    params = ax.xaxis.get_tick_params()
+    assert params['labelsize'] == 7
+    assert params['length'] == matplotlib.rcParamsDefault['xtick.major.size']
+    assert ax.yaxis.get_tick_params()['labelsize'] == 11
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from point_lod import density_volume, reduce_points
+
+
+def _cloud(n=200_000, seed=0):
+    rng = np.random.default_rng(seed)
+    core = rng.standard_normal((n - 10, 3))
+    outliers = rng.uniform(20, 30, (10, 3))
+    xyz = np.vstack([core, outliers])
+    return {'x': xyz[:, 0], 'y': xyz[:, 1], 'z': xyz[:, 2], 'colors': np.linalg.norm(xyz, axis=1)}
+
+
+@pytest.mark.parametrize('budget', [1, 50, 5000, 20000])
+def test_voxel_lod_stays_within_budget_and_accounts_for_every_point(budget):
+    cloud = _cloud()
+    reduced = reduce_points(cloud, budget, 'voxel')
+    assert 0 < len(reduced['x']) <= budget
+    assert reduced['counts'].sum() == len(cloud['x'])
+    for axis in ('x', 'y', 'z', 'colors'):
+        weighted = np.sum(reduced[axis] * reduced['counts']) / reduced['counts'].sum()
+        assert weighted == pytest.approx(cloud[axis].mean(), rel=1e-9, abs=1e-9)
+
+
+def test_voxel_lod_keeps_outliers_visible():
+    reduced = reduce_points(_cloud(), 2000, 'voxel')
+    assert reduced['x'].max() > 19
+
+
+def test_random_lod_returns_exactly_the_budget_in_order():
+    cloud = dict(_cloud(10_000), colors=np.arange(10_000))
+    reduced = reduce_points(cloud, 1000, 'random', seed=4)
+    assert len(reduced['x']) == 1000
+    kept = reduced['colors'].astype(int)
+    assert np.all(np.diff(kept) > 0)
+    np.testing.assert_array_equal(reduced['x'], cloud['x'][kept])
+
+
+def test_nan_points_are_left_out_of_voxels():
+    cloud = _cloud(10_000)
+    cloud['z'][:100] = np.nan
+    reduced = reduce_points(cloud, 500, 'voxel')
+    assert reduced['counts'].sum() == 9_900
+    assert np.isfinite(reduced['z']).all()
+
+
+def test_clouds_within_budget_are_unchanged():
+    cloud = _cloud(1000)
+    assert reduce_points(cloud, 1000) is cloud
+
+
+def test_density_volume_counts_every_finite_point():
+    cloud = _cloud(5000)
+    volume = density_volume(cloud, bins=10)
+    cell = np.prod([np.ptp(cloud[axis]) / 10 for axis in ('x', 'y', 'z')])
+    assert len(volume['density']) == 1000
+    assert volume['density'].sum() * cell == pytest.approx(5000)
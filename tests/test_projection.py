@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from projection import PCA, project, scatter_3d_data
+
+
+def _points(n_rows=5000, n_dims=8, seed=0):
+    rng = np.random.default_rng(seed)
+    scales = np.linspace(5.0, 0.5, n_dims)
+    return rng.standard_normal((n_rows, n_dims)) * scales @ _rotation(n_dims, rng) + 3.0
+
+
+def _rotation(n_dims, rng):
+    q, _ = np.linalg.qr(rng.standard_normal((n_dims, n_dims)))
+    return q
+
+
+def _svd_reference(points, k):
+    centred = points - points.mean(axis=0)
+    _, singular, vt = np.linalg.svd(centred, full_matrices=False)
+    return vt[:k], singular[:k] ** 2 / (len(points) - 1)
+
+
+def _same_up_to_sign(a, b):
+    signs = np.sign(np.sum(a * b, axis=1))[:, None]
+    np.testing.assert_allclose(a * signs, b, atol=1e-8)
+
+
+@pytest.mark.parametrize('method', ['incremental', 'randomized'])
+def test_pca_matches_svd(method):
+    points = _points()
+    pca = PCA(3, method=method, n_iter=6, max_chunk_bytes=64 * 1024).fit(points)
+    components, variance = _svd_reference(points, 3)
+    _same_up_to_sign(pca.components, components)
+    np.testing.assert_allclose(pca.explained_variance, variance, rtol=1e-8)
+    np.testing.assert_allclose(pca.mean, points.mean(axis=0), rtol=1e-12)
+
+
+def test_pca_projection_matches_svd_scores():
+    points = _points(seed=1)
+    pca = PCA(3).fit(points)
+    components, _ = _svd_reference(points, 3)
+    reference = (points - points.mean(axis=0)) @ components.T
+    scores = project(points, 3, 'pca', max_chunk_bytes=32 * 1024, pca=pca)
+    _same_up_to_sign(scores.T, reference.T)
+
+
+def test_chunked_projection_matches_one_block():
+    points = _points(n_rows=1001, seed=2)
+    for method in ('orthographic', 'perspective', 'stereographic'):
+        chunked = project(points, 3, method, max_chunk_bytes=8 * 1024)
+        whole = project(points, 3, method, max_chunk_bytes=1 << 30)
+        np.testing.assert_array_equal(chunked, whole)
+
+
+def test_stereographic_pole_has_no_image():
+    points = np.array([[0.0, 0.0, 0.0, 2.0], [0.0, 0.0, 0.0, 0.0], [1.0, 0.0, 0.0, 0.0]])
+    projected = project(points, 3, 'stereographic')
+    assert np.isnan(projected[0]).all()
+    np.testing.assert_array_equal(projected[1], [0.0, 0.0, 0.0])
+    np.testing.assert_allclose(projected[2], [1.0, 0.0, 0.0])
+
+
+def test_scatter_data_is_coloured_by_distance_from_the_origin():
+    points = _points(n_rows=100, n_dims=5, seed=3)
+    data = scatter_3d_data(points, 'orthographic')
+    np.testing.assert_array_equal(data['x'], points[:, 0])
+    np.testing.assert_allclose(data['colors'], np.linalg.norm(points, axis=1))
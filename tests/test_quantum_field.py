@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+import simulation_data as sd
+from cyberpunk_dashboard import create_quantum_field
+
+
+def test_slabs_match_the_whole_volume():
+    volume = sd.quantum_field_data(24)
+    axis = volume['axis']
+    np.testing.assert_allclose(sd.quantum_field_slab(axis, 5, 13), volume['field'][5:13],
+                               rtol=1e-6)
+
+
+def test_chunked_mesh_has_the_same_triangles_as_one_slab():
+    pytest.importorskip('skimage')
+    chunked = sd.quantum_field_mesh(30, chunk_size=7)
+    whole = sd.quantum_field_mesh(30, chunk_size=30)
+    assert len(chunked['faces']) == len(whole['faces']) > 0
+    assert chunked['faces'].max() < len(chunked['vertices'])
+    assert chunked['vertices'].min() >= -3 and chunked['vertices'].max() <= 3
+
+
+@pytest.mark.parametrize('resolution, trace', [(20, 'isosurface'), (sd.MESH_MIN_RESOLUTION, 'mesh3d')])
+def test_default_mode_switches_to_mesh_at_the_threshold(resolution, trace):
+    if trace == 'mesh3d':
+        pytest.importorskip('skimage')
+    assert create_quantum_field(resolution=resolution).data[0].type == trace
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError, match='quantum field mode'):
+        sd.quantum_field_input(20, mode='voxels')
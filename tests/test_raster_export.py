@@ -0,0 +1,42 @@
+import io
+
+import numpy as np
+import pytest
+from matplotlib.figure import Figure
+
+from raster_export import output_paths, quality_profile, save_figure
+
+
+def _figure():
+    fig = Figure(figsize=(4, 3))
+    ax = fig.subplots()
+    ax.plot(np.sin(np.linspace(0, 6, 50)))
+    ax.set_title('export')
+    return fig
+
+
+def test_png_matches_a_tight_savefig(tmp_path):
+    expected = io.BytesIO()
+    _figure().savefig(expected, format='png', dpi=72, bbox_inches='tight')
+    (path,) = save_figure(_figure(), str(tmp_path / 'plot'), ['png'], 'web', dpi=72)
+    with open(path, 'rb') as f:
+        assert f.read() == expected.getvalue()
+
+
+def test_all_formats_come_from_one_call(tmp_path):
+    Image = pytest.importorskip('PIL.Image')
+    formats = ['png', 'webp', 'jpg', 'svg', 'pdf']
+    paths = save_figure(_figure(), str(tmp_path / 'plot'), formats, 'preview')
+    assert sorted(paths) == sorted(output_paths(str(tmp_path / 'plot.png'), formats))
+    sizes = {Image.open(path).size for path in paths if not path.endswith(('.svg', '.pdf'))}
+    assert len(sizes) == 1
+    assert all((tmp_path / f'plot.{fmt}').stat().st_size > 0 for fmt in formats)
+
+
+def test_quality_profiles_are_validated():
+    assert quality_profile()['dpi'] == 300
+    assert quality_profile({'dpi': 10}) == {**quality_profile('print'), 'dpi': 10}
+    with pytest.raises(ValueError, match='quality profile'):
+        quality_profile('poster')
+    with pytest.raises(ValueError, match='Unsupported format'):
+        save_figure(_figure(), 'plot', ['bmp'])
@@ -0,0 +1,37 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+import simulation_data as sd
+from reality_stream import RealityTrackerStream
+
+
+def _source():
+    return sd.reality_tracker_samples(np.random.default_rng(0))
+
+
+@pytest.mark.parametrize('limit', [0, 1, 3])
+def test_consume_draws_exactly_limit_samples(limit):
+    source = _source()
+    stream = RealityTrackerStream()
+    assert len(list(stream.consume(source, limit))) == limit
+    assert next(source)['time'][0] == pytest.approx(0.1 * limit)
+
+
+@pytest.mark.parametrize('limit', [0, 1, 3])
+def test_aconsume_draws_exactly_limit_samples(limit):
+    source = _source()
+
+    async def feed():
+        for sample in source:
+            yield sample
+
+    async def run():
+        samples = feed()
+        patches = [patch async for patch in RealityTrackerStream().aconsume(samples, limit)]
+        return patches, await samples.__anext__()
+
+    patches, following = asyncio.run(run())
+    assert len(patches) == limit
+    assert following['time'][0] == pytest.approx(0.1 * limit)
@@ -0,0 +1,111 @@
+import importlib
+import json
+import sys
+import textwrap
+
+import pytest
+
+from render_cache import RenderCache, local_dependencies
+
+
+@pytest.fixture
+def figure_package(tmp_path, monkeypatch):
+    """A builder module importing a data module, in a throwaway directory"""
+    (tmp_path / 'fake_data.py').write_text(textwrap.dedent('''
+        def points_data(rng=None, n_points=100):
+            return list(range(n_points))
+    '''))
+    (tmp_path / 'fake_builder.py').write_text(textwrap.dedent('''
+        import fake_data
+
+        def create_points(data=None, rng=None, size=5):
+            from fake_engine import smooth
+            return smooth(data or fake_data.points_data(rng))
+    '''))
+    (tmp_path / 'fake_engine.py').write_text('def smooth(values):\n    return values\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in ('fake_data', 'fake_builder', 'fake_engine'):
+        sys.modules.pop(name, None)
+    yield tmp_path, importlib.import_module('fake_builder')
+    for name in ('fake_data', 'fake_builder', 'fake_engine'):
+        sys.modules.pop(name, None)
+
+
+def test_dependencies_include_function_level_imports(figure_package):
+    tmp_path, builder = figure_package
+    names = {path.rsplit('/', 1)[-1] for path in local_dependencies(builder.__file__)}
+    assert names == {'fake_builder.py', 'fake_data.py', 'fake_engine.py'}
+
+
+def test_editing_data_function_is_a_cache_miss(figure_package):
+    tmp_path, builder = figure_package
+    cache = RenderCache(str(tmp_path / 'cache'))
+    output = tmp_path / 'points.html'
+    output.write_text('<html>old</html>')
+
+    key = cache.key(builder.create_points, seed=1)
+    cache.store(key, str(output))
+    assert cache.fetch(cache.key(builder.create_points, seed=1), str(output))
+
+    # A new default sample size in the data layer must not serve the old figure
+    data_module = tmp_path / 'fake_data.py'
+    data_module.write_text(data_module.read_text().replace('n_points=100', 'n_points=200'))
+    new_key = cache.key(builder.create_points, seed=1)
+    assert new_key != key
+    assert not cache.fetch(new_key, str(output))
+
+
+def test_editing_transitive_engine_changes_key(figure_package):
+    tmp_path, builder = figure_package
+    cache = RenderCache(str(tmp_path / 'cache'))
+    key = cache.key(builder.create_points)
+    (tmp_path / 'fake_engine.py').write_text('def smooth(values):\n    return values[::2]\n')
+    assert cache.key(builder.create_points) != key
+
+
+def test_key_uses_resolved_defaults(figure_package):
+    tmp_path, builder = figure_package
+    cache = RenderCache(str(tmp_path / 'cache'))
+    assert cache.key(builder.create_points) == cache.key(builder.create_points, size=5)
+    assert cache.key(builder.create_points) != cache.key(builder.create_points, size=6)
+
+
+def test_cyberpunk_cache_keeps_figure_json_out_of_output(tmp_path, monkeypatch):
+    import cyberpunk_dashboard
+
+    monkeypatch.chdir(tmp_path)
+    cache = RenderCache(str(tmp_path / 'cache'))
+    built = cyberpunk_dashboard.generate_cyberpunk_visualizations(cache=cache, seed=3)
+    assert not list(tmp_path.glob('*.json'))
+
+    served = cyberpunk_dashboard.generate_cyberpunk_visualizations(cache=cache, seed=3)
+    assert cache.hits == len(built)
+    assert ([json.loads(fig.to_json()) for fig in served]
+            == [json.loads(fig.to_json()) for fig in built])
+
+
+def test_unseeded_runs_are_not_cached(tmp_path, monkeypatch):
+    import futuristic_dashboard
+
+    monkeypatch.chdir(tmp_path)
+    cache = RenderCache(str(tmp_path / 'cache'))
+    futuristic_dashboard.generate_future_dashboard(cache=cache)
+    assert not cache.entries()
+
+
+def test_compact_cache_hit_restores_plotlyjs_in_a_fresh_directory(tmp_path, monkeypatch):
+    import cli
+    import futuristic_dashboard
+
+    cache = RenderCache(str(tmp_path / 'cache'))
+    for out in ('warm', 'fresh'):
+        cli.render_figures(['neural_network'], str(tmp_path / out), ('html',), seed=1,
+                           cache=cache, compact_html=True)
+    assert cache.hits == 1
+    assert (tmp_path / 'fresh' / 'plotly.min.js').exists()
+
+    for out in ('warm_dashboard', 'fresh_dashboard'):
+        (tmp_path / out).mkdir()
+        monkeypatch.chdir(tmp_path / out)
+        futuristic_dashboard.generate_future_dashboard(cache=cache, seed=1, compact_html=True)
+    assert (tmp_path / 'fresh_dashboard' / 'plotly.min.js').exists()
@@ -0,0 +1,66 @@
+import asyncio
+import json
+import os
+import signal
+
+import pytest
+
+from render_service import MAX_DPI, RESOLUTION_LIMITS, RenderService
+
+
+async def _get(service, target):
+    reader, writer = await asyncio.open_connection(service.host, service.port)
+    writer.write(f'GET {target} HTTP/1.1\r\nHost: test\r\n\r\n'.encode())
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), body
+
+
+def _serve(scenario):
+    async def run():
+        service = await RenderService(port=0, jobs=1).start()
+        try:
+            return await scenario(service)
+        finally:
+            await service.close()
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize('query, message', [
+    (f'dpi={MAX_DPI + 1}', f'dpi must be at most {MAX_DPI}'),
+    ('dpi=0', 'dpi must be at least 1'),
+    ('seed=x', 'seed must be an integer'),
+])
+def test_out_of_range_parameters_are_rejected(query, message):
+    status, body = _serve(lambda service: _get(service, f'/figures/probability_trend.png?{query}'))
+    assert status == 400
+    assert json.loads(body)['error'] == message
+
+
+def test_resolution_is_capped_per_figure():
+    limit = RESOLUTION_LIMITS['quantum_field']
+
+    async def scenario(service):
+        return await _get(service, f'/figures/quantum_field.json?resolution={limit + 1}')
+
+    status, body = _serve(scenario)
+    assert status == 400
+    assert json.loads(body)['error'] == f'resolution must be at most {limit}'
+
+
+def test_pool_is_rebuilt_after_a_worker_dies():
+    async def scenario(service):
+        for pid in list(service._pool._processes):
+            os.kill(pid, signal.SIGKILL)
+        await asyncio.sleep(0.5)
+        statuses = []
+        for _ in range(2):
+            status, _ = await _get(service, '/figures/holographic_dimensions.json?seed=1&resolution=10')
+            statuses.append(status)
+        return statuses, service.pool_restarts
+
+    statuses, restarts = _serve(scenario)
+    assert statuses[-1] == 200
+    assert restarts == 1
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from sensitivity import bilinear_sensitivity, evaluate_grid, sensitivity_map
+
+AXES = [np.linspace(0, 1, 7), np.linspace(-1, 1, 5), np.linspace(2, 3, 4)]
+
+
+def _model(sizes):
+    def model(a, b, c):
+        values = a * b + np.sin(c) + a ** 2
+        sizes.append(values.nbytes)
+        return values
+    return model
+
+
+def _full():
+    a, b, c = np.meshgrid(*AXES, indexing='ij')
+    return a * b + np.sin(c) + a ** 2
+
+
+@pytest.mark.parametrize('max_chunk_bytes', [8, 8 * 3, 8 * 40, 8 * 1000])
+def test_grid_blocks_stay_within_the_budget(max_chunk_bytes):
+    sizes = []
+    grid = evaluate_grid(_model(sizes), AXES, max_chunk_bytes=max_chunk_bytes)
+    np.testing.assert_allclose(grid, _full())
+    assert max(sizes) <= max_chunk_bytes
+
+
+@pytest.mark.parametrize('keep', [(0, 1), (2, 0)])
+@pytest.mark.parametrize('max_chunk_bytes', [8 * 5, 8 * 12, 8 * 1000])
+def test_map_blocks_over_both_kept_axes(keep, max_chunk_bytes):
+    sizes = []
+    heatmap = sensitivity_map(_model(sizes), AXES, keep=keep, reduce='std',
+                              max_chunk_bytes=max_chunk_bytes)
+    other = tuple(i for i in range(3) if i not in keep)
+    expected = _full().std(axis=other)
+    expected = expected.T if keep[0] < keep[1] else expected
+    np.testing.assert_allclose(heatmap, expected)
+    assert max(sizes) <= max_chunk_bytes
+
+
+def test_map_rejects_a_budget_below_one_reduced_slab():
+    with pytest.raises(ValueError, match='max_chunk_bytes'):
+        sensitivity_map(_model([]), AXES, keep=(0, 1), max_chunk_bytes=8 * 3)
+
+
+def test_two_parameter_map_matches_the_closed_form():
+    p1, p2 = np.linspace(0, 1, 6), np.linspace(0, 1, 3)
+    heatmap = sensitivity_map(bilinear_sensitivity, [p1, p2], chunk_size=2)
+    np.testing.assert_allclose(heatmap, bilinear_sensitivity(p1[None, :], p2[:, None]))
@@ -0,0 +1,85 @@
+import json
+
+import numpy as np
+import pytest
+
+import simulation_data as sd
+from cyberpunk_dashboard import create_holographic_dimensions, create_neural_probability_matrix
+from futuristic_dashboard import FuturisticDashboard
+
+GENERATORS = [
+    (sd.temporal_analysis_data, {}),
+    (sd.neural_matrix_data, {}),
+    (sd.holographic_data, {'resolution': 20}),
+    (sd.dimensional_matrix_data, {}),
+    (sd.reality_tracker_data, {'n_points': 200}),
+]
+
+
+def _same(left, right):
+    if isinstance(left, dict):
+        assert left.keys() == right.keys()
+        for name in left:
+            _same(left[name], right[name])
+    elif isinstance(left, (list, tuple)):
+        assert len(left) == len(right)
+        for a, b in zip(left, right):
+            _same(a, b)
+    else:
+        np.testing.assert_array_equal(left, right)
+
+
+@pytest.mark.parametrize('generator, sizes', GENERATORS)
+def test_same_seed_gives_the_same_data(generator, sizes):
+    _same(generator(np.random.default_rng(5), **sizes),
+          generator(np.random.default_rng(5), **sizes))
+
+
+def test_data_layer_leaves_global_random_state_alone():
+    np.random.seed(0)
+    expected = np.random.random(3)
+    np.random.seed(0)
+    for generator, sizes in GENERATORS:
+        generator(np.random.default_rng(1), **sizes)
+    np.testing.assert_array_equal(np.random.random(3), expected)
+
+
+def test_builders_draw_precomputed_data():
+    data = sd.holographic_data(np.random.default_rng(2))
+    from_data = create_holographic_dimensions(data=data)
+    from_rng = create_holographic_dimensions(rng=np.random.default_rng(2))
+    assert json.loads(from_data.to_json()) == json.loads(from_rng.to_json())
+
+    small = create_holographic_dimensions(data=sd.holographic_data(np.random.default_rng(2),
+                                                                   resolution=20))
+    assert np.shape(small.data[0].z) == (20, 20)
+
+
+def test_dashboard_builder_is_reproducible_from_a_seed():
+    dashboard = FuturisticDashboard()
+    first = dashboard.create_advanced_probability_landscape(rng=sd.make_rng(seed=4))
+    second = dashboard.create_advanced_probability_landscape(rng=sd.make_rng(seed=4))
+    assert json.loads(first.to_json()) == json.loads(second.to_json())
+
+
+def test_neural_matrix_builder_takes_layer_sizes():
+    fig = create_neural_probability_matrix(rng=np.random.default_rng(0), layers=(3, 4, 5))
+    assert [len(trace.x) for trace in fig.data[1:]] == [3, 4, 5]
+
+
+def test_neural_connections_join_adjacent_layers_only():
+    data = sd.neural_network_data(np.random.default_rng(3), layers=(1, 4, 6, 2))
+    source, target = data['connections']
+    assert len(source) > 0
+    np.testing.assert_array_equal(data['layer'][target], data['layer'][source] + 1)
+    np.testing.assert_array_equal(data['y'][data['offsets'][0]], 0.0)
+
+
+def test_neural_map_draws_every_connection_in_one_trace():
+    data = sd.neural_network_data(np.random.default_rng(3), layers=(200, 300, 200))
+    fig = FuturisticDashboard().create_neural_network_probability_map(data=data)
+    edges, neurons = fig.data
+    n_connections = data['connections'].shape[1]
+    # Each segment is start, end and a None gap
+    assert len(edges.x) == 3 * n_connections
+    assert len(neurons.x) == 700
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+import cli
+import simulation_data as sd
+from surface_tiles import SurfacePyramid
+
+
+@pytest.mark.parametrize('name', cli.TILED_FIGURES)
+@pytest.mark.parametrize('resolution', [None, 40, 300])
+def test_tiled_data_has_the_requested_resolution(name, resolution):
+    data = cli._tiled_data(name, np.random.default_rng(0), resolution, None, 1)
+    assert data['Z'].shape == (resolution or 100,) * 2
+
+
+def test_resampled_view_matches_the_field_on_an_even_grid():
+    pyramid = SurfacePyramid('dimension_surface', max_resolution=100, cache_dir=None)
+    view = pyramid.view(max_samples=100, samples=100)
+    x = np.linspace(1.0, 11.0, 100)
+    y = np.linspace(0.1, 1.0, 100)
+    np.testing.assert_allclose(view['x'], x, rtol=1e-6)
+    np.testing.assert_allclose(view['y'], y, rtol=1e-6)
+    D, P = np.meshgrid(x, y)
+    np.testing.assert_allclose(view['Z'], sd.dimension_probability_field(D, P), atol=2e-3)
+
+
+@pytest.mark.parametrize('name', cli.TILED_FIGURES)
+def test_adjacent_tiles_share_their_edge_samples(name):
+    pyramid = SurfacePyramid(name, max_resolution=65, tile_size=16, cache_dir=None, seed=5)
+    level = pyramid.max_level
+    for row in range(2 ** level):
+        for col in range(2 ** level - 1):
+            np.testing.assert_array_equal(pyramid.tile(level, row, col)[:, -1],
+                                          pyramid.tile(level, row, col + 1)[:, 0])
+            np.testing.assert_array_equal(pyramid.tile(level, col, row)[-1],
+                                          pyramid.tile(level, col + 1, row)[0])
+
+
+def test_viewport_is_a_slice_of_the_whole_level():
+    pyramid = SurfacePyramid('holographic_dimensions', max_resolution=65, tile_size=16,
+                             cache_dir=None, seed=5)
+    whole = pyramid.view(level=2)
+    part = pyramid.view(x_range=(-1.3, 2.1), y_range=(-3.5, 0.2), level=2)
+    i = np.searchsorted(whole['x'], part['x'][0])
+    j = np.searchsorted(whole['y'], part['y'][0])
+    rows, cols = part['Z'].shape
+    np.testing.assert_array_equal(part['Z'], whole['Z'][j:j + rows, i:i + cols])
+
+
+def test_tiles_are_reloaded_from_the_disk_cache(tmp_path):
+    first = SurfacePyramid('probability_landscape', max_resolution=33, tile_size=16,
+                           cache_dir=tmp_path, seed=2)
+    expected = first.view(level=1)['Z']
+    second = SurfacePyramid('probability_landscape', max_resolution=33, tile_size=16,
+                            cache_dir=tmp_path, seed=2)
+    np.testing.assert_array_equal(second.view(level=1)['Z'], expected)
+    assert second.stats == {'memory': 0, 'disk': 4, 'computed': 0}
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from themes import indexed_marker, palette
+
+
+@pytest.mark.parametrize('n_colors, dtype', [(32, np.uint8), (256, np.uint8), (1000, np.uint16)])
+def test_indices_cover_every_bin_without_wrapping(n_colors, dtype):
+    values = np.linspace(0.0, 1.0, 5000)
+    marker = indexed_marker(values, 'Viridis', n_colors)
+    index = marker['color']
+    assert index.dtype == dtype
+    assert index[0] == 0 and index[-1] == n_colors - 1
+    assert np.all(np.diff(index.astype(int)) >= 0)
+    assert len(marker['colorscale']) == 2 * n_colors
+
+
+def test_nan_takes_the_lowest_bin_and_limits_clip():
+    marker = indexed_marker([np.nan, -5.0, 0.5, 5.0], 'Viridis', 4, cmin=0.0, cmax=1.0)
+    assert marker['color'].tolist() == [0, 0, 2, 3]
+
+
+@pytest.mark.parametrize('n_colors', [0, 65537])
+def test_palette_size_is_validated(n_colors):
+    with pytest.raises(ValueError, match='n_colors'):
+        indexed_marker([0.0, 1.0], 'Viridis', n_colors)
+
+
+def test_palette_samples_bin_centres():
+    colors = palette([[0, 'rgb(0, 0, 0)'], [1, 'rgb(255, 255, 255)']], 2)
+    assert colors == ('rgba(64, 64, 64, 1)', 'rgba(191, 191, 191, 1)')
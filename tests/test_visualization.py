@@ -0,0 +1,29 @@
+import os
+
+from visualization import VISUALIZATION_FIGURES, generate_all_visualizations
+
+PNG_FILES = [filename for _, filename in VISUALIZATION_FIGURES if filename.endswith('.png')]
+
+
+def _render(directory, monkeypatch, **kwargs):
+    os.makedirs(directory)
+    monkeypatch.chdir(directory)
+    return generate_all_visualizations(seed=5, quality='preview', **kwargs)
+
+
+def _read(directory, filename):
+    with open(os.path.join(directory, filename), 'rb') as f:
+        return f.read()
+
+
+def test_process_pool_writes_the_same_figures_as_a_serial_run(tmp_path, monkeypatch):
+    serial = _render(tmp_path / 'serial', monkeypatch, jobs=1)
+    parallel = _render(tmp_path / 'parallel', monkeypatch, jobs=2)
+
+    assert [name for name, _ in parallel] == [name for _, name in VISUALIZATION_FIGURES]
+    assert [name for name, _ in serial] == [name for name, _ in parallel]
+    for filename in PNG_FILES:
+        assert _read(tmp_path / 'parallel', filename) == _read(tmp_path / 'serial', filename)
+    assert all(seconds > 0 for _, seconds in parallel)
+    assert os.path.getsize(tmp_path / 'parallel' / 'interactive_3d_visualization.html') > 0
+
@@ -0,0 +1,251 @@
+"""
+Dashboard Themes
+Swappable plotly themes with cached colour lookup tables
+
+A Theme holds everything the cyberpunk and futuristic builders style with:
+background and text colours (layout()), named colours and colorscales for
+each role a builder draws. Every theme defines the same roles, so any
+builder can be drawn in any theme without copying layout dicts around.
+
+Colorscales are turned into RGBA lookup tables once per process
+(colorscale_lut) and sampled into small palettes (palette). Marker colours
+of big traces are quantised server-side into such a palette and sent as
+small integer indices with a stepped colorscale (indexed_marker); html_export
+stores those as one or two bytes per point.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+# Entries of a colour lookup table
+LUT_SIZE = 256
+
+# Colours in the palette of an indexed marker trace
+DEFAULT_PALETTE_SIZE = 32
+
+# Traces with at least this many markers get indexed colours
+INDEXED_COLOR_MIN_POINTS = 2000
+
+
+def _parse_color(color):
+    """(r, g, b, a) of an 'rgba(...)', 'rgb(...)' or '#rrggbb' colour"""
+    color = color.strip()
+    if color.startswith('#'):
+        return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5)) + (1.0,)
+    parts = [float(p) for p in color[color.index('(') + 1:color.rindex(')')].split(',')]
+    return tuple(parts[:3]) + ((parts[3],) if len(parts) > 3 else (1.0,))
+
+
+def _scale_key(colorscale):
+    """Hashable form of a colorscale: its plotly name or a tuple of stops"""
+    if isinstance(colorscale, str):
+        return colorscale
+    return tuple((float(pos), color) for pos, color in colorscale)
+
+
+@lru_cache(maxsize=None)
+def _lut(scale_key, size):
+    if isinstance(scale_key, str):
+        from plotly.colors import get_colorscale
+        scale_key = _scale_key(get_colorscale(scale_key))
+    positions = np.array([pos for pos, _ in scale_key])
+    stops = np.array([_parse_color(color) for _, color in scale_key])
+    samples = np.linspace(positions[0], positions[-1], size)
+    lut = np.column_stack([np.interp(samples, positions, stops[:, c]) for c in range(4)])
+    lut.flags.writeable = False
+    return lut
+
+
+def colorscale_lut(colorscale, size=LUT_SIZE):
+    """(size, 4) RGBA lookup table of a colorscale, computed once per process
+
+    colorscale is a plotly colorscale name or a list of [position, colour]
+    stops. RGB is in 0-255 and alpha in 0-1, linearly interpolated like
+    plotly.js does. The returned array is read-only and shared.
+    """
+    return _lut(_scale_key(colorscale), size)
+
+
+@lru_cache(maxsize=None)
+def _palette(scale_key, n_colors):
+    lut = _lut(scale_key, LUT_SIZE)
+    centres = np.round((np.arange(n_colors) + 0.5) / n_colors * (LUT_SIZE - 1)).astype(int)
+    return tuple(f'rgba({r:.0f}, {g:.0f}, {b:.0f}, {a:.3g})' for r, g, b, a in lut[centres])
+
+
+def palette(colorscale, n_colors=DEFAULT_PALETTE_SIZE):
+    """n_colors 'rgba(...)' strings sampling colorscale at bin centres (cached)"""
+    return _palette(_scale_key(colorscale), n_colors)
+
+
+def indexed_marker(values, colorscale, n_colors=DEFAULT_PALETTE_SIZE, cmin=None, cmax=None,
+                   colorbar=None):
+    """Marker colour properties drawing values with an n_colors palette
+
+    values are binned into n_colors equal bins between cmin and cmax
+    (default: their range) and sent as palette indices with a stepped
+    colorscale, so the browser maps small integers instead of floats:
+    uint8 up to 256 colours, uint16 up to 65536. The colorbar keeps its
+    ticks in data units. NaN values take the lowest bin.
+    """
+    if not 1 <= n_colors <= 65536:
+        raise ValueError(f"n_colors must be between 1 and 65536, got {n_colors}")
+    values = np.asarray(values, dtype=np.float64)
+    lo = np.nanmin(values) if cmin is None else cmin
+    hi = np.nanmax(values) if cmax is None else cmax
+    span = hi - lo if hi > lo else 1.0
+    scaled = np.nan_to_num((values - lo) * (n_colors / span), nan=0.0)
+    index = np.clip(scaled, 0, n_colors - 1).astype(np.uint8 if n_colors <= 256 else np.uint16)
+
+    colors = palette(colorscale, n_colors)
+    stepped = []
+    for i, color in enumerate(colors):
+        stepped += [[i / n_colors, color], [(i + 1) / n_colors, color]]
+
+    ticks = np.unique(np.linspace(0, n_colors - 1, min(n_colors, 6)).round().astype(int))
+    colorbar = dict(colorbar or {})
+    colorbar.update(tickvals=ticks.tolist(),
+                    ticktext=[f'{lo + (i + 0.5) * span / n_colors:.3g}' for i in ticks])
+    return dict(color=index, colorscale=stepped, cmin=-0.5, cmax=n_colors - 0.5,
+                colorbar=colorbar)
+
+
+class Theme:
+    """Colours, colorscales and layout styling shared by a family of figures
+
+    text maps text roles ('primary', 'secondary', ...) to font colours;
+    colors and colorscales map drawing roles to plotly colours and
+    colorscales.
+    """
+
+    def __init__(self, name, plot_bgcolor, paper_bgcolor, text, colors, colorscales,
+                 font_family=None, scene_bgcolor=None):
+        self.name = name
+        self.plot_bgcolor = plot_bgcolor
+        self.paper_bgcolor = paper_bgcolor
+        self.text = text
+        self.colors = colors
+        self.colorscales = colorscales
+        self.font_family = font_family
+        self.scene_bgcolor = scene_bgcolor
+
+    def font(self, role='primary'):
+        font = dict(color=self.text[role])
+        if self.font_family:
+            font['family'] = self.font_family
+        return font
+
+    def layout(self, text='primary'):
+        """Background and font properties for fig.update_layout"""
+        return dict(plot_bgcolor=self.plot_bgcolor, paper_bgcolor=self.paper_bgcolor,
+                    font=self.font(text))
+
+    def indexes(self, n_points):
+        """True if traces of n_points markers get indexed colours"""
+        return n_points >= INDEXED_COLOR_MIN_POINTS
+
+    def marker_colors(self, role, values, colorbar=None, n_colors=DEFAULT_PALETTE_SIZE):
+        """Marker colour properties for values drawn with the role's colorscale
+
+        Big traces (see indexes) get quantised indexed colours; smaller ones
+        send values as they are.
+        """
+        colorscale = self.colorscales[role]
+        if self.indexes(len(values)):
+            return indexed_marker(values, colorscale, n_colors, colorbar=colorbar)
+        marker = dict(color=values, colorscale=colorscale)
+        if colorbar is not None:
+            marker['colorbar'] = colorbar
+        return marker
+
+
+CYBERPUNK = Theme(
+    'cyberpunk',
+    plot_bgcolor='rgba(0,0,0,0.95)',
+    paper_bgcolor='rgba(0,0,0,0.95)',
+    scene_bgcolor='rgba(0,0,0,0.95)',
+    font_family='Courier New',
+    text={
+        'primary': 'rgba(0, 255, 255, 1)',
+        'secondary': 'rgba(0, 200, 255, 1)',
+        'tertiary': 'rgba(100, 200, 255, 1)',
+    },
+    colors={
+        'edges': 'rgba(0, 255, 255, 0.2)',
+        'particles': 'rgba(255, 255, 255, 0.7)',
+        'probability': 'cyan',
+        'stability': 'magenta',
+        'coherence': 'yellow',
+        'signature': 'lime',
+        'deviation': 'red',
+    },
+    colorscales={
+        'neural': [
+            [0, 'rgba(0, 0, 0, 0.8)'],
+            [0.2, 'rgba(0, 255, 255, 0.8)'],
+            [0.5, 'rgba(128, 0, 128, 0.8)'],
+            [0.8, 'rgba(255, 0, 255, 0.9)'],
+            [1, 'rgba(255, 255, 0, 1)']
+        ],
+        'holographic': [
+            [0, 'rgba(0, 0, 50, 0.8)'],
+            [0.2, 'rgba(0, 100, 200, 0.8)'],
+            [0.4, 'rgba(0, 200, 255, 0.9)'],
+            [0.6, 'rgba(100, 255, 200, 0.9)'],
+            [0.8, 'rgba(200, 255, 100, 0.9)'],
+            [1, 'rgba(255, 200, 0, 1)']
+        ],
+        'quantum': [
+            [0, 'rgba(0, 0, 100, 0.1)'],
+            [0.5, 'rgba(100, 0, 200, 0.5)'],
+            [1, 'rgba(200, 0, 255, 0.9)']
+        ],
+        'paths': 'Plasma',
+        'activation': 'Viridis',
+        'superposition': 'Plasma',
+        'correlation': 'Viridis',
+        'entropy': 'Plasma',
+        'surface': 'RdBu',
+        'landscape': 'Jet',
+    },
+)
+
+FUTURISTIC = Theme(
+    'futuristic',
+    plot_bgcolor='rgba(0,0,0,0.8)',
+    paper_bgcolor='rgba(0,0,0,0.9)',
+    text={'primary': 'white', 'secondary': 'white', 'tertiary': 'white'},
+    colors={
+        'edges': 'rgba(100, 100, 255, 0.2)',
+        'particles': 'rgba(255, 255, 255, 0.7)',
+        'probability': 'cyan',
+        'stability': 'magenta',
+        'coherence': 'yellow',
+        'signature': 'lime',
+        'deviation': 'red',
+    },
+    colorscales={
+        'neural': 'Viridis',
+        'holographic': 'Plasma',
+        'quantum': 'Purples',
+        'paths': 'Plasma',
+        'activation': 'Viridis',
+        'superposition': 'Plasma',
+        'correlation': 'Viridis',
+        'entropy': 'Plasma',
+        'surface': 'RdBu',
+        'landscape': 'Jet',
+    },
+)
+
+THEMES = {theme.name: theme for theme in (CYBERPUNK, FUTURISTIC)}
+
+
+def get_theme(theme):
+    """A Theme, looked up by name if given as a string"""
+    if isinstance(theme, Theme):
+        return theme
+    if theme not in THEMES:
+        raise ValueError(f"Unknown theme '{theme}', expected one of {tuple(THEMES)}")
+    return THEMES[theme]
@@ -2,235 +2,240 @@
 Advanced Visualization Module for Simulation Hypothesis Research
 Professional ML Visualizations using Python
 """
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from matplotlib.patches import Circle, Rectangle, Polygon
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+import simulation_data as sd
+from html_export import restore_assets, write_html
+from plot_style import new_figure, style_rc, styled
+from point_lod import DEFAULT_POINT_BUDGET, density_volume, reduce_points
+from raster_export import output_paths, quality_profile, save_figure
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set professional styling
-plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("husl")
+# Matplotlib, seaborn and plotly are imported by the builders that need them.
+# Matplotlib figures are built with the Figure API (no pyplot state) inside a
+# scoped style, so builders may run concurrently from several threads.
+MATPLOTLIB_STYLE = 'seaborn-v0_8-darkgrid'
 
 class SimulationVisualizer:
-    def __init__(self):
-        self.setup_fonts()
+    def __init__(self, quality=None):
+        self._rc = None
+        self.quality = quality_profile(quality)
     
-    def setup_fonts(self):
-        """Setup professional font configurations"""
-        plt.rcParams.update({
-            'font.size': 12,
-            'axes.titlesize': 16,
-            'axes.labelsize': 14,
-            'xtick.labelsize': 11,
-            'ytick.labelsize': 11,
-            'legend.fontsize': 12,
-            'figure.titlesize': 18
-        })
+    @property
+    def rc(self):
+        """Professional styling (seaborn darkgrid, husl colours, fonts) as rcParams"""
+        if self._rc is None:
+            self._rc = style_rc(MATPLOTLIB_STYLE)
+        return self._rc
     
-    def create_dimension_probability_surface(self):
+    def style(self):
+        """Context that applies the professional styling to figures built in it"""
+        return styled(self.rc)
+    
+    def create_dimension_probability_surface(self, data=None, rng=None):
         """Create professional 3D surface plot of dimension vs probability"""
-        fig = plt.figure(figsize=(14, 10))
-        
-        # Create meshgrid for dimensions and parameters
-        dimensions = np.linspace(1, 11, 100)
-        parameters = np.linspace(0.1, 1.0, 100)
-        D, P = np.meshgrid(dimensions, parameters)
-        
-        # Create sophisticated probability function
-        Z = (0.1 + 
-             0.3 * np.sin(D * 0.5) * np.cos(P * 3) + 
-             0.2 * np.exp(-((D - 4)**2) / 8) +
-             0.15 * np.power(P, 2) * np.sin(D * 0.8))
-        
-        # Create 3D plot
-        ax = fig.add_subplot(111, projection='3d')
-        surface = ax.plot_surface(D, P, Z, 
-                                cmap='plasma',
-                                alpha=0.8,
-                                linewidth=0,
-                                antialiased=True,
-                                edgecolors='none')
-        
-        ax.set_xlabel('Dimensions', fontsize=14, fontweight='bold')
-        ax.set_ylabel('Complexity Parameter', fontsize=14, fontweight='bold')
-        ax.set_zlabel('Simulation Probability', fontsize=14, fontweight='bold')
-        ax.set_title('Advanced Dimension vs Simulation Probability Surface\n'
-                    'Analyzing Higher-Dimensional Physics Signatures', 
-                    fontsize=16, fontweight='bold', pad=20)
-        
-        # Add color bar
-        fig.colorbar(surface, ax=ax, shrink=0.5, aspect=20)
-        
-        # Set viewing angle for professional presentation
-        ax.view_init(elev=20, azim=45)
-        
-        plt.tight_layout()
+        if data is None:
+            data = sd.dimension_probability_surface_data()
+        D, P, Z = data['D'], data['P'], data['Z']
+        
+        with self.style():
+            fig = new_figure(figsize=(14, 10))
+        
+            # Create 3D plot
+            ax = fig.add_subplot(111, projection='3d')
+            surface = ax.plot_surface(D, P, Z, 
+                                    cmap='plasma',
+                                    alpha=0.8,
+                                    linewidth=0,
+                                    rcount=self.quality['surface_count'],
+                                    ccount=self.quality['surface_count'],
+                                    antialiased=self.quality['antialiased'],
+                                    edgecolors='none')
+        
+            ax.set_xlabel('Dimensions', fontsize=14, fontweight='bold')
+            ax.set_ylabel('Complexity Parameter', fontsize=14, fontweight='bold')
+            ax.set_zlabel('Simulation Probability', fontsize=14, fontweight='bold')
+            ax.set_title('Advanced Dimension vs Simulation Probability Surface\n'
+                        'Analyzing Higher-Dimensional Physics Signatures', 
+                        fontsize=16, fontweight='bold', pad=20)
+        
+            # Add color bar
+            fig.colorbar(surface, ax=ax, shrink=0.5, aspect=20)
+        
+            # Set viewing angle for professional presentation
+            ax.view_init(elev=20, azim=45)
+        
+            fig.tight_layout()
         return fig
     
-    def create_particle_physics_visualization(self):
+    def create_particle_physics_visualization(self, data=None, rng=None):
         """Create professional particle physics visualization"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
-        
-        # Generate sophisticated particle simulation data
-        np.random.seed(42)
-        n_particles = 1000
-        
-        # Plot 1: 3D particle distribution
-        x = np.random.normal(0, 1, n_particles)
-        y = np.random.normal(0, 1, n_particles)
-        z = np.random.normal(0, 1, n_particles)
-        colors = np.sqrt(x**2 + y**2 + z**2)
-        
-        ax1.scatter(x, y, c=colors, cmap='viridis', alpha=0.6, s=20)
-        ax1.set_title('3D Particle Distribution\nHigher-Dimensional Space Projection', 
-                     fontweight='bold')
-        ax1.set_xlabel('X Coordinate')
-        ax1.set_ylabel('Y Coordinate')
-        
-        # Plot 2: Energy distribution histogram
-        energies = np.random.exponential(2, n_particles)
-        ax2.hist(energies, bins=50, color='skyblue', alpha=0.7, edgecolor='black')
-        ax2.set_title('Energy Distribution\nQuantum Field Simulation', fontweight='bold')
-        ax2.set_xlabel('Energy Level')
-        ax2.set_ylabel('Frequency')
-        
-        # Plot 3: Correlation heatmap
-        correlation_data = np.random.rand(5, 5)
-        mask = np.triu(np.ones_like(correlation_data, dtype=bool))
-        sns.heatmap(correlation_data, mask=mask, annot=True, cmap='coolwarm', 
-                   center=0, ax=ax3, cbar_kws={'shrink': 0.8})
-        ax3.set_title('Parameter Correlation Matrix\nPhysics Constants Interactions', 
-                     fontweight='bold')
-        
-        # Plot 4: Probability density function
-        x_pdf = np.linspace(-3, 3, 1000)
-        y_pdf = 0.3 * np.exp(-0.5 * (x_pdf - 1)**2) + 0.2 * np.exp(-0.5 * (x_pdf + 1)**2)
-        ax4.plot(x_pdf, y_pdf, 'r-', linewidth=3, label='Probability Density')
-        ax4.fill_between(x_pdf, y_pdf, alpha=0.3, color='red')
-        ax4.set_title('Probability Density Function\nSimulation Artifact Detection', 
-                     fontweight='bold')
-        ax4.set_xlabel('Parameter Value')
-        ax4.set_ylabel('Density')
-        ax4.legend()
-        
-        plt.suptitle('Advanced Particle Physics Visualization Suite\n'
-                    'Multi-Dimensional Simulation Analysis', 
-                    fontsize=20, fontweight='bold', y=1.02)
-        plt.tight_layout()
+        if data is None:
+            data = sd.particle_physics_data(sd.make_rng(rng, seed=42))
+        
+        with self.style():
+            import seaborn as sns
+            fig = new_figure(figsize=(16, 12))
+            ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
+        
+            # Plot 1: 3D particle distribution
+            ax1.scatter(data['x'], data['y'], c=data['colors'], cmap='viridis', alpha=0.6, s=20)
+            ax1.set_title('3D Particle Distribution\nHigher-Dimensional Space Projection', 
+                         fontweight='bold')
+            ax1.set_xlabel('X Coordinate')
+            ax1.set_ylabel('Y Coordinate')
+        
+            # Plot 2: Energy distribution histogram
+            ax2.hist(data['energies'], bins=50, color='skyblue', alpha=0.7, edgecolor='black')
+            ax2.set_title('Energy Distribution\nQuantum Field Simulation', fontweight='bold')
+            ax2.set_xlabel('Energy Level')
+            ax2.set_ylabel('Frequency')
+        
+            # Plot 3: Correlation heatmap
+            correlation_data = data['correlation']
+            mask = np.triu(np.ones_like(correlation_data, dtype=bool))
+            labels = data.get('params', 'auto')
+            sns.heatmap(correlation_data, mask=mask, annot=True, cmap='coolwarm', 
+                       center=0, ax=ax3, cbar_kws={'shrink': 0.8},
+                       xticklabels=labels, yticklabels=labels)
+            ax3.set_title('Parameter Correlation Matrix\nPhysics Constants Interactions', 
+                         fontweight='bold')
+        
+            # Plot 4: Probability density function
+            x_pdf, y_pdf = data['x_pdf'], data['y_pdf']
+            ax4.plot(x_pdf, y_pdf, 'r-', linewidth=3, label='Probability Density')
+            ax4.fill_between(x_pdf, y_pdf, alpha=0.3, color='red')
+            ax4.set_title('Probability Density Function\nSimulation Artifact Detection', 
+                         fontweight='bold')
+            ax4.set_xlabel('Parameter Value')
+            ax4.set_ylabel('Density')
+            ax4.legend()
+        
+            fig.suptitle('Advanced Particle Physics Visualization Suite\n'
+                        'Multi-Dimensional Simulation Analysis', 
+                        fontsize=20, fontweight='bold', y=1.02)
+            fig.tight_layout()
         return fig
     
-    def create_probability_trend_analysis(self):
+    def create_probability_trend_analysis(self, data=None, rng=None):
         """Create professional probability trend analysis"""
-        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-        
-        # Generate sophisticated time series data
-        time = np.linspace(0, 100, 1000)
-        
-        # Plot 1: Main probability trend with confidence intervals
-        base_prob = 0.4 + 0.1 * np.sin(0.1 * time) + 0.05 * np.cos(0.05 * time)
-        noise = np.random.normal(0, 0.02, len(time))
-        prob_with_noise = base_prob + noise
-        prob_upper = base_prob + 0.05
-        prob_lower = base_prob - 0.05
-        
-        axes[0,0].plot(time, prob_with_noise, 'b-', linewidth=2, label='Actual Probability')
-        axes[0,0].fill_between(time, prob_lower, prob_upper, alpha=0.3, color='blue', label='Confidence Interval')
-        axes[0,0].plot(time, base_prob, 'r--', linewidth=2, label='Expected Trend')
-        axes[0,0].set_title('Real-Time Simulation Probability Trend\nWith Confidence Intervals', 
-                           fontweight='bold')
-        axes[0,0].set_xlabel('Time Steps')
-        axes[0,0].set_ylabel('Simulation Probability')
-        axes[0,0].legend()
-        axes[0,0].grid(True, alpha=0.3)
-        
-        # Plot 2: Distribution of probabilities
-        prob_samples = np.random.beta(2, 5, 1000) * 0.8 + 0.1
-        axes[0,1].hist(prob_samples, bins=50, density=True, alpha=0.7, color='orange', edgecolor='black')
-        axes[0,1].set_title('Probability Distribution\nMonte Carlo Simulation Results', 
-                           fontweight='bold')
-        axes[0,1].set_xlabel('Simulation Probability')
-        axes[0,1].set_ylabel('Density')
-        axes[0,1].grid(True, alpha=0.3)
-        
-        # Plot 3: Dimension vs probability scatter with regression
-        dimensions = np.random.uniform(1, 11, 500)
-        prob_dim = 0.3 + 0.05 * dimensions + 0.02 * dimensions**1.5 + np.random.normal(0, 0.05, 500)
-        axes[1,0].scatter(dimensions, prob_dim, alpha=0.6, s=30)
-        
-        # Add regression line
-        z = np.polyfit(dimensions, prob_dim, 2)
-        p = np.poly1d(z)
-        x_reg = np.linspace(1, 11, 100)
-        axes[1,0].plot(x_reg, p(x_reg), 'r-', linewidth=2, label='Trend Line')
-        axes[1,0].set_title('Dimension vs Simulation Probability\nPolynomial Regression Analysis', 
-                           fontweight='bold')
-        axes[1,0].set_xlabel('Number of Dimensions')
-        axes[1,0].set_ylabel('Simulation Probability')
-        axes[1,0].legend()
-        axes[1,0].grid(True, alpha=0.3)
-        
-        # Plot 4: Heatmap of parameter sensitivity
-        param1 = np.linspace(0.1, 1.0, 20)
-        param2 = np.linspace(0.1, 1.0, 20)
-        Z_sensitivity = np.zeros((20, 20))
-        for i, p1 in enumerate(param1):
-            for j, p2 in enumerate(param2):
-                Z_sensitivity[j, i] = 0.2 + 0.3 * p1 + 0.2 * p2 + 0.3 * p1 * p2
-        
-        im = axes[1,1].imshow(Z_sensitivity, extent=[0.1, 1.0, 0.1, 1.0], 
-                             aspect='auto', cmap='RdYlBu_r', origin='lower')
-        axes[1,1].set_title('Parameter Sensitivity Heatmap\nMulti-Dimensional Parameter Impact', 
-                           fontweight='bold')
-        axes[1,1].set_xlabel('Parameter 1')
-        axes[1,1].set_ylabel('Parameter 2')
-        plt.colorbar(im, ax=axes[1,1])
-        
-        plt.suptitle('Professional Probability Analysis Dashboard\nAdvanced ML Simulation Metrics', 
-                    fontsize=20, fontweight='bold', y=1.02)
-        plt.tight_layout()
+        if data is None:
+            data = sd.probability_trend_data(sd.make_rng(rng))
+        time = data['time']
+        
+        with self.style():
+            fig = new_figure(figsize=(16, 12))
+            axes = fig.subplots(2, 2)
+        
+            # Plot 1: Main probability trend with confidence intervals
+            axes[0,0].plot(time, data['prob_with_noise'], 'b-', linewidth=2, label='Actual Probability')
+            axes[0,0].fill_between(time, data['prob_lower'], data['prob_upper'], alpha=0.3, color='blue',
+                                   label=f"{data['monte_carlo']['confidence']:.0%} Monte Carlo Band")
+            axes[0,0].plot(time, data['base_prob'], 'r--', linewidth=2, label='Expected Trend')
+            axes[0,0].set_title('Real-Time Simulation Probability Trend\nWith Confidence Intervals', 
+                               fontweight='bold')
+            axes[0,0].set_xlabel('Time Steps')
+            axes[0,0].set_ylabel('Simulation Probability')
+            axes[0,0].legend()
+            axes[0,0].grid(True, alpha=0.3)
+        
+            # Plot 2: Distribution of probabilities
+            density, edges = data['prob_hist']
+            axes[0,1].hist(edges[:-1], bins=edges, weights=density, alpha=0.7, color='orange', edgecolor='black')
+            axes[0,1].set_title('Probability Distribution\nMonte Carlo Simulation Results', 
+                               fontweight='bold')
+            axes[0,1].text(0.97, 0.95, f"n = {data['monte_carlo']['prior_samples']:,}",
+                           transform=axes[0,1].transAxes, ha='right', va='top')
+            axes[0,1].set_xlabel('Simulation Probability')
+            axes[0,1].set_ylabel('Density')
+            axes[0,1].grid(True, alpha=0.3)
+        
+            # Plot 3: Dimension vs probability scatter with regression
+            axes[1,0].scatter(data['dimensions'], data['prob_dim'], alpha=0.6, s=30)
+        
+            # Add regression line
+            axes[1,0].plot(data['x_reg'], data['trend'], 'r-', linewidth=2, label='Trend Line')
+            axes[1,0].set_title('Dimension vs Simulation Probability\nPolynomial Regression Analysis', 
+                               fontweight='bold')
+            axes[1,0].set_xlabel('Number of Dimensions')
+            axes[1,0].set_ylabel('Simulation Probability')
+            axes[1,0].legend()
+            axes[1,0].grid(True, alpha=0.3)
+        
+            # Plot 4: Heatmap of parameter sensitivity
+            extent = [data['param1'][0], data['param1'][-1], data['param2'][0], data['param2'][-1]]
+            im = axes[1,1].imshow(data['Z_sensitivity'], extent=extent, 
+                                 aspect='auto', cmap='RdYlBu_r', origin='lower')
+            axes[1,1].set_title('Parameter Sensitivity Heatmap\nMulti-Dimensional Parameter Impact', 
+                               fontweight='bold')
+            axes[1,1].set_xlabel('Parameter 1')
+            axes[1,1].set_ylabel('Parameter 2')
+            fig.colorbar(im, ax=axes[1,1])
+        
+            fig.suptitle('Professional Probability Analysis Dashboard\nAdvanced ML Simulation Metrics', 
+                        fontsize=20, fontweight='bold', y=1.02)
+            fig.tight_layout()
         return fig
     
-    def create_interactive_3d_plotly(self):
-        """Create advanced interactive 3D visualization with Plotly"""
-        # Generate sophisticated 3D data
-        np.random.seed(42)
-        n_points = 2000
-        
-        # Create complex 3D structure
-        theta = np.random.uniform(0, 2*np.pi, n_points)
-        phi = np.random.uniform(0, np.pi, n_points)
-        r = 2 + 0.5 * np.random.randn(n_points)
-        
-        x = r * np.sin(phi) * np.cos(theta)
-        y = r * np.sin(phi) * np.sin(theta)  
-        z = r * np.cos(phi)
-        
-        # Color based on distance from center
-        colors = np.sqrt(x**2 + y**2 + z**2)
-        
-        fig = go.Figure(data=[go.Scatter3d(
-            x=x, y=y, z=z,
-            mode='markers',
-            marker=dict(
-                size=5,
-                color=colors,
+    def create_interactive_3d_plotly(self, data=None, rng=None, budget=DEFAULT_POINT_BUDGET,
+                                     lod='voxel', volume=False):
+        """Create advanced interactive 3D visualization with Plotly
+
+        Clouds of more than budget points are thinned with point_lod (lod:
+        'voxel' centroids or a 'random' sample); volume=True renders the
+        point density as a volume instead. Either way the page size and
+        frame rate stay bounded for any number of input points.
+        """
+        if data is None:
+            data = sd.interactive_3d_data(sd.make_rng(rng, seed=42))
+        
+        import plotly.graph_objects as go
+        
+        if volume:
+            # Density volume on a fixed grid instead of individual markers
+            grid = density_volume(data)
+            trace = go.Volume(
+                x=grid['x'], y=grid['y'], z=grid['z'],
+                value=grid['density'],
                 colorscale='Viridis',
-                opacity=0.8,
-                colorbar=dict(title="Distance from Origin")
-            ),
-            text=[f'X: {x[i]:.2f}<br>Y: {y[i]:.2f}<br>Z: {z[i]:.2f}' for i in range(len(x))],
-            hovertemplate='<b>Point Details</b><br>' +
-                         'X: %{x:.2f}<br>' +
-                         'Y: %{y:.2f}<br>' +
-                         'Z: %{z:.2f}<br>' +
-                         '<extra></extra>'
-        )])
+                opacity=0.1,
+                surface_count=15,
+                colorbar=dict(title="Point Density"),
+                hovertemplate='<b>Point Density</b><br>' +
+                             'X: %{x:.2f}<br>' +
+                             'Y: %{y:.2f}<br>' +
+                             'Z: %{z:.2f}<br>' +
+                             'Density: %{value:.3g}<br>' +
+                             '<extra></extra>'
+            )
+        else:
+            data = reduce_points(data, budget, lod)
+            x, y, z, colors = data['x'], data['y'], data['z'], data['colors']
+            # Voxel centroids also show how many points they stand for
+            counts = data.get('counts')
+            trace = go.Scatter3d(
+                x=x, y=y, z=z,
+                mode='markers',
+                marker=dict(
+                    size=5,
+                    color=colors,
+                    colorscale='Viridis',
+                    opacity=0.8,
+                    colorbar=dict(title="Distance from Origin")
+                ),
+                customdata=counts,
+                hovertemplate='<b>Point Details</b><br>' +
+                             'X: %{x:.2f}<br>' +
+                             'Y: %{y:.2f}<br>' +
+                             'Z: %{z:.2f}<br>' +
+                             ('Points: %{customdata}<br>' if counts is not None else '') +
+                             '<extra></extra>'
+            )
+        
+        fig = go.Figure(data=[trace])
         
         fig.update_layout(
             title=dict(
@@ -250,79 +255,136 @@ class SimulationVisualizer:
         
         return fig
     
-    def create_advanced_correlation_matrix(self):
+    def create_advanced_correlation_matrix(self, data=None, rng=None):
         """Create professional correlation matrix with advanced styling"""
-        # Create sophisticated correlation data representing physics parameters
+        # Correlation data representing physics parameters
         columns = ['Dimension_Count', 'Complexity', 'Quantization', 
                   'Symmetry', 'Probability', 'Entropy', 'Information', 'Energy']
         
-        # Generate realistic correlation matrix
-        corr_data = np.random.rand(8, 8) * 0.5
-        np.fill_diagonal(corr_data, 1.0)
-        
-        # Apply some realistic correlations
-        corr_data[0, 4] = corr_data[4, 0] = 0.6  # Dimension-Probability correlation
-        corr_data[2, 4] = corr_data[4, 2] = 0.7  # Quantization-Probability correlation
-        corr_data[3, 4] = corr_data[4, 3] = 0.5  # Symmetry-Probability correlation
-        corr_data[6, 4] = corr_data[4, 6] = 0.8  # Information-Probability correlation
-        
-        fig, ax = plt.subplots(figsize=(12, 10))
-        
-        # Create advanced heatmap with annotations
-        mask = np.triu(np.ones_like(corr_data, dtype=bool), k=1)
-        sns.heatmap(corr_data, 
-                   xticklabels=columns,
-                   yticklabels=columns,
-                   mask=mask,
-                   annot=True,
-                   fmt='.2f',
-                   cmap='RdBu_r',
-                   center=0,
-                   square=True,
-                   ax=ax,
-                   cbar_kws={"shrink": .8, "label": "Correlation Coefficient"})
-        
-        ax.set_title('Advanced Physics Parameters Correlation Matrix\n'
-                    'Multi-Dimensional Simulation Analysis', 
-                    fontsize=18, fontweight='bold', pad=20)
-        
-        plt.tight_layout()
+        if data is None:
+            data = sd.correlation_matrix_data(sd.make_rng(rng), n_columns=len(columns))
+        corr_data = data['correlation']
+        columns = data.get('columns', columns)
+        
+        with self.style():
+            import seaborn as sns
+            fig = new_figure(figsize=(12, 10))
+            ax = fig.subplots()
+        
+            # Create advanced heatmap with annotations
+            mask = np.triu(np.ones_like(corr_data, dtype=bool), k=1)
+            sns.heatmap(corr_data, 
+                       xticklabels=columns,
+                       yticklabels=columns,
+                       mask=mask,
+                       annot=True,
+                       fmt='.2f',
+                       cmap='RdBu_r',
+                       center=0,
+                       square=True,
+                       ax=ax,
+                       cbar_kws={"shrink": .8, "label": "Correlation Coefficient"})
+        
+            ax.set_title('Advanced Physics Parameters Correlation Matrix\n'
+                        'Multi-Dimensional Simulation Analysis', 
+                        fontsize=18, fontweight='bold', pad=20)
+        
+            fig.tight_layout()
         return fig
 
-def generate_all_visualizations():
-    """Generate all professional visualizations"""
-    visualizer = SimulationVisualizer()
+# Figures produced by generate_all_visualizations, in output order
+VISUALIZATION_FIGURES = [
+    ('create_dimension_probability_surface', 'dimension_probability_surface.png'),
+    ('create_particle_physics_visualization', 'particle_physics_visualization.png'),
+    ('create_probability_trend_analysis', 'probability_trend_analysis.png'),
+    ('create_advanced_correlation_matrix', 'advanced_correlation_matrix.png'),
+    ('create_interactive_3d_plotly', 'interactive_3d_visualization.html'),
+]
+
+def _init_render_worker():
+    """Switch a pool worker to the non-interactive Agg backend"""
+    import matplotlib
+    matplotlib.use('Agg')
+
+def _figure_paths(filename, formats):
+    """Files written for one VISUALIZATION_FIGURES entry"""
+    return [filename] if filename.endswith('.html') else output_paths(filename, formats)
+
+def _render_figure(method_name, filename, seed, compact_html=False, quality=None,
+                   formats=('png',)):
+    """Build one figure, save it and return (filename, elapsed seconds)"""
+    start = time.perf_counter()
+    
+    # Seed per figure so serial and parallel runs produce identical output
+    visualizer = SimulationVisualizer(quality)
+    fig = getattr(visualizer, method_name)(rng=np.random.default_rng(seed))
     
+    if filename.endswith('.html'):
+        write_html(fig, filename, compact=compact_html)
+    else:
+        save_figure(fig, os.path.splitext(filename)[0], formats, visualizer.quality)
+    
+    return filename, time.perf_counter() - start
+
+def generate_all_visualizations(jobs=1, seed=42, cache=None, compact_html=False,
+                                quality='print', formats=('png',)):
+    """Generate all professional visualizations
+    
+    jobs > 1 renders the figures concurrently in a process pool; jobs=None
+    uses one worker per CPU. If a RenderCache is given, unchanged figures are
+    copied from it instead of being re-rendered. compact_html writes HTML
+    against a shared plotly.min.js with compactly encoded arrays. quality is
+    a raster_export.QUALITY_PROFILES name and formats lists the static
+    formats written from each figure's single draw. Returns a list of
+    (filename, seconds) tuples in VISUALIZATION_FIGURES order.
+    """
     print("Generating Professional ML Visualizations...")
     
-    # Create each visualization
-    fig1 = visualizer.create_dimension_probability_surface()
-    fig1.savefig('dimension_probability_surface.png', dpi=300, bbox_inches='tight')
-    plt.close(fig1)
+    if jobs is None:
+        jobs = os.cpu_count() or 1
     
-    fig2 = visualizer.create_particle_physics_visualization()
-    fig2.savefig('particle_physics_visualization.png', dpi=300, bbox_inches='tight')
-    plt.close(fig2)
+    tasks = []
+    keys = {}
+    for i, (method_name, filename) in enumerate(VISUALIZATION_FIGURES):
+        if cache is not None:
+            key = cache.key(getattr(SimulationVisualizer, method_name),
+                            seed=seed + i, quality=quality_profile(quality),
+                            formats=[os.path.splitext(p)[1] for p in _figure_paths(filename, formats)],
+                            compact=compact_html)
+            if cache.fetch(key, *_figure_paths(filename, formats)):
+                if compact_html:
+                    restore_assets(filename)
+                continue
+            keys[filename] = key
+        tasks.append((method_name, filename, seed + i, compact_html, quality, tuple(formats)))
     
-    fig3 = visualizer.create_probability_trend_analysis()
-    fig3.savefig('probability_trend_analysis.png', dpi=300, bbox_inches='tight')
-    plt.close(fig3)
+    jobs = max(1, min(jobs, len(tasks)))
     
-    fig4 = visualizer.create_advanced_correlation_matrix()
-    fig4.savefig('advanced_correlation_matrix.png', dpi=300, bbox_inches='tight')
-    plt.close(fig4)
+    start = time.perf_counter()
+    if jobs == 1:
+        rendered = [_render_figure(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_render_worker) as pool:
+            rendered = list(pool.map(_render_figure, *zip(*tasks)))
+    total = time.perf_counter() - start
     
-    # Create interactive Plotly visualization
-    fig5 = visualizer.create_interactive_3d_plotly()
-    fig5.write_html('interactive_3d_visualization.html')
+    if cache is not None:
+        for filename, _ in rendered:
+            cache.store(keys[filename], *_figure_paths(filename, formats))
+    
+    elapsed_by_file = dict(rendered)
+    timings = [(filename, elapsed_by_file.get(filename, 0.0))
+               for _, filename in VISUALIZATION_FIGURES]
     
     print("All visualizations generated successfully!")
-    print("Files created:")
-    print("- dimension_probability_surface.png")
-    print("- particle_physics_visualization.png")
-    print("- probability_trend_analysis.png")
-    print("- advanced_correlation_matrix.png")
-    print("- interactive_3d_visualization.html")
+    print(f"Files created ({jobs} worker{'s' if jobs > 1 else ''}, {total:.2f}s total):")
+    for filename, elapsed in timings:
+        note = f"{elapsed:.2f}s" if filename in elapsed_by_file else "cached"
+        print(f"- {', '.join(_figure_paths(filename, formats))} ({note})")
+    if cache is not None:
+        cache.report()
+    
+    return timings
 
 if __name__ == "__main__":
     generate_all_visualizations()
\ No newline at end of file